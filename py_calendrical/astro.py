@@ -1,10 +1,11 @@
 from __future__ import division
 from operator import mod
-from mpmath import mpf, pi
+from py_calendrical.numeric_backend import mpf, pi
 from py_calendrical.triganometry import sin_degrees, cos_degrees, tan_degrees, arctan_degrees, arcsin_degrees, secs, angle
 from py_calendrical.py_cal_cal import ifloor, poly, signum
 from py_calendrical.time_arithmatic import Clock
-from py_calendrical.calendars.gregorian import GregorianDate, JulianMonth
+from py_calendrical.calendars.gregorian import GregorianDate
+from py_calendrical.month_of_year import MonthOfYear
 
 class Astro(object):
 
@@ -27,7 +28,7 @@ class Astro(object):
         moment, tee.  Adapted from "Astronomical Algorithms"
         by Jean Meeus, Willmann_Bell, Inc., 1991."""
         year = GregorianDate.to_year(ifloor(tee))
-        c = GregorianDate.date_difference(GregorianDate(1900, JulianMonth.January, 1), GregorianDate(year, JulianMonth.July, 1)) / mpf(36525)
+        c = GregorianDate.date_difference(GregorianDate(1900, MonthOfYear.January, 1), GregorianDate(year, MonthOfYear.July, 1)) / mpf(36525)
         if 1988 <= year <= 2019:
             return 1/86400 * (year - 1933)
         elif 1900 <= year <= 1987:
@@ -39,7 +40,7 @@ class Astro(object):
         elif 1620 <= year <= 1699:
             return 1/86400 * poly(year - 1600, [mpf(196.58333), mpf(-4.0675), mpf(0.0219167)])
         else:
-            x = Clock.days_from_hours(mpf(12)) + GregorianDate.date_difference(GregorianDate(1810, JulianMonth.January, 1), GregorianDate(year, JulianMonth.January, 1))
+            x = Clock.days_from_hours(mpf(12)) + GregorianDate.date_difference(GregorianDate(1810, MonthOfYear.January, 1), GregorianDate(year, MonthOfYear.January, 1))
             return 1/86400 * (((x * x) / mpf(41048480)) - 15)
 
     @classmethod
@@ -55,7 +56,7 @@ class Astro(object):
     @classmethod
     def julian_centuries(cls, tee):
         """Return Julian centuries since 2000 at moment tee."""
-        return (cls.dynamical_from_universal(tee) - cls.J2000) / mpf(36525)
+        return (cls.dynamical_from_universal(tee) - mpf(cls.J2000)) / mpf(36525)
 
     @classmethod
     def obliquity(cls, tee):
@@ -78,7 +79,7 @@ class Astro(object):
         eccentricity = poly(c, [mpf(0.016708617), mpf(-0.000042037), mpf(-0.0000001236)])
         varepsilon = cls.obliquity(tee)
         y = pow(tan_degrees(varepsilon / 2), 2)
-        equation = ((1/2 / pi) *
+        equation = ((1/2 / pi()) *
                     (y * sin_degrees(2 * lamb) +
                      -2 * eccentricity * sin_degrees(anomaly) +
                      (4 * eccentricity * y * sin_degrees(anomaly) *
@@ -126,7 +127,7 @@ class Astro(object):
         """Return the mean sidereal time of day from moment tee expressed
         as hour angle.  Adapted from "Astronomical Algorithms"
         by Jean Meeus, Willmann_Bell, Inc., 1991."""
-        c = (tee - cls.J2000) / mpf(36525)
+        c = (tee - mpf(cls.J2000)) / mpf(36525)
         return mod(poly(c, [mpf(280.46061837), mpf(36525) * mpf(360.98564736629), mpf(0.000387933), mpf(-1)/mpf(38710000)]), 360)
 
     @classmethod
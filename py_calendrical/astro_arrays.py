@@ -0,0 +1,174 @@
+"""
+Astronomical functions over NumPy arrays of moments.
+
+Each function takes a moment or an array of moments and returns an array of
+the same shape, evaluating the formulas of Astro, Solar and Lunar in floats (see
+py_calendrical.numeric_backend for their accuracy). The periodic terms are
+held as module level arrays and summed as one matrix product, so a year of
+daily solar longitudes is a single call:
+
+    longitudes = solar_longitude(GregorianDate.new_year(2016) + np.arange(366))
+"""
+
+from __future__ import division
+import numpy as np
+from py_calendrical.astro import Astro
+from py_calendrical.calendars.gregorian import GregorianDate
+from py_calendrical.py_cal_cal import poly
+from py_calendrical.lunar import (LUNAR_LONGITUDE_COEFFICIENTS, LUNAR_LONGITUDE_ARGUMENTS, LUNAR_LATITUDE_COEFFICIENTS,
+                                  LUNAR_LATITUDE_ARGUMENTS, LUNAR_DISTANCE_COEFFICIENTS, LUNAR_DISTANCE_ARGUMENTS)
+from py_calendrical.solar import SOLAR_LONGITUDE_COEFFICIENTS, SOLAR_LONGITUDE_MULTIPLIERS, SOLAR_LONGITUDE_ADDENDS
+
+_SOLAR_COEFFICIENTS = np.array(SOLAR_LONGITUDE_COEFFICIENTS, dtype=float)
+_SOLAR_MULTIPLIERS = np.array(SOLAR_LONGITUDE_MULTIPLIERS, dtype=float)[:, np.newaxis]
+_SOLAR_ADDENDS = np.array(SOLAR_LONGITUDE_ADDENDS, dtype=float)[:, np.newaxis]
+
+# The coefficients of the lunar periodic terms, and the multiples of the
+# fundamental arguments with a row for each term.
+_LUNAR_TERMS = [
+    (np.array(coefficients, dtype=float), np.array(arguments, dtype=float).T)
+    for coefficients, arguments in ((LUNAR_LONGITUDE_COEFFICIENTS, LUNAR_LONGITUDE_ARGUMENTS),
+                                    (LUNAR_LATITUDE_COEFFICIENTS, LUNAR_LATITUDE_ARGUMENTS),
+                                    (LUNAR_DISTANCE_COEFFICIENTS, LUNAR_DISTANCE_ARGUMENTS))]
+
+_J2000 = float(Astro.J2000)
+
+# The number of moments whose periodic terms are evaluated at once.
+CHUNK_SIZE = 1 << 16
+
+def _moments(tee):
+    return np.asarray(tee, dtype=float)
+
+def _sin_degrees(theta):
+    return np.sin(np.radians(theta))
+
+def _cos_degrees(theta):
+    return np.cos(np.radians(theta))
+
+def _new_years(years):
+    y = years - 1
+    return GregorianDate.EPOCH + 365 * y + y // 4 - y // 100 + y // 400
+
+def gregorian_years(fixed_dates):
+    """Return the Gregorian years of an array of fixed dates, as GregorianDate.to_year."""
+    fixed_dates = np.asarray(fixed_dates, dtype=np.int64)
+    # The estimate from the mean length of a year is the year or the one after.
+    years = 400 * (fixed_dates - GregorianDate.EPOCH + 2) // 146097 + 1
+    return np.where(_new_years(years) > fixed_dates, years - 1, years)
+
+def ephemeris_correction(tee):
+    """Return Dynamical Time minus Universal Time (in days) for
+    each moment, as Astro.ephemeris_correction."""
+    years = gregorian_years(np.floor(_moments(tee)))
+    is_leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    # From 1 January 1900 to 1 July of the year.
+    c = (_new_years(years) + np.where(is_leap, 182, 181) - _new_years(1900)) / 36525
+    x = 1 / 2 + (_new_years(years) - _new_years(1810))
+    return np.select(
+        [(1988 <= years) & (years <= 2019),
+         (1900 <= years) & (years <= 1987),
+         (1800 <= years) & (years <= 1899),
+         (1700 <= years) & (years <= 1799),
+         (1620 <= years) & (years <= 1699)],
+        [1 / 86400 * (years - 1933),
+         poly(c, [-0.00002, 0.000297, 0.025184, -0.181133, 0.553040, -0.861938, 0.677066, -0.212591]),
+         poly(c, [-0.000009, 0.003844, 0.083563, 0.865736, 4.867575, 15.845535, 31.332267, 38.291999, 28.316289, 11.636204, 2.043794]),
+         1 / 86400 * poly(years - 1700, [8.118780842, -0.005092142, 0.003336121, -0.0000266484]),
+         1 / 86400 * poly(years - 1600, [196.58333, -4.0675, 0.0219167])],
+        1 / 86400 * (((x * x) / 41048480) - 15))
+
+def julian_centuries(tee):
+    """Return Julian centuries since 2000 at each moment, as Astro.julian_centuries."""
+    tee = _moments(tee)
+    return (tee + ephemeris_correction(tee) - _J2000) / 36525
+
+def nutation(tee):
+    """Return the longitudinal nutation at each moment, as Astro.nutation."""
+    return _nutation(julian_centuries(tee))
+
+def _nutation(c):
+    cap_A = poly(c, [124.90, -1934.134, 0.002063])
+    cap_B = poly(c, [201.11, 72001.5377, 0.00057])
+    return -0.004778 * _sin_degrees(cap_A) + -0.0003667 * _sin_degrees(cap_B)
+
+def aberration(tee):
+    """Return the aberration at each moment, as Astro.aberration."""
+    return _aberration(julian_centuries(tee))
+
+def _aberration(c):
+    return 0.0000974 * _cos_degrees(177.63 + 35999.01848 * c) - 0.005575
+
+def solar_longitude(tee):
+    """Return the longitude of sun at each moment, as Solar.solar_longitude."""
+    c = julian_centuries(tee)
+    flat = c.ravel()
+    periodic = np.empty_like(flat)
+    for start in range(0, len(flat), CHUNK_SIZE):
+        chunk = flat[start:start + CHUNK_SIZE]
+        periodic[start:start + CHUNK_SIZE] = _SOLAR_COEFFICIENTS.dot(_sin_degrees(_SOLAR_ADDENDS + _SOLAR_MULTIPLIERS * chunk))
+    lam = 282.7771834 + 36000.76953744 * c + 0.000005729577951308232 * periodic.reshape(c.shape)
+    return np.mod(lam + _aberration(c) + _nutation(c), 360)
+
+def solar_anomaly(c):
+    """Return mean anomaly of sun (in degrees) at each moment given
+    in Julian centuries, as Solar.solar_anomaly."""
+    return np.mod(poly(_moments(c), [357.5291092, 35999.0502909, -0.0001536, 1.0 / 24490000.0]), 360)
+
+def mean_lunar_longitude(c):
+    """As Lunar.mean_lunar_longitude."""
+    return np.mod(poly(_moments(c), [218.3164477, 481267.88123421, -0.0015786, 1 / 538841.0, -1.0 / 65194000.0]), 360)
+
+def lunar_elongation(c):
+    """As Lunar.lunar_elongation."""
+    return np.mod(poly(_moments(c), [297.8501921, 445267.1114034, -0.0018819, 1 / 545868, -1 / 113065000]), 360)
+
+def lunar_anomaly(c):
+    """As Lunar.lunar_anomaly."""
+    return np.mod(poly(_moments(c), [134.9633964, 477198.8675055, 0.0087414, 1.0 / 69699.0, -1.0 / 14712000.0]), 360)
+
+def moon_node(c):
+    """As Lunar.moon_node."""
+    return np.mod(poly(_moments(c), [93.2720950, 483202.0175233, -0.0036539, -1.0 / 3526000.0, 1.0 / 863310000.0]), 360)
+
+def _lunar_periodic_terms(terms, fundamentals, trigonometric):
+    """Return the sum of the periodic terms of Lunar at each moment, as lunar._periodic_terms."""
+    coefficients, multiples = terms
+    angles = np.stack(fundamentals[1:5])
+    # The powers of cap_E for the multiples of the solar anomaly.
+    powers = np.abs(multiples[:, 1])[:, np.newaxis]
+    cap_E = fundamentals[5]
+    total = np.empty_like(cap_E)
+    for start in range(0, len(cap_E), CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        total[start:stop] = coefficients.dot(
+            cap_E[np.newaxis, start:stop] ** powers * trigonometric(multiples.dot(angles[:, start:stop])))
+    return total
+
+def lunar_position(tee):
+    """Return the latitude, longitude and distance of moon at each moment, as Lunar.lunar_position."""
+    tee = _moments(tee)
+    shape = tee.shape
+    c = julian_centuries(tee).ravel()
+    cap_L_prime = mean_lunar_longitude(c)
+    cap_M_prime = lunar_anomaly(c)
+    cap_F = moon_node(c)
+    fundamentals = (cap_L_prime, lunar_elongation(c), solar_anomaly(c), cap_M_prime, cap_F, poly(c, [1, -0.002516, -0.0000074]))
+    longitude_terms, latitude_terms, distance_terms = _LUNAR_TERMS
+
+    longitude = (cap_L_prime +
+                 (1.0 / 1000000.0) * _lunar_periodic_terms(longitude_terms, fundamentals, _sin_degrees) +
+                 (3958 / 1000000) * _sin_degrees(119.75 + c * 131.849) +
+                 (318 / 1000000) * _sin_degrees(53.09 + c * 479264.29) +
+                 (1962 / 1000000) * _sin_degrees(cap_L_prime - cap_F) +
+                 _nutation(c))
+
+    latitude = ((1.0 / 1000000.0) * _lunar_periodic_terms(latitude_terms, fundamentals, _sin_degrees) +
+                (175 / 1000000) * (_sin_degrees(119.75 + c * 131.849 + cap_F) + _sin_degrees(119.75 + c * 131.849 - cap_F)) +
+                (-2235 / 1000000) * _sin_degrees(cap_L_prime) +
+                (127 / 1000000) * _sin_degrees(cap_L_prime - cap_M_prime) +
+                (-115 / 1000000) * _sin_degrees(cap_L_prime + cap_M_prime) +
+                (382 / 1000000) * _sin_degrees(313.45 + c * 481266.484))
+
+    distance = 385000560 + _lunar_periodic_terms(distance_terms, fundamentals, _cos_degrees)
+
+    return latitude.reshape(shape), np.mod(longitude, 360).reshape(shape), distance.reshape(shape)
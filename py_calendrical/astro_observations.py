@@ -1,9 +1,10 @@
 from __future__ import division
-from mpmath import mpf
+from py_calendrical.numeric_backend import mpf
 from py_cal_cal import ifloor
 from py_calendrical.triganometry import angle, tan_degrees, arctan_degrees
 from py_calendrical.day_arithmatic import DayOfWeek
-from py_calendrical.calendars.gregorian import GregorianDate, JulianMonth
+from py_calendrical.calendars.gregorian import GregorianDate
+from py_calendrical.month_of_year import MonthOfYear
 from py_calendrical.location import Location, URBANA
 from py_calendrical.time_arithmatic import Clock
 from py_calendrical.solar import Solar
@@ -16,7 +17,7 @@ def urbana_sunset(gdate):
 
 def urbana_winter(g_year):
     """Return standard time of the winter solstice in Urbana, Illinois, USA."""
-    return URBANA.standard_from_universal(Solar.solar_longitude_after(Astro.WINTER, GregorianDate(g_year, JulianMonth.January, 1).to_fixed()))
+    return URBANA.standard_from_universal(Solar.solar_longitude_after(Astro.WINTER, GregorianDate(g_year, MonthOfYear.January, 1).to_fixed()))
 
 def jewish_dusk(date, location):
     """Return standard time of Jewish dusk on fixed date, date,
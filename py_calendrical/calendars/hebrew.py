@@ -12,7 +12,7 @@ from py_calendrical.location import Location
 from py_calendrical.calendars.gregorian import GregorianDate
 from py_calendrical.time_arithmatic import Clock
 from py_calendrical.year_month_day import YearMonthDay
-from py_calendrical.utils import next_int, final_int, list_range
+from py_calendrical.utils import next_int, next_int_galloping, final_int, list_range
 from py_calendrical.lunar import Lunar
 from py_calendrical.astro import Astro
 from py_calendrical.solar import Solar
@@ -56,8 +56,11 @@ class HebrewDate(YearMonthDay):
         # The fraction can be approximated by 365.25."""
         approx = quotient(fixed_date - cls.EPOCH, Fraction(35975351, 98496)) + 1
         year = final_int(approx - 1, lambda y: cls.new_year(y) <= fixed_date)
-        start = HebrewMonth.TISHRI if fixed_date < HebrewDate(year, HebrewMonth.NISAN, 1).to_fixed() else  HebrewMonth.NISAN
-        month = next_int(start, lambda m: fixed_date <= HebrewDate(year, m, cls.last_day_of_month(m, year)).to_fixed())
+        if fixed_date < HebrewDate(year, HebrewMonth.NISAN, 1).to_fixed():
+            start, last = HebrewMonth.TISHRI, cls.last_month_of_year(year)
+        else:
+            start, last = HebrewMonth.NISAN, HebrewMonth.ELUL
+        month = next_int_galloping(start, lambda m: fixed_date <= HebrewDate(year, m, cls.last_day_of_month(m, year)).to_fixed(), last)
         day = fixed_date - HebrewDate(year, month, 1).to_fixed() + 1
         return HebrewDate(year, month, day)
 
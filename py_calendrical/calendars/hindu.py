@@ -9,7 +9,7 @@ from py_calendrical.calendars.julian import JulianDate
 from py_calendrical.location import Location
 from py_calendrical.calendars.gregorian import GregorianDate
 from py_calendrical.time_arithmatic import Clock
-from py_calendrical.utils import reduce_cond, next_int, is_in_range, list_range
+from py_calendrical.utils import reduce_cond, next_int, next_int_galloping, is_in_range, list_range
 from py_calendrical.solar import Solar
 from py_calendrical.astro import Astro
 from py_calendrical.lunar import Lunar
@@ -195,7 +195,8 @@ class HinduDate(object):
         if (amp < 0):
             return -cls.arcsin(-amp)
         else:
-            pos = next_int(0, lambda k: amp <= cls.sine_table(k))
+            # The table increases to 1 at 24 entries (90 degrees).
+            pos = next_int_galloping(0, lambda k: amp <= cls.sine_table(k), 24)
             below = cls.sine_table(pos - 1)
             return (angle(0, 225, 0) * (pos - 1 + ((amp - below) / (cls.sine_table(pos) - below))))
 
@@ -369,7 +370,7 @@ class HinduLunarDate(HinduDate):
         tau   = tee + ((1/360) * mod(phase - cls.lunar_phase(tee), 360) * cls.SYNODIC_MONTH)
         a = max(tee, tau - 2)
         b = tau + 2
-        return invert_angular(cls.lunar_phase, phase, a, b)
+        return invert_angular(cls.lunar_phase, phase, a, b, rate=360 / cls.SYNODIC_MONTH)
 
     @classmethod
     def calendar_year(cls, tee):
@@ -577,7 +578,7 @@ def hindu_solar_longitude_at_or_after(lam, tee):
     tau = tee + (HinduSolarDate.SIDEREAL_YEAR * (1 / 360) * mod(lam - HinduDate.solar_longitude(tee), 360))
     a = max(tee, tau - 5)
     b = tau +5
-    return invert_angular(HinduDate.solar_longitude, lam, a, b)
+    return invert_angular(HinduDate.solar_longitude, lam, a, b, rate=360 / HinduSolarDate.SIDEREAL_YEAR)
 
 def mesha_samkranti(g_year):
     """Return the fixed moment of Mesha samkranti (Vernal equinox)
@@ -1,9 +1,9 @@
 from __future__ import division
 from operator import mod
-from mpmath import mpf
+from py_calendrical.numeric_backend import mpf
 import math
 from py_calendrical.triganometry import sin_degrees, cos_degrees, tan_degrees, arctan_degrees, arcsin_degrees, arccos_degrees, secs, angle 
-from py_calendrical.py_cal_cal import binary_search, ifloor
+from py_calendrical.py_cal_cal import find_root, ifloor
 from py_calendrical.time_arithmatic import Clock
 from py_calendrical.utils import next_int
 from py_calendrical.lunar import Lunar
@@ -122,10 +122,9 @@ class Location(object):
         angle of sun is alpha (negative if above horizon) at location;
         early is true when MORNING event is sought, and false for EVENING."""
         tee = self.approx_moment_of_depression(approx, alpha, early)
-        if abs(approx - tee) < Clock.days_from_seconds(30):
-            return tee
-        else:
-            return self.moment_of_depression(tee, alpha, early)
+        while abs(approx - tee) >= Clock.days_from_seconds(30):
+            approx, tee = tee, self.approx_moment_of_depression(tee, alpha, early)
+        return tee
 
     def dawn(self, date, alpha):
         """Return standard time in morning on fixed date date at
@@ -176,10 +175,10 @@ class Location(object):
             approx = t - offset
         else:
             approx = t + (1 / 2) + offset
-        rise = binary_search(approx - Clock.days_from_hours(3),
-                             approx + Clock.days_from_hours(3),
-                             lambda u, l: ((u - l) < Clock.days_from_hours(1/60)),
-                             lambda x: self.observed_lunar_altitude(x) > 0)
+        rise = find_root(self.observed_lunar_altitude,
+                         approx - Clock.days_from_hours(3),
+                         approx + Clock.days_from_hours(3),
+                         Clock.days_from_hours(1/60))
         if rise < (t + 1):
             return self.standard_from_universal(rise)
         
@@ -218,8 +217,10 @@ class Location(object):
         """Return the parallax of moon at moment, tee, at location, location.
         Adapted from "Astronomical Algorithms" by Jean Meeus,
         Willmann_Bell, Inc., 1998."""
-        geo = self.lunar_altitude(tee)
-        Delta = Lunar.lunar_distance(tee)
+        beta, lamb, Delta = Lunar.lunar_position(tee)
+        return self.__parallax(self.__altitude(tee, beta, lamb), Delta)
+
+    def __parallax(self, geo, Delta):
         alt = 6378140 / Delta
         arg = alt * cos_degrees(geo)
         return arcsin_degrees(arg)
@@ -228,12 +229,14 @@ class Location(object):
         """Return the topocentric altitude of moon at moment, tee,
         at location, location, as a small positive/negative angle in degrees,
         ignoring refraction."""
-        return self.lunar_altitude(tee) - self.lunar_parallax(tee)
+        beta, lamb, Delta = Lunar.lunar_position(tee)
+        geo = self.__altitude(tee, beta, lamb)
+        return geo - self.__parallax(geo, Delta)
     
     def phasis_on_or_before(self, date):
         """Return the closest fixed date on or before date 'date', when crescent
         moon first became visible at location 'location'."""
-        mean = date - ifloor(Lunar.lunar_phase(date + 1) / 360.0 * Lunar.MEAN_SYNODIC_MONTH)
+        mean = date - ifloor(Lunar.lunar_phase(date + 1) / 360.0 * mpf(Lunar.MEAN_SYNODIC_MONTH))
         tau = ((mean - 30)
                if (((date - mean) <= 3) and (not self.visible_crescent(date)))
                else (mean - 2))
@@ -244,8 +247,10 @@ class Location(object):
         at location, location, as a small positive/negative angle in degrees,
         ignoring parallax and refraction.  Adapted from 'Astronomical
         Algorithms' by Jean Meeus, Willmann_Bell, Inc., 1998."""
-        lamb = Lunar.lunar_longitude(tee)
-        beta = Lunar.lunar_latitude(tee)
+        beta, lamb = Lunar.lunar_latitude_longitude(tee)
+        return self.__altitude(tee, beta, lamb)
+
+    def __altitude(self, tee, beta, lamb):
         alpha = Astro.right_ascension(tee, beta, lamb)
         delta = Astro.declination(tee, beta, lamb)
         theta0 = Astro.sidereal_from_moment(tee)
@@ -1,12 +1,113 @@
 from __future__ import division
 from operator import mod
-from mpmath import mpf
+from py_calendrical.numeric_backend import mpf
 from py_calendrical.triganometry import sin_degrees, cos_degrees, normalized_degrees 
 from py_calendrical.py_cal_cal import iround, poly, sigma, invert_angular
 from py_calendrical.utils import next_int, final_int
 from py_calendrical.astro import Astro
 from py_calendrical.solar import Solar
 
+# The periodic terms of the lunar longitude, latitude and distance, adapted
+# from "Astronomical Algorithms" by Jean Meeus, Willmann_Bell, Inc., 2nd ed.
+# Each term is coefficient * cap_E^|m| * sin (cos for the distance) of
+# d * cap_D + m * cap_M + m' * cap_M_prime + f * cap_F, where the multiples
+# d, m, m' and f are the rows of the arguments.
+LUNAR_LONGITUDE_COEFFICIENTS = (
+    6288774, 1274027, 658314, 213618, -185116, -114332, 58793, 57066, 53322, 45758,
+    -40923, -34720, -30383, 15327, -12528, 10980, 10675, 10034, 8548, -7888,
+    -6766, -5163, 4987, 4036, 3994, 3861, 3665, -2689, -2602, 2390,
+    -2348, 2236, -2120, -2069, 2048, -1773, -1595, 1215, -1110, -892,
+    -810, 759, -713, -700, 691, 596, 549, 537, 520, -487,
+    -399, -381, 351, -340, 330, 327, -323, 299, 294)
+LUNAR_LONGITUDE_ARGUMENTS = (
+    # lunar elongation
+    (
+        0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2,
+        2, 1, 1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3,
+        2, 4, 0, 2, 2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2),
+    # solar anomaly
+    (
+        0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1,
+        1, 0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0,
+        1, -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0),
+    # lunar anomaly
+    (
+        1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2, -1,
+        0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0, -1, 2, -1,
+        1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3, 2, 1, -1, 3),
+    # moon node
+    (
+        0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0,
+        0, 0, 0, 0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0))
+LUNAR_LATITUDE_COEFFICIENTS = (
+    5128122, 280602, 277693, 173237, 55413, 46271, 32573, 17198, 9266, 8822,
+    8216, 4324, 4200, -3359, 2463, 2211, 2065, -1870, 1828, -1794,
+    -1749, -1565, -1491, -1475, -1410, -1344, -1335, 1107, 1021, 833,
+    777, 671, 607, 596, 491, -451, 439, 422, 421, -366,
+    -351, 331, 315, 302, -283, -229, 223, 223, -220, -220,
+    -185, 181, -177, 176, 166, -164, 132, -119, 115, 107)
+LUNAR_LATITUDE_ARGUMENTS = (
+    # lunar elongation
+    (
+        0, 0, 0, 2, 2, 2, 2, 0, 2, 0, 2, 2, 2, 2, 2, 2, 2, 0, 4, 0,
+        0, 0, 1, 0, 0, 0, 1, 0, 4, 4, 0, 4, 2, 2, 2, 2, 0, 2, 2, 2,
+        2, 4, 2, 2, 0, 2, 1, 1, 0, 2, 1, 2, 0, 4, 4, 1, 4, 1, 4, 2),
+    # solar anomaly
+    (
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 1, -1, -1, -1, 1, 0, 1,
+        0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, 1,
+        1, 0, -1, -2, 0, 1, 1, 1, 1, 1, 0, -1, 1, 0, -1, 0, 0, 0, -1, -2),
+    # lunar anomaly
+    (
+        0, 1, 1, 0, -1, -1, 0, 2, 1, 2, 0, -2, 1, 0, -1, 0, -1, -1, -1, 0,
+        0, -1, 0, 1, 1, 0, 0, 3, 0, -1, 1, -2, 0, 2, 1, -2, 3, 2, -3, -1,
+        0, 0, 1, 0, 1, 1, 0, 0, -2, -1, 1, -2, 2, -2, -1, 1, 1, -2, 0, 0),
+    # moon node
+    (
+        1, 1, -1, -1, 1, -1, 1, 1, -1, -1, -1, -1, 1, -1, 1, 1, -1, -1, -1, 1,
+        3, 1, 1, 1, -1, -1, -1, 1, -1, 1, -3, 1, -3, -1, -1, 1, -1, 1, -1, 1,
+        1, 1, 1, -1, 3, -1, -1, 1, -1, -1, 1, -1, 1, -1, -1, -1, -1, -1, -1, 1))
+LUNAR_DISTANCE_COEFFICIENTS = (
+    -20905355, -3699111, -2955968, -569925, 48888, -3149, 246158, -152138, -170733, -204586,
+    -129620, 108743, 104755, 10321, 0, 79661, -34782, -23210, -21636, 24208,
+    30824, -8379, -16675, -12831, -10445, -11650, 14403, -7003, 0, 10056,
+    6322, -9884, 5751, 0, -4950, 4130, 0, -3958, 0, 3258,
+    2616, -1897, -2117, 2354, 0, 0, -1423, -1117, -1571, -1739,
+    0, -4421, 0, 0, 0, 0, 1165, 0, 0, 8752)
+LUNAR_DISTANCE_ARGUMENTS = (
+    # lunar elongation
+    (
+        0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2,
+        2, 1, 1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3,
+        2, 4, 0, 2, 2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2, 2),
+    # solar anomaly
+    (
+        0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1,
+        1, 0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0,
+        1, -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0, 0),
+    # lunar anomaly
+    (
+        1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2, -1,
+        0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0, -1, 2, -1,
+        1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3, 2, 1, -1, 3, -1),
+    # moon node
+    (
+        0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0,
+        0, 0, 0, 0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0, -2))
+
+def _periodic_terms(coefficients, arguments, fundamentals, trigonometric):
+    """Return the sum of the periodic terms at the fundamental arguments."""
+    _, cap_D, cap_M, cap_M_prime, cap_F, cap_E = fundamentals
+    return sigma([coefficients] + list(arguments),
+                 lambda v, w, x, y, z: (v *
+                                        pow(cap_E, abs(x)) *
+                                        trigonometric((w * cap_D) +
+                                                      (x * cap_M) +
+                                                      (y * cap_M_prime) +
+                                                      (z * cap_F))))
+
 class Lunar(Astro):
     
     MEAN_SYNODIC_MONTH = mpf(29.530588861)
@@ -53,55 +154,31 @@ class Lunar(Astro):
         Willmann_Bell, Inc., 2nd ed. with corrections, 2005."""
         return normalized_degrees(poly(c, [mpf(93.2720950), mpf(483202.0175233), mpf(-0.0036539), mpf(-1.0/3526000.0), mpf(1.0/863310000.0)]))
     
+    @classmethod
+    def fundamental_arguments(cls, c):
+        """Return the mean lunar longitude, lunar elongation, solar anomaly,
+        lunar anomaly, moon node and the eccentricity factor of eq. 47.6 in
+        Meeus (in degrees) at moment given in Julian centuries c."""
+        return (cls.mean_lunar_longitude(c),
+                cls.lunar_elongation(c),
+                Solar.solar_anomaly(c),
+                cls.lunar_anomaly(c),
+                cls.moon_node(c),
+                poly(c, [1, mpf(-0.002516), mpf(-0.0000074)]))
+
     @classmethod
     def lunar_longitude(cls, tee):
         """Return longitude of moon (in degrees) at moment tee.
         Adapted from "Astronomical Algorithms" by Jean Meeus,
         Willmann_Bell, Inc., 2nd ed., 1998."""
         c = cls.julian_centuries(tee)
-        cap_L_prime = cls.mean_lunar_longitude(c)
-        cap_D = cls.lunar_elongation(c)
-        cap_M = Solar.solar_anomaly(c)
-        cap_M_prime = cls.lunar_anomaly(c)
-        cap_F = cls.moon_node(c)
-        # see eq. 47.6 in Meeus
-        cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-        args_lunar_elongation = \
-                [0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2, 2, 1,
-                 1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3, 2, 4, 0, 2,
-                 2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2]
-        args_solar_anomaly = \
-                [0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1,
-                 0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0, 1,
-                 -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0]
-        args_lunar_anomaly = \
-                [1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2,
-                 -1, 0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0,
-                 -1, 2, -1, 1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3,
-                 2, 1, -1, 3]
-        args_moon_node = \
-                [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0, 0,
-                 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0, 0, 0, 0,
-                 0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0]
-        sine_coefficients = \
-                [6288774,1274027,658314,213618,-185116,-114332,
-                 58793,57066,53322,45758,-40923,-34720,-30383,
-                 15327,-12528,10980,10675,10034,8548,-7888,
-                 -6766,-5163,4987,4036,3994,3861,3665,-2689,
-                 -2602, 2390,-2348,2236,-2120,-2069,2048,-1773,
-                 -1595,1215,-1110,-892,-810,759,-713,-700,691,
-                 596,549,537,520,-487,-399,-381,351,-340,330,
-                 327,-323,299,294]
+        return cls.__longitude(tee, c, cls.fundamental_arguments(c))
+
+    @classmethod
+    def __longitude(cls, tee, c, fundamentals):
+        cap_L_prime, _, _, _, cap_F, _ = fundamentals
         correction = ((1.0/1000000.0) *
-                      sigma([sine_coefficients, args_lunar_elongation,
-                             args_solar_anomaly, args_lunar_anomaly,
-                             args_moon_node],
-                            lambda v, w, x, y, z:
-                            v * pow(cap_E, abs(x)) *
-                            sin_degrees((w * cap_D) +
-                                        (x * cap_M) +
-                                        (y * cap_M_prime) +
-                                        (z * cap_F))))
+                      _periodic_terms(LUNAR_LONGITUDE_COEFFICIENTS, LUNAR_LONGITUDE_ARGUMENTS, fundamentals, sin_degrees))
         A1 = mpf(119.75) + (c * mpf(131.849))
         venus = ((3958/1000000) * sin_degrees(A1))
         A2 = mpf(53.09) + c * mpf(479264.29)
@@ -117,50 +194,13 @@ class Lunar(Astro):
         Adapted from "Astronomical Algorithms" by Jean Meeus,
         Willmann_Bell, Inc., 1998."""
         c = cls.julian_centuries(tee)
-        cap_L_prime = cls.mean_lunar_longitude(c)
-        cap_D = cls.lunar_elongation(c)
-        cap_M = Solar.solar_anomaly(c)
-        cap_M_prime = cls.lunar_anomaly(c)
-        cap_F = cls.moon_node(c)
-        cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-        args_lunar_elongation = \
-                [0, 0, 0, 2, 2, 2, 2, 0, 2, 0, 2, 2, 2, 2, 2, 2, 2, 0, 4, 0, 0, 0,
-                 1, 0, 0, 0, 1, 0, 4, 4, 0, 4, 2, 2, 2, 2, 0, 2, 2, 2, 2, 4, 2, 2,
-                 0, 2, 1, 1, 0, 2, 1, 2, 0, 4, 4, 1, 4, 1, 4, 2]
-        args_solar_anomaly = \
-                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 1, -1, -1, -1, 1, 0, 1,
-                 0, 1, 0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, 1, 1,
-                 0, -1, -2, 0, 1, 1, 1, 1, 1, 0, -1, 1, 0, -1, 0, 0, 0, -1, -2]
-        args_lunar_anomaly = \
-                [0, 1, 1, 0, -1, -1, 0, 2, 1, 2, 0, -2, 1, 0, -1, 0, -1, -1, -1,
-                 0, 0, -1, 0, 1, 1, 0, 0, 3, 0, -1, 1, -2, 0, 2, 1, -2, 3, 2, -3,
-                 -1, 0, 0, 1, 0, 1, 1, 0, 0, -2, -1, 1, -2, 2, -2, -1, 1, 1, -2,
-                 0, 0]
-        args_moon_node = \
-                [1, 1, -1, -1, 1, -1, 1, 1, -1, -1, -1, -1, 1, -1, 1, 1, -1, -1,
-                 -1, 1, 3, 1, 1, 1, -1, -1, -1, 1, -1, 1, -3, 1, -3, -1, -1, 1,
-                 -1, 1, -1, 1, 1, 1, 1, -1, 3, -1, -1, 1, -1, -1, 1, -1, 1, -1,
-                 -1, -1, -1, -1, -1, 1]
-        sine_coefficients = \
-                [5128122, 280602, 277693, 173237, 55413, 46271, 32573,
-                 17198, 9266, 8822, 8216, 4324, 4200, -3359, 2463, 2211,
-                 2065, -1870, 1828, -1794, -1749, -1565, -1491, -1475,
-                 -1410, -1344, -1335, 1107, 1021, 833, 777, 671, 607,
-                 596, 491, -451, 439, 422, 421, -366, -351, 331, 315,
-                 302, -283, -229, 223, 223, -220, -220, -185, 181,
-                 -177, 176, 166, -164, 132, -119, 115, 107]
+        return cls.__latitude(c, cls.fundamental_arguments(c))
+
+    @classmethod
+    def __latitude(cls, c, fundamentals):
+        cap_L_prime, _, _, cap_M_prime, cap_F, _ = fundamentals
         beta = ((1.0/1000000.0) *
-                sigma([sine_coefficients, 
-                       args_lunar_elongation,
-                       args_solar_anomaly,
-                       args_lunar_anomaly,
-                       args_moon_node],
-                      lambda v, w, x, y, z: (v *
-                                             pow(cap_E, abs(x)) *
-                                             sin_degrees((w * cap_D) +
-                                                         (x * cap_M) +
-                                                         (y * cap_M_prime) +
-                                                         (z * cap_F)))))
+                _periodic_terms(LUNAR_LATITUDE_COEFFICIENTS, LUNAR_LATITUDE_ARGUMENTS, fundamentals, sin_degrees))
         venus = ((175/1000000) *
                  (sin_degrees(mpf(119.75) + c * mpf(131.849) + cap_F) +
                   sin_degrees(mpf(119.75) + c * mpf(131.849) - cap_F)))
@@ -198,7 +238,7 @@ class Lunar(Astro):
         with corrections June 2005."""
         c = cls.julian_centuries(tee)
         cap_D = cls.lunar_elongation(c)
-        cap_M = cls.solar_anomaly(c)
+        cap_M = Solar.solar_anomaly(c)
         cap_M_prime = cls.lunar_anomaly(c)
         cap_F = cls.moon_node(c)
         periodic_terms = (-1.4979 * sin_degrees(2 * (cap_D - cap_F)) +
@@ -225,9 +265,9 @@ class Lunar(Astro):
         n0 = 24724
         k = n - n0
         c = k / mpf(1236.85)
-        approx = (cls.J2000 +
+        approx = (mpf(cls.J2000) +
                   poly(c, [mpf(5.09766),
-                           cls.MEAN_SYNODIC_MONTH * mpf(1236.85),
+                           mpf(cls.MEAN_SYNODIC_MONTH) * mpf(1236.85),
                            mpf(0.0001437),
                            mpf(-0.000000150),
                            mpf(0.00000000073)]))
@@ -285,7 +325,7 @@ class Lunar(Astro):
         """Return the moment UT of last new moon before moment tee."""
         t0 = cls.nth_new_moon(0)
         phi = cls.lunar_phase(tee)
-        n = iround(((tee - t0) / cls.MEAN_SYNODIC_MONTH) - (phi / 360))
+        n = iround(((tee - t0) / mpf(cls.MEAN_SYNODIC_MONTH)) - (phi / 360))
         return cls.nth_new_moon(final_int(n - 1, lambda k: cls.nth_new_moon(k) < tee))
 
     @classmethod    
@@ -293,7 +333,7 @@ class Lunar(Astro):
         """Return the moment UT of first new moon at or after moment, tee."""
         t0 = cls.nth_new_moon(0)
         phi = cls.lunar_phase(tee)
-        n = iround((tee - t0) / cls.MEAN_SYNODIC_MONTH - phi / 360)
+        n = iround((tee - t0) / mpf(cls.MEAN_SYNODIC_MONTH) - phi / 360)
         return cls.nth_new_moon(next_int(n, lambda k: cls.nth_new_moon(k) >= tee))
     
     @classmethod    
@@ -304,9 +344,9 @@ class Lunar(Astro):
         means the last quarter."""
         phi = mod(cls.lunar_longitude(tee) - Solar.solar_longitude(tee), 360)
         t0 = cls.nth_new_moon(0)
-        n = iround((tee - t0) / cls.MEAN_SYNODIC_MONTH)
+        n = iround((tee - t0) / mpf(cls.MEAN_SYNODIC_MONTH))
         phi_prime = (360 *
-                     mod((tee - cls.nth_new_moon(n)) / cls.MEAN_SYNODIC_MONTH, 1))
+                     mod((tee - cls.nth_new_moon(n)) / mpf(cls.MEAN_SYNODIC_MONTH), 1))
         if abs(phi - phi_prime) > 180:
             return phi_prime
         else:
@@ -317,82 +357,59 @@ class Lunar(Astro):
         """Return the moment UT of the last time at or before moment, tee,
         when the lunar_phase was phi degrees."""
         tau = (tee -
-               (cls.MEAN_SYNODIC_MONTH  *
+               (mpf(cls.MEAN_SYNODIC_MONTH)  *
                 (1/360) *
                 mod(cls.lunar_phase(tee) - phi, 360)))
         a = tau - 2
         b = min(tee, tau +2)
-        return invert_angular(cls.lunar_phase, phi, a, b)
+        return invert_angular(cls.lunar_phase, phi, a, b, rate=360 / mpf(cls.MEAN_SYNODIC_MONTH))
 
     @classmethod
     def lunar_phase_at_or_after(cls, phi, tee):
         """Return the moment UT of the next time at or after moment, tee,
         when the lunar_phase is phi degrees."""
         tau = (tee +
-               (cls.MEAN_SYNODIC_MONTH    *
+               (mpf(cls.MEAN_SYNODIC_MONTH)    *
                 (1/360) *
                 mod(phi - cls.lunar_phase(tee), 360)))
         a = max(tee, tau - 2)
         b = tau + 2
-        return invert_angular(cls.lunar_phase, phi, a, b)
+        return invert_angular(cls.lunar_phase, phi, a, b, rate=360 / mpf(cls.MEAN_SYNODIC_MONTH))
      
     @classmethod
     def lunar_distance(cls, tee):
         """Return the distance to moon (in meters) at moment, tee.
         Adapted from "Astronomical Algorithms" by Jean Meeus,
         Willmann_Bell, Inc., 2nd ed."""
-        c = cls.julian_centuries(tee)
-        cap_D = cls.lunar_elongation(c)
-        cap_M = cls.solar_anomaly(c)
-        cap_M_prime = cls.lunar_anomaly(c)
-        cap_F = cls.moon_node(c)
-        cap_E = poly(c, [1, mpf(-0.002516), mpf(-0.0000074)])
-        args_lunar_elongation = \
-            [0, 2, 2, 0, 0, 0, 2, 2, 2, 2, 0, 1, 0, 2, 0, 0, 4, 0, 4, 2, 2, 1,
-             1, 2, 2, 4, 2, 0, 2, 2, 1, 2, 0, 0, 2, 2, 2, 4, 0, 3, 2, 4, 0, 2,
-             2, 2, 4, 0, 4, 1, 2, 0, 1, 3, 4, 2, 0, 1, 2, 2,]
-        args_solar_anomaly = \
-            [0, 0, 0, 0, 1, 0, 0, -1, 0, -1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 1, 1,
-             0, 1, -1, 0, 0, 0, 1, 0, -1, 0, -2, 1, 2, -2, 0, 0, -1, 0, 0, 1,
-             -1, 2, 2, 1, -1, 0, 0, -1, 0, 1, 0, 1, 0, 0, -1, 2, 1, 0, 0]
-        args_lunar_anomaly = \
-            [1, -1, 0, 2, 0, 0, -2, -1, 1, 0, -1, 0, 1, 0, 1, 1, -1, 3, -2,
-             -1, 0, -1, 0, 1, 2, 0, -3, -2, -1, -2, 1, 0, 2, 0, -1, 1, 0,
-             -1, 2, -1, 1, -2, -1, -1, -2, 0, 1, 4, 0, -2, 0, 2, 1, -2, -3,
-             2, 1, -1, 3, -1]
-        args_moon_node = \
-            [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, -2, 2, -2, 0, 0, 0, 0, 0,
-             0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, -2, 2, 0, 2, 0, 0, 0, 0,
-             0, 0, -2, 0, 0, 0, 0, -2, -2, 0, 0, 0, 0, 0, 0, 0, -2]
-        cosine_coefficients = \
-            [-20905355, -3699111, -2955968, -569925, 48888, -3149,
-             246158, -152138, -170733, -204586, -129620, 108743,
-             104755, 10321, 0, 79661, -34782, -23210, -21636, 24208,
-             30824, -8379, -16675, -12831, -10445, -11650, 14403,
-             -7003, 0, 10056, 6322, -9884, 5751, 0, -4950, 4130, 0,
-             -3958, 0, 3258, 2616, -1897, -2117, 2354, 0, 0, -1423,
-             -1117, -1571, -1739, 0, -4421, 0, 0, 0, 0, 1165, 0, 0,
-             8752]
-        correction = sigma ([cosine_coefficients,
-                             args_lunar_elongation,
-                             args_solar_anomaly,
-                             args_lunar_anomaly,
-                             args_moon_node],
-                            lambda v, w, x, y, z: (v *
-                                        pow(cap_E, abs(x)) * 
-                                        cos_degrees((w * cap_D) +
-                                                       (x * cap_M) +
-                                                       (y * cap_M_prime) +
-                                                       (z * cap_F))))
+        return cls.__distance(cls.fundamental_arguments(cls.julian_centuries(tee)))
+
+    @classmethod
+    def __distance(cls, fundamentals):
+        correction = _periodic_terms(LUNAR_DISTANCE_COEFFICIENTS, LUNAR_DISTANCE_ARGUMENTS, fundamentals, cos_degrees)
         return 385000560 + correction
     
+    @classmethod
+    def lunar_latitude_longitude(cls, tee):
+        """Return the latitude and longitude of moon (in degrees) at
+        moment, tee, computing the fundamental arguments once for both."""
+        c = cls.julian_centuries(tee)
+        fundamentals = cls.fundamental_arguments(c)
+        return cls.__latitude(c, fundamentals), cls.__longitude(tee, c, fundamentals)
+
     @classmethod
     def lunar_position(cls, tee):
         """Return the moon position (geocentric latitude and longitude [in degrees]
-        and distance [in meters]) at moment, tee.
+        and distance [in meters]) at moment, tee, computing the fundamental
+        arguments once for the three. tee may be a NumPy array of moments,
+        giving arrays of positions (see py_calendrical.astro_arrays).
         Adapted from "Astronomical Algorithms" by Jean Meeus,
         Willmann_Bell, Inc., 2nd ed."""
-        return (cls.lunar_latitude(tee), cls.lunar_longitude(tee), cls.lunar_distance(tee))
+        if getattr(tee, "ndim", 0) > 0:
+            from py_calendrical import astro_arrays
+            return astro_arrays.lunar_position(tee)
+        c = cls.julian_centuries(tee)
+        fundamentals = cls.fundamental_arguments(c)
+        return (cls.__latitude(c, fundamentals), cls.__longitude(tee, c, fundamentals), cls.__distance(fundamentals))
     
     @classmethod
     def lunar_diameter(cls, tee):
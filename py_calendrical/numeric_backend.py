@@ -0,0 +1,105 @@
+"""
+The numbers used by the astronomical functions.
+
+The astronomical functions (astro, solar, lunar and location) were written
+with mpmath numbers at 50 bits of precision, as the Common Lisp code uses
+long floats. A hardware double has 53 bits, so the same formulas run in
+plain floats give the same results to rounding, many times faster.
+
+The backend is chosen for the whole process:
+
+    use_backend(FLOAT)
+
+or for a block:
+
+    with numeric_backend(FLOAT):
+        solstice = Solar.solar_longitude_after(Astro.WINTER, tee)
+
+MPMATH is the default and remains the reference. With FLOAT, the results
+for the Appendix C tables agree with MPMATH to within TOLERANCE degrees for
+angles and TOLERANCE days for moments; most agree to about 1e-8. The backend
+is a process wide setting, so a block using numeric_backend is not
+isolated from other threads.
+"""
+
+import math
+from contextlib import contextmanager
+from mpmath import mpf as _mpf, sin as _sin, cos as _cos, tan as _tan, atan as _atan, asin as _asin, acos as _acos, radians as _radians, degrees as _degrees, pi as _pi
+
+MPMATH = "mpmath"
+FLOAT = "float"
+
+TOLERANCE = 1e-6
+
+class Backend(object):
+
+    def __init__(self, name, mpf, sin, cos, tan, atan, asin, acos, radians, degrees, pi):
+        self.name = name
+        self.mpf = mpf
+        self.sin = sin
+        self.cos = cos
+        self.tan = tan
+        self.atan = atan
+        self.asin = asin
+        self.acos = acos
+        self.radians = radians
+        self.degrees = degrees
+        self.pi = pi
+
+_backends = {
+    MPMATH: Backend(MPMATH, _mpf, _sin, _cos, _tan, _atan, _asin, _acos, _radians, _degrees, _pi),
+    FLOAT: Backend(FLOAT, float, math.sin, math.cos, math.tan, math.atan, math.asin, math.acos, math.radians, math.degrees, math.pi)
+}
+
+_backend = _backends[MPMATH]
+
+def backend_name():
+    return _backend.name
+
+def use_backend(name):
+    """Sets the backend of the process, returning the name of the previous one."""
+    global _backend
+    if name not in _backends:
+        raise ValueError("Unknown numeric backend: " + str(name))
+    previous = _backend.name
+    _backend = _backends[name]
+    return previous
+
+@contextmanager
+def numeric_backend(name):
+    previous = use_backend(name)
+    try:
+        yield
+    finally:
+        use_backend(previous)
+
+def mpf(x):
+    """Return x as a number of the backend."""
+    return _backend.mpf(x)
+
+def sin(x):
+    return _backend.sin(x)
+
+def cos(x):
+    return _backend.cos(x)
+
+def tan(x):
+    return _backend.tan(x)
+
+def atan(x):
+    return _backend.atan(x)
+
+def asin(x):
+    return _backend.asin(x)
+
+def acos(x):
+    return _backend.acos(x)
+
+def radians(x):
+    return _backend.radians(x)
+
+def degrees(x):
+    return _backend.degrees(x)
+
+def pi():
+    return _backend.pi
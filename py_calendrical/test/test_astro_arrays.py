@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from py_calendrical import astro_arrays
+from py_calendrical.astro import Astro
+from py_calendrical.calendars.gregorian import GregorianDate
+from py_calendrical.lunar import Lunar
+from py_calendrical.numeric_backend import TOLERANCE
+from py_calendrical.solar import Solar
+from py_calendrical.test.test_location import TimeAndAstronomySmokeTestCase
+
+class TestAstroArrays(unittest.TestCase):
+
+    def setUp(self):
+        tables = TimeAndAstronomySmokeTestCase("testDusk")
+        tables.setUp()
+        # The Appendix C moments, which span every branch of the ephemeris correction.
+        self.moments = np.array(tables.rd, dtype=float) + 0.375
+
+    def assertMatches(self, expected, actual, modulus = None):
+        for x, y in zip(expected, actual):
+            difference = abs(float(x) - y)
+            if modulus is not None:
+                difference = min(difference, modulus - difference)
+            self.assertLess(difference, TOLERANCE)
+
+    def testGregorianYears(self):
+        fixed_dates = list(range(-1500, 1500)) + list(range(730000, 731000, 7))
+        self.assertEqual([GregorianDate.to_year(d) for d in fixed_dates], list(astro_arrays.gregorian_years(fixed_dates)))
+
+    def testMatchesScalar(self):
+        self.assertMatches([Astro.ephemeris_correction(t) for t in self.moments], astro_arrays.ephemeris_correction(self.moments))
+        self.assertMatches([Astro.julian_centuries(t) for t in self.moments], astro_arrays.julian_centuries(self.moments))
+        self.assertMatches([Astro.nutation(t) for t in self.moments], astro_arrays.nutation(self.moments))
+        self.assertMatches([Astro.aberration(t) for t in self.moments], astro_arrays.aberration(self.moments))
+        self.assertMatches([Solar.solar_longitude(t) for t in self.moments], Solar.solar_longitude_many(self.moments), 360)
+
+    def testLunarPosition(self):
+        latitudes, longitudes, distances = Lunar.lunar_position(self.moments)
+        self.assertEqual(self.moments.shape, latitudes.shape)
+        self.assertMatches([Lunar.lunar_latitude(t) for t in self.moments], latitudes)
+        self.assertMatches([Lunar.lunar_longitude(t) for t in self.moments], longitudes, 360)
+        # The distance is in meters, so its tolerance is relative.
+        self.assertMatches([Lunar.lunar_distance(t) / 385000560 for t in self.moments], distances / 385000560)
+
+    def testYearOfDailyLongitudes(self):
+        days = GregorianDate.new_year(2016) + np.arange(366)
+        longitudes = astro_arrays.solar_longitude(days.reshape(6, 61))
+        self.assertEqual((6, 61), longitudes.shape)
+        self.assertMatches([Solar.solar_longitude(t) for t in days[::30]], longitudes.ravel()[::30], 360)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,8 @@ import unittest
 
 from mpmath import mpf
 
-from py_calendrical.calendars.gregorian import GregorianDate, JulianMonth
+from py_calendrical.calendars.gregorian import GregorianDate
+from py_calendrical.month_of_year import MonthOfYear
 from py_calendrical.time_arithmatic import Clock
 from py_calendrical.py_cal_cal import iround
 from py_calendrical.calendars.hebrew import JAFFA
@@ -13,7 +14,7 @@ from py_calendrical.solar import Solar
 class TestLocation(unittest.TestCase):
 
     def testUniversalFromDynamical(self):
-        date = GregorianDate(1977, JulianMonth.February, 18)
+        date = GregorianDate(1977, MonthOfYear.February, 18)
         time = Clock(3, 37, 40).to_time()
         td   = date.to_fixed() + time 
         utc  = Astro.universal_from_dynamical(td)
@@ -23,7 +24,7 @@ class TestLocation(unittest.TestCase):
         self.assertEqual(iround(clk.second), 52)
         
     def testDynamicalFromUniversal(self):
-        date = GregorianDate(1977, JulianMonth.February, 18)
+        date = GregorianDate(1977, MonthOfYear.February, 18)
         time = Clock(3, 36, 52).to_time()
         utc  = date.to_fixed() + time 
         td   = Astro.dynamical_from_universal(utc)
@@ -32,7 +33,7 @@ class TestLocation(unittest.TestCase):
         self.assertEqual(clk.minute, 37)
         self.assertEqual(iround(clk.second), 40)
 
-        date = GregorianDate(333, JulianMonth.February, 6)
+        date = GregorianDate(333, MonthOfYear.February, 6)
         time = Clock(6, 0, 0).to_time()
         utc  = date.to_fixed() + time 
         td   = Astro.dynamical_from_universal(utc)
@@ -42,10 +43,21 @@ class TestLocation(unittest.TestCase):
         self.assertAlmostEqual(clk.second, 54.66054, 4)
 
     def testNutation(self):
-        TD  = GregorianDate(1992, JulianMonth.April, 12).to_fixed()
+        TD  = GregorianDate(1992, MonthOfYear.April, 12).to_fixed()
         tee = Astro.universal_from_dynamical(TD)
         self.assertAlmostEqual(Astro.nutation(tee), mpf(0.004610), 3)
 
+    def testLunarPosition(self):
+        # Example 47.a in Meeus, whose longitude excludes the nutation.
+        TD  = GregorianDate(1992, MonthOfYear.April, 12).to_fixed()
+        tee = Astro.universal_from_dynamical(TD)
+        beta, lamb, distance = Lunar.lunar_position(tee)
+        self.assertAlmostEqual(beta, -3.229126, 4)
+        self.assertAlmostEqual(lamb - Astro.nutation(tee), 133.162655, 4)
+        self.assertAlmostEqual(distance / 1000, 368409.7, 0)
+        self.assertEqual((beta, lamb, distance), (Lunar.lunar_latitude(tee), Lunar.lunar_longitude(tee), Lunar.lunar_distance(tee)))
+        self.assertEqual((beta, lamb), Lunar.lunar_latitude_longitude(tee))
+
     def testMeanLunarLongitude(self):
         self.assertAlmostEqual(Lunar.mean_lunar_longitude(-0.077221081451), 134.290182, 6)
 
@@ -0,0 +1,52 @@
+import unittest
+
+from py_calendrical.numeric_backend import numeric_backend, backend_name, use_backend, FLOAT, MPMATH, TOLERANCE
+from py_calendrical.calendars.hebrew import JAFFA
+from py_calendrical.astro import Astro
+from py_calendrical.lunar import Lunar
+from py_calendrical.solar import Solar
+from py_calendrical.test.test_location import TimeAndAstronomySmokeTestCase
+
+class TestNumericBackend(unittest.TestCase):
+
+    def setUp(self):
+        tables = TimeAndAstronomySmokeTestCase("testDusk")
+        tables.setUp()
+        self.tables = tables
+
+    def positions(self, tee):
+        lamb = Lunar.lunar_longitude(tee)
+        beta = Lunar.lunar_latitude(tee)
+        return (Astro.declination(tee, beta, lamb),
+                Astro.right_ascension(tee, beta, lamb),
+                JAFFA.lunar_altitude(tee),
+                Solar.solar_longitude(tee),
+                Solar.solar_longitude_after(Astro.SUMMER, tee),
+                Lunar.new_moon_at_or_after(tee))
+
+    def testContext(self):
+        self.assertEqual(MPMATH, backend_name())
+        with numeric_backend(FLOAT):
+            self.assertEqual(FLOAT, backend_name())
+            self.assertIsInstance(Solar.solar_longitude(self.tables.rd[0]), float)
+        self.assertEqual(MPMATH, backend_name())
+        self.assertRaises(ValueError, use_backend, "decimal")
+
+    def testAppendixTables(self):
+        with numeric_backend(FLOAT):
+            for i, tee in enumerate(self.tables.rd):
+                declination, right_ascension, lunar_altitude, _, _, _ = self.positions(tee)
+                self.assertAlmostEqual(declination, self.tables.declinations[i], 7)
+                self.assertAlmostEqual(right_ascension, self.tables.right_ascensions[i], 7)
+                self.assertAlmostEqual(lunar_altitude, self.tables.lunar_altitudes[i], 6)
+
+    def testMatchesMpmath(self):
+        for tee in self.tables.rd[::4]:
+            expected = self.positions(tee)
+            with numeric_backend(FLOAT):
+                actual = self.positions(tee)
+            for x, y in zip(expected, actual):
+                self.assertLess(abs(float(x) - y), TOLERANCE)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from operator import mod
+
+from py_calendrical.astro import Astro
+from py_calendrical.py_cal_cal import binary_search, find_root, invert_angular, summa
+from py_calendrical.solar import Solar
+from py_calendrical.utils import SearchStatistics
+
+class TestBinarySearch(unittest.TestCase):
+
+    def testBinarySearch(self):
+        statistics = SearchStatistics()
+        x = binary_search(0, 2, lambda l, h: h - l <= 1e-12, lambda x: x * x >= 2, statistics)
+        self.assertAlmostEqual(x, 2 ** 0.5, 11)
+        self.assertEqual(statistics.last, 41)
+
+    def testSumma(self):
+        self.assertEqual(summa(lambda k: k, 1, lambda k: k <= 100000), 5000050000)
+        self.assertEqual(summa(lambda k: k, 1, lambda k: k < 1), 0)
+
+class TestFindRoot(unittest.TestCase):
+
+    def counted(self, f):
+        def g(x):
+            self.evaluations += 1
+            return f(x)
+        self.evaluations = 0
+        return g
+
+    def testFindRoot(self):
+        root = find_root(self.counted(lambda x: x * x * x - 2), 0, 3, 1e-10)
+        self.assertAlmostEqual(root, 2 ** (1 / 3.0), 9)
+        self.assertLess(self.evaluations, 15)
+
+    def testStepFunction(self):
+        # No slope to follow, so the search falls back to bisection.
+        root = find_root(self.counted(lambda x: -1 if x < 0.3 else 1), 0, 1, 1e-6)
+        self.assertAlmostEqual(root, 0.3, 5)
+        self.assertLessEqual(self.evaluations, 21)
+
+    def testInvertAngular(self):
+        rate = 360 / Solar.MEAN_TROPICAL_YEAR
+        for tee in range(710000, 740000, 2999):
+            tau = tee + mod(Astro.SPRING - Solar.solar_longitude(tee), 360) / rate
+            a, b = max(tee, tau - 5), tau + 5
+            expected = binary_search(a, b, lambda l, h: h - l <= 1e-5, lambda x: mod(Solar.solar_longitude(x) - Astro.SPRING, 360) < 180)
+            actual = invert_angular(self.counted(Solar.solar_longitude), Astro.SPRING, a, b, rate=rate)
+            self.assertLessEqual(self.evaluations, 5)
+            self.assertAlmostEqual(expected, actual, 5)
+
+    def testTolerance(self):
+        rate = 360 / Solar.MEAN_TROPICAL_YEAR
+        coarse = invert_angular(self.counted(Solar.solar_longitude), Astro.SUMMER, 735400, 735420, 0.01, rate)
+        coarse_evaluations = self.evaluations
+        fine = invert_angular(self.counted(Solar.solar_longitude), Astro.SUMMER, 735400, 735420, 1e-9, rate)
+        self.assertLessEqual(coarse_evaluations, self.evaluations)
+        self.assertAlmostEqual(coarse, fine, 2)
+        self.assertLess(abs(mod(Solar.solar_longitude(fine) - Astro.SUMMER + 180, 360) - 180), 1e-6)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from py_calendrical.utils import reduce_cond
+from py_calendrical.utils import reduce_cond, next_int, final_int, next_int_galloping, final_int_galloping, SearchStatistics
 
 class Test(unittest.TestCase):
 
@@ -17,5 +17,34 @@ class Test(unittest.TestCase):
         self.assertTrue(reduce_cond(lambda _, x: x[0] < x[1], lambda r, x: not r and x[0] == x[1], zip(a, e), False))
         self.assertTrue(reduce_cond(lambda _, x: x[0] < x[1], lambda r, x: not r and x[0] == x[1], zip(a, f), False))
 
+    def test_next_int(self):
+        statistics = SearchStatistics()
+        # Far longer than the recursion limit.
+        self.assertEqual(next_int(0, lambda k: k >= 100000, statistics), 100000)
+        self.assertEqual(statistics.last, 100001)
+        self.assertEqual(final_int(5, lambda k: k < 100000, statistics), 99999)
+        self.assertEqual(final_int(5, lambda k: k < 5), 4)
+        self.assertEqual(statistics.searches, 2)
+
+    def test_galloping(self):
+        statistics = SearchStatistics()
+        for i in range(-5, 6):
+            for n in range(i, 300):
+                self.assertEqual(next_int_galloping(i, lambda k: k >= n, statistics=statistics), n)
+                self.assertEqual(final_int_galloping(i, lambda k: k <= n), n)
+                self.assertEqual(next_int_galloping(i, lambda k: k >= n, 300), n)
+            self.assertEqual(final_int_galloping(i, lambda k: k < i), i - 1)
+        self.assertEqual(next_int_galloping(0, lambda k: k >= 100000, statistics=statistics), 100000)
+        self.assertLessEqual(statistics.last, 2 * 17 + 1)
+
+    def test_galloping_bound(self):
+        # The predicate is not evaluated beyond the bound, where it is no longer monotone.
+        evaluated = []
+        def p(k):
+            evaluated.append(k)
+            return 20 <= k <= 24
+        self.assertEqual(next_int_galloping(0, p, 24), 20)
+        self.assertLessEqual(max(evaluated), 24)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
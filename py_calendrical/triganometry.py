@@ -1,7 +1,7 @@
 from __future__ import division
 from operator import mod
 from py_cal_cal import signum, ifloor
-from mpmath import radians as radians_from_degrees, degrees, sin, cos, tan, mpf, atan, asin, acos
+from py_calendrical.numeric_backend import radians as radians_from_degrees, degrees, sin, cos, tan, mpf, atan, asin, acos
 
 def secs(x):
     """Return the seconds in angle x."""
@@ -19,7 +19,7 @@ def normalized_degrees(theta):
 
 def normalized_degrees_from_radians(theta):
     """Return normalized degrees from radians, theta.
-    Function 'degrees' comes from mpmath."""
+    Function 'degrees' comes from the numeric backend."""
     return normalized_degrees(degrees(theta))
 
 def sin_degrees(theta):
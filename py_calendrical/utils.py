@@ -21,15 +21,84 @@ def even(i):
 def odd(i):
     return not even(i)
 
-def next_int(i, p):
+class SearchStatistics(object):
+    """Counts the searches made by the integer searches given it and the
+    evaluations of their predicates. last is the number of evaluations
+    made by the most recent search."""
+
+    def __init__(self):
+        self.searches = 0
+        self.evaluations = 0
+        self.last = 0
+
+    def record(self, evaluations):
+        self.searches += 1
+        self.evaluations += evaluations
+        self.last = evaluations
+
+def next_int(i, p, statistics=None):
     """Return first integer greater or equal to initial index, i,
     such that condition, p, holds."""
-    return i if p(i) else next_int(i + 1, p)
+    evaluations = 1
+    while not p(i):
+        i += 1
+        evaluations += 1
+    if statistics is not None:
+        statistics.record(evaluations)
+    return i
 
-def final_int(i, p):
+def final_int(i, p, statistics=None):
     """Return last integer greater or equal to initial index, i,
     such that condition, p, holds."""
-    return i - 1 if not p(i) else final_int(i + 1, p)
+    evaluations = 1
+    while p(i):
+        i += 1
+        evaluations += 1
+    if statistics is not None:
+        statistics.record(evaluations)
+    return i - 1
+
+def next_int_galloping(i, p, hi=None, statistics=None):
+    """Return first integer greater or equal to initial index, i,
+    such that condition, p, holds, where p is monotone: false up to
+    some index and true from it on. The steps from i double until p
+    holds and the last step is then bisected, so an answer n steps
+    away takes about 2 log2(n) evaluations of p rather than n. If
+    given, p is taken to hold at hi and is not evaluated beyond it."""
+    evaluations = 1
+    if p(i):
+        if statistics is not None:
+            statistics.record(evaluations)
+        return i
+    # p is false at lo and true at top.
+    lo, step = i, 1
+    while True:
+        top = i + step
+        if hi is not None and top >= hi:
+            top = hi
+            break
+        evaluations += 1
+        if p(top):
+            break
+        lo, step = top, 2 * step
+    while top - lo > 1:
+        mid = (lo + top) // 2
+        evaluations += 1
+        if p(mid):
+            top = mid
+        else:
+            lo = mid
+    if statistics is not None:
+        statistics.record(evaluations)
+    return top
+
+def final_int_galloping(i, p, hi=None, statistics=None):
+    """Return last integer greater or equal to initial index, i,
+    such that condition, p, holds, where p is monotone: true up to
+    some index and false from it on. As next_int_galloping, p is
+    taken to be false at hi if given."""
+    index = next_int_galloping(i, lambda k: not p(k), hi, statistics)
+    return index - 1
 
 def is_in_range(tee, pair):
     """Return True if moment 'tee' falls within range 'range',
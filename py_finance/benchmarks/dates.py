@@ -0,0 +1,232 @@
+"""
+Benchmarks of the py_finance date operations.
+
+Each benchmark is run for each calendar in two scenarios: cold, where a new
+calendar is created for every repetition so holiday generation is part of
+the measurement, and warm, where the calendar's holidays are generated
+before timing starts.
+
+To run the benchmarks and write the results as JSON:
+
+    python -m py_finance.benchmarks.dates run --output results.json
+
+To compare two runs, flagging benchmarks more than 10% slower:
+
+    python -m py_finance.benchmarks.dates compare before.json after.json --threshold 0.1
+
+The compare command exits with status 1 if any benchmark is slower.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from datetime import date, timedelta
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.time_unit import TimeUnit
+
+COLD = "cold"
+WARM = "warm"
+
+def calendar_factories():
+    from py_finance.dates.calendars.target import Target
+    from py_finance.dates.calendars.united_kingdom import UnitedKingdom
+    from py_finance.dates.calendars.united_states import UnitedStatesSettlement, UnitedStatesNyse, UnitedStatesGovernmentBond, UnitedStatesNerc
+    return [
+        ("UK", UnitedKingdom),
+        ("TARGET", Target),
+        ("US-Settlement", UnitedStatesSettlement),
+        ("US-NYSE", UnitedStatesNyse),
+        ("US-GovtBond", UnitedStatesGovernmentBond),
+        ("US-NERC", UnitedStatesNerc)
+    ]
+
+def random_dates(count, year_from = 2000, year_to = 2030, seed = 42):
+    generator = random.Random(seed)
+    first = date(year_from, 1, 1).toordinal()
+    last = date(year_to, 12, 31).toordinal()
+    return [date.fromordinal(generator.randint(first, last)) for _ in range(count)]
+
+# The years whose holidays are generated, 61 of them for each unit of scale.
+HOLIDAY_YEAR_FROM = 1985
+
+def holiday_year_to(scale):
+    return HOLIDAY_YEAR_FROM + 61 * scale - 1
+
+def warm_up(calendar, year_from = HOLIDAY_YEAR_FROM, year_to = 2045):
+    for year in range(year_from, year_to + 1):
+        calendar.is_holiday(date(year, 1, 1))
+
+def bench_adjust(calendar, scale):
+    dates = random_dates(10000 * scale)
+    def run():
+        for value in dates:
+            calendar.adjust(value, BusinessDayConvention.modified_following)
+    return run
+
+def bench_advance(calendar, scale):
+    dates = random_dates(10000 * scale)
+    def run():
+        for value in dates:
+            calendar.advance(value, 3, TimeUnit.months, BusinessDayConvention.modified_following, True)
+    return run
+
+def bench_add_business_days(calendar, scale):
+    dates = random_dates(10000 * scale)
+    def run():
+        for value in dates:
+            calendar.add_business_days(value, 10)
+    return run
+
+def bench_business_day_count(calendar, scale):
+    # 30 year business day counts.
+    starts = random_dates(10 * scale, 1985, 1995)
+    def run():
+        for start in starts:
+            calendar.business_day_count(start, start + timedelta(30 * 365))
+    return run
+
+def bench_schedule_roll(calendar, scale):
+    # Roll 10k trades forward by one quarterly period.
+    dates = random_dates(10000 * scale)
+    def run():
+        for value in dates:
+            calendar.adjust(calendar.add_months(value, 3, True), BusinessDayConvention.modified_following)
+    return run
+
+def bench_holiday_generation(calendar, scale):
+    # Through the calendar's holiday cache, so the cold scenario generates
+    # the holidays and the warm one finds them cached.
+    def run():
+        calendar.prefetch(HOLIDAY_YEAR_FROM, holiday_year_to(scale))
+    return run
+
+BENCHMARKS = [
+    ("adjust", bench_adjust),
+    ("advance", bench_advance),
+    ("add_business_days", bench_add_business_days),
+    ("business_day_count", bench_business_day_count),
+    ("schedule_roll", bench_schedule_roll),
+    ("holiday_generation", bench_holiday_generation)
+]
+
+def measure(create_calendar, benchmark, scenario, repeat, scale):
+
+    timings = []
+    for _ in range(repeat):
+        calendar = create_calendar()
+        if scenario == WARM:
+            warm_up(calendar, year_to = max(2045, holiday_year_to(scale)))
+        run = benchmark(calendar, scale)
+        start = timeit.default_timer()
+        run()
+        timings.append(timeit.default_timer() - start)
+
+    timings.sort()
+    return {
+        "repeat": repeat,
+        "min": timings[0],
+        "median": timings[len(timings) // 2],
+        "mean": sum(timings) / len(timings)
+    }
+
+def run_benchmarks(names = None, calendars = None, scenarios = (COLD, WARM), repeat = 5, scale = 1):
+
+    """
+    Runs the benchmarks and returns the results as a dictionary which can be
+    written as JSON. Benchmarks and calendars may be restricted by name.
+    """
+
+    results = []
+    for calendar_name, create_calendar in calendar_factories():
+        if calendars is not None and calendar_name not in calendars:
+            continue
+        for name, benchmark in BENCHMARKS:
+            if names is not None and name not in names:
+                continue
+            for scenario in scenarios:
+                result = measure(create_calendar, benchmark, scenario, repeat, scale)
+                result.update({
+                    "name": "{0}/{1}/{2}".format(name, calendar_name, scenario),
+                    "benchmark": name,
+                    "calendar": calendar_name,
+                    "scenario": scenario
+                })
+                results.append(result)
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scale": scale,
+        "results": results
+    }
+
+def compare(baseline, current, threshold = 0.1):
+
+    """
+    Compares the median timings of two runs. Returns a list of
+    (name, baseline median, current median, ratio, is_slower) for the
+    benchmarks in both runs, where is_slower is set when the current run is
+    more than the threshold slower.
+    """
+
+    baseline_medians = dict((result["name"], result["median"]) for result in baseline["results"])
+
+    comparisons = []
+    for result in current["results"]:
+        before = baseline_medians.get(result["name"])
+        if before is None:
+            continue
+        after = result["median"]
+        ratio = after / before if before > 0 else float("inf")
+        comparisons.append((result["name"], before, after, ratio, ratio > 1.0 + threshold))
+
+    return comparisons
+
+def main(args):
+
+    parser = argparse.ArgumentParser(prog = "python -m py_finance.benchmarks.dates")
+    commands = parser.add_subparsers(dest = "command")
+
+    run_parser = commands.add_parser("run", help = "run the benchmarks")
+    run_parser.add_argument("--output", help = "the file to write the JSON results to (default: stdout)")
+    run_parser.add_argument("--benchmark", action = "append", help = "run only the named benchmark")
+    run_parser.add_argument("--calendar", action = "append", help = "run only the named calendar")
+    run_parser.add_argument("--scenario", action = "append", choices = (COLD, WARM), help = "run only the given scenario")
+    run_parser.add_argument("--repeat", type = int, default = 5)
+    run_parser.add_argument("--scale", type = int, default = 1, help = "multiply the size of every workload")
+
+    compare_parser = commands.add_parser("compare", help = "compare two runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type = float, default = 0.1, help = "the fractional slowdown to flag (default: 0.1)")
+
+    options = parser.parse_args(args)
+
+    if options.command == "run":
+        results = run_benchmarks(options.benchmark, options.calendar, options.scenario or (COLD, WARM), options.repeat, options.scale)
+        if options.output:
+            with open(options.output, "w") as output:
+                json.dump(results, output, indent = 2, sort_keys = True)
+        else:
+            json.dump(results, sys.stdout, indent = 2, sort_keys = True)
+            sys.stdout.write("\n")
+        return 0
+
+    with open(options.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(options.current) as current_file:
+        current = json.load(current_file)
+
+    comparisons = compare(baseline, current, options.threshold)
+    for name, before, after, ratio, is_slower in comparisons:
+        sys.stdout.write("{0:<48} {1:>10.6f} {2:>10.6f} {3:>7.2f}x{4}\n".format(name, before, after, ratio, "  SLOWER" if is_slower else ""))
+
+    return 1 if any(is_slower for _, _, _, _, is_slower in comparisons) else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,419 @@
+"""
+Vectorized versions of the Calendar date arithmetic.
+
+Dates are passed as NumPy datetime64[D] arrays or as integer day serials.
+A day serial is the proleptic Gregorian ordinal of the date, as returned by
+date.toordinal(), which is the same numbering as the fixed dates of
+py_calendrical. Results are returned in the same representation as the
+input.
+
+The business day lookups use the calendar's business day index if it
+covers the dates given, and otherwise an index built for the call, which
+leaves the calendar's own index as it is; build_index on the calendar to
+share one between calls. An index built for a call spans at most
+MAX_INDEX_YEARS around the bulk of the dates. Any element whose result
+would fall outside the index is computed with the scalar Calendar method,
+so the results always match the scalar API.
+"""
+
+import binascii
+# pip install numpy
+import numpy as np
+from datetime import date
+from py_finance.dates import day_serial
+from py_finance.dates.business_day_index import BusinessDayIndex
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.date_generation import DateGeneration
+from py_finance.dates.time_unit import TimeUnit, AVERAGE_DAYS
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# The most years an index built for a batch call covers.
+MAX_INDEX_YEARS = 100
+
+def to_ordinals(dates):
+
+    """
+    Returns the dates as an int64 array of day serials, and whether they were
+    given as datetime64 values.
+    """
+
+    values = np.asarray(dates)
+
+    if values.dtype.kind == 'M':
+        return values.astype('datetime64[D]').astype(np.int64) + EPOCH_ORDINAL, True
+    elif values.dtype.kind in 'iu':
+        return values.astype(np.int64), False
+    else:
+        raise TypeError("Dates must be datetime64[D] values or integer day serials")
+
+def from_ordinals(ordinals, as_datetime64):
+    if as_datetime64:
+        return (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+    else:
+        return ordinals
+
+def months_of(ordinals):
+    """Returns the number of months since January 1970 for each day serial."""
+    return (ordinals - EPOCH_ORDINAL).astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+
+def year_month_day(ordinals):
+    """Returns the years, months and days of an array of day serials."""
+    days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+    month_starts = days.astype('datetime64[M]')
+    months = month_starts.astype(np.int64)
+    return months // 12 + 1970, months % 12 + 1, (days - month_starts.astype('datetime64[D]')).astype(np.int64) + 1
+
+def year_starts(years):
+    """Returns the day serials of 1 January of an array of years."""
+    y = np.asarray(years, dtype=np.int64) - 1
+    return y * 365 + y // 4 - y // 100 + y // 400 + 1
+
+def is_end_of_month(ordinals):
+    return months_of(ordinals) != months_of(ordinals + 1)
+
+def add_months(ordinals, months, end_of_month = False):
+
+    """
+    Adds months to an array of day serials with the same rules as
+    Calendar.add_months.
+    """
+
+    days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+    month_starts = days.astype('datetime64[M]')
+    day_of_month = (days - month_starts.astype('datetime64[D]')).astype(np.int64) + 1
+
+    target_months = month_starts + np.asarray(months, dtype=np.int64)
+    target_starts = target_months.astype('datetime64[D]')
+    days_in_target_month = ((target_months + 1).astype('datetime64[D]') - target_starts).astype(np.int64)
+
+    target_day = np.minimum(day_of_month, days_in_target_month)
+
+    if end_of_month:
+        days_in_month = ((month_starts + 1).astype('datetime64[D]') - month_starts.astype('datetime64[D]')).astype(np.int64)
+        target_day = np.where(day_of_month == days_in_month, days_in_target_month, target_day)
+
+    result = target_starts.astype(np.int64) + EPOCH_ORDINAL + target_day - 1
+    return np.where(np.asarray(months) == 0, ordinals, result)
+
+class _IndexTable(object):
+
+    """
+    NumPy views of a calendar's business day index.
+    """
+
+    def __init__(self, calendar, ordinals, margin_years = 1):
+
+        year_from, year_to = _index_years(ordinals, margin_years)
+
+        index = calendar.index
+        if index is None or index.year_from > year_from or index.year_to < year_to:
+            index = BusinessDayIndex(calendar, year_from, year_to)
+
+        self.index = index
+        self.counts = np.frombuffer(index.counts, dtype=np.dtype(index.counts.typecode))
+        self.business_days = np.frombuffer(index.business_days, dtype=np.dtype(index.business_days.typecode))
+
+    def offsets(self, ordinals):
+        """Returns the position of each date in the index, clipped to the window, and the mask of dates inside it."""
+        i = ordinals - self.index.first
+        inside = (i >= 0) & (i <= self.index.last - self.index.first)
+        return np.where(inside, i, 0), inside
+
+    def lookup(self, k):
+        """Returns the business days at positions k, and the mask of valid positions."""
+        valid = (k >= 0) & (k < len(self.business_days))
+        if len(self.business_days) == 0:
+            return np.zeros_like(k), valid
+        return self.business_days[np.clip(k, 0, len(self.business_days) - 1)], valid
+
+    def adjustment(self, ordinals, table):
+        """Reads the adjusted dates from one of the index's adjustment tables."""
+        i, inside = self.offsets(ordinals)
+        result = np.frombuffer(table, dtype=np.dtype(table.typecode))[i]
+        return result, inside & (result != 0)
+
+    def next_business_day(self, ordinals):
+        """Returns the first business day on or after each date."""
+        return self.adjustment(ordinals, self.index.next_business_days)
+
+    def previous_business_day(self, ordinals):
+        """Returns the last business day on or before each date."""
+        return self.adjustment(ordinals, self.index.previous_business_days)
+
+    def add_business_days(self, ordinals, count):
+        i, inside = self.offsets(ordinals)
+        if count > 0:
+            result, valid = self.lookup(self.counts[i + 1] + count - 1)
+        elif count < 0:
+            result, valid = self.lookup(self.counts[i] + count)
+        else:
+            return ordinals.copy(), inside
+        return result, inside & valid
+
+def _index_years(ordinals, margin_years):
+
+    """
+    Returns the years an index for the dates should cover. If they span more
+    than MAX_INDEX_YEARS the window is centred on their median, so a few
+    distant dates, such as a 9999-12-31 sentinel, are left to the scalar
+    methods rather than indexing the centuries between.
+    """
+
+    ordinals = np.asarray(ordinals).ravel()
+    if len(ordinals) == 0:
+        return 1970, 1970
+
+    year_from = day_serial.year_of(int(ordinals.min())) - margin_years
+    year_to = day_serial.year_of(int(ordinals.max())) + margin_years
+    if year_to - year_from >= MAX_INDEX_YEARS:
+        middle = (len(ordinals) - 1) // 2
+        median = day_serial.year_of(int(np.partition(ordinals, middle)[middle]))
+        year_from = max(year_from, median - MAX_INDEX_YEARS // 2)
+        year_to = min(year_to, year_from + MAX_INDEX_YEARS - 1)
+
+    return max(year_from, 1), min(year_to, 9999)
+
+def _fill_outside(result, ok, ordinals, scalar):
+    """Computes the elements the index could not resolve with the scalar function."""
+    if not ok.all():
+        for j in np.flatnonzero(~ok):
+            result[j] = scalar(int(ordinals[j]))
+    return result
+
+def adjust_ordinals(calendar, ordinals, convention = BusinessDayConvention.following):
+
+    if convention == BusinessDayConvention.none:
+        return ordinals.copy()
+
+    table = _IndexTable(calendar, ordinals)
+
+    if convention == BusinessDayConvention.following:
+        result, ok = table.adjustment(ordinals, table.index.next_business_days)
+    elif convention == BusinessDayConvention.preceding:
+        result, ok = table.adjustment(ordinals, table.index.previous_business_days)
+    elif convention == BusinessDayConvention.modified_following:
+        result, ok = table.adjustment(ordinals, table.index.modified_next_business_days)
+    elif convention == BusinessDayConvention.modified_preceding:
+        result, ok = table.adjustment(ordinals, table.index.modified_previous_business_days)
+    elif convention == BusinessDayConvention.nerarest:
+        following, following_ok = table.next_business_day(ordinals)
+        preceding, preceding_ok = table.previous_business_day(ordinals)
+        use_preceding = (ordinals - preceding) < (following - ordinals)
+        result = np.where(use_preceding, preceding, following)
+        ok = following_ok & preceding_ok
+    else:
+        raise ValueError("Invalid business day convention")
+
+    return _fill_outside(result, ok, ordinals, lambda ordinal: calendar.adjust_ordinal(ordinal, convention))
+
+def add_business_days_ordinals(calendar, ordinals, count):
+
+    if count == 0:
+        return ordinals.copy()
+
+    # Allow roughly 250 business days a year when sizing the index.
+    table = _IndexTable(calendar, ordinals, abs(count) // 250 + 1)
+    result, ok = table.add_business_days(ordinals, count)
+    return _fill_outside(result, ok, ordinals, lambda ordinal: calendar.add_business_days_ordinal(ordinal, count))
+
+def advance_ordinals(calendar, ordinals, count, unit, convention = BusinessDayConvention.following, end_of_month = False):
+
+    if count == 0:
+        return adjust_ordinals(calendar, ordinals, convention)
+    elif unit == TimeUnit.days:
+        return add_business_days_ordinals(calendar, ordinals, count)
+    elif unit == TimeUnit.weeks:
+        return adjust_ordinals(calendar, ordinals + 7 * count, convention)
+    elif unit == TimeUnit.months:
+        return adjust_ordinals(calendar, add_months(ordinals, count, end_of_month), convention)
+    elif unit == TimeUnit.years:
+        return adjust_ordinals(calendar, add_months(ordinals, 12 * count, end_of_month), convention)
+    else:
+        raise ValueError("Unhandled TimeUnit")
+
+def business_day_counts_ordinals(calendar, starts, ends, chunk_size = 1 << 20):
+
+    """
+    Returns the number of business days from each start (inclusive) to each
+    end (exclusive), negated where the start is after the end, as
+    Calendar.business_day_count.
+
+    Each count is the difference of the index's running business day counts
+    at the end and the start, which is already negative for reversed pairs.
+    The pairs are taken chunk_size at a time to bound the temporary arrays.
+    """
+
+    result = np.empty(len(starts), dtype=np.int64)
+    if len(starts) == 0:
+        return result
+
+    bounds = np.array([min(starts.min(), ends.min()), max(starts.max(), ends.max())])
+    table = _IndexTable(calendar, bounds)
+    first = table.index.first
+    # counts has an element for the day after the window, as an exclusive end.
+    days = len(table.counts) - 1
+
+    for k in range(0, len(starts), chunk_size):
+        i = starts[k:k + chunk_size] - first
+        j = ends[k:k + chunk_size] - first
+        ok = (i >= 0) & (i <= days) & (j >= 0) & (j <= days)
+        if ok.all():
+            result[k:k + chunk_size] = table.counts[j] - table.counts[i]
+        else:
+            result[k:k + chunk_size] = table.counts[np.where(ok, j, 0)] - table.counts[np.where(ok, i, 0)]
+            for m in np.flatnonzero(~ok):
+                result[k + m] = calendar.business_day_count_ordinal(int(starts[k + m]), int(ends[k + m]))
+
+    return result
+
+def business_day_ordinals_between(calendar, start, end):
+
+    """
+    Returns the day serials of the business days from start (inclusive) to
+    end (exclusive), from the calendar's index if it covers them, or else
+    from the holidays and weekends of each year.
+    """
+
+    if start >= end:
+        return np.zeros(0, dtype=np.int64)
+
+    index = calendar.index
+    if index is not None and index.covers(start) and index.covers(end - 1):
+        business_days = np.frombuffer(index.business_days, dtype=np.dtype(index.business_days.typecode))
+        return business_days[index.counts[start - index.first]:index.counts[end - index.first]].astype(np.int64)
+
+    years = []
+    for year in range(day_serial.year_of(start), day_serial.year_of(end - 1) + 1):
+        bits = calendar.holiday_bits(year) | day_serial.weekend_bits(year)
+        # The bitset as 46 big endian bytes, unpacked and reversed so
+        # element n is bit n.
+        closed = np.unpackbits(np.frombuffer(binascii.unhexlify("%092x" % bits), dtype=np.uint8))[::-1]
+        years.append(day_serial.year_start(year) + np.flatnonzero(closed[:calendar.days_in_year(year)] == 0))
+
+    ordinals = np.concatenate(years).astype(np.int64)
+    return ordinals[(ordinals >= start) & (ordinals < end)]
+
+def adjust_many(calendar, dates, convention = BusinessDayConvention.following):
+    ordinals, as_datetime64 = to_ordinals(dates)
+    return from_ordinals(adjust_ordinals(calendar, ordinals, convention), as_datetime64)
+
+def add_business_days_many(calendar, dates, count):
+    ordinals, as_datetime64 = to_ordinals(dates)
+    return from_ordinals(add_business_days_ordinals(calendar, ordinals, count), as_datetime64)
+
+def business_day_counts(calendar, starts, ends, chunk_size = 1 << 20):
+    start_ordinals, _ = to_ordinals(starts)
+    end_ordinals, _ = to_ordinals(ends)
+    if start_ordinals.shape != end_ordinals.shape:
+        raise ValueError("There must be an end for each start")
+    return business_day_counts_ordinals(calendar, start_ordinals.ravel(), end_ordinals.ravel(), chunk_size).reshape(start_ordinals.shape)
+
+def add_months_many(dates, months, end_of_month = False):
+
+    """
+    Adds months to an array of datetime64[D] dates or integer day serials.
+    The months may be a single offset or an array of offsets broadcast
+    against the dates, so a column of dates and a row of offsets give a
+    grid with a row of dates for each date.
+    """
+
+    ordinals, as_datetime64 = to_ordinals(dates)
+    return from_ordinals(add_months(ordinals, months, end_of_month), as_datetime64)
+
+def advance_many(calendar, dates, count, unit, convention = BusinessDayConvention.following, end_of_month = False):
+    ordinals, as_datetime64 = to_ordinals(dates)
+    return from_ordinals(advance_ordinals(calendar, ordinals, count, unit, convention, end_of_month), as_datetime64)
+
+def unadjusted_ordinals(anchors, periods, count, unit, end_of_month = False):
+
+    """
+    Returns the day serials the given numbers of tenors from the anchors,
+    before business day adjustment, as Schedule.unadjusted_date.
+    """
+
+    count = periods * count
+
+    if unit == TimeUnit.days:
+        return anchors + count
+    elif unit == TimeUnit.weeks:
+        return anchors + 7 * count
+    elif unit == TimeUnit.months:
+        return add_months(anchors, count, end_of_month)
+    elif unit == TimeUnit.years:
+        return add_months(anchors, 12 * count, end_of_month)
+    else:
+        raise ValueError("Unhandled TimeUnit")
+
+def schedules_many(calendar, effective_dates, termination_dates, count, unit,
+                   convention = BusinessDayConvention.following,
+                   termination_convention = BusinessDayConvention.following,
+                   end_of_month = False,
+                   rule = DateGeneration.backward):
+
+    """
+    Generates many schedules at once. See Schedule.generate_many.
+    """
+
+    effective, as_datetime64 = to_ordinals(effective_dates)
+    termination, _ = to_ordinals(termination_dates)
+
+    if np.any(effective >= termination):
+        raise ValueError("The effective date must be before the termination date")
+    if count <= 0:
+        raise ValueError("The tenor must be positive")
+
+    if rule == DateGeneration.forward:
+        anchors, sign = effective, 1
+        inside = lambda values: values < termination
+    elif rule == DateGeneration.backward:
+        anchors, sign = termination, -1
+        inside = lambda values: values > effective
+    else:
+        raise ValueError("Unhandled DateGeneration")
+
+    # Estimate the number of regular periods from the length of the schedules
+    # and correct the estimates, as Schedule.regular_periods.
+    periods = ((termination - effective) / (AVERAGE_DAYS[unit] * count)).astype(np.int64)
+    while True:
+        step = (periods > 0) & ~inside(unadjusted_ordinals(anchors, sign * periods, count, unit, end_of_month))
+        if not step.any():
+            break
+        periods -= step
+    while True:
+        step = inside(unadjusted_ordinals(anchors, sign * (periods + 1), count, unit, end_of_month))
+        if not step.any():
+            break
+        periods += step
+    regular = periods + 1
+
+    # Lay the dates of every schedule out end to end.
+    sizes = regular + 1
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.int64)
+    trade = np.repeat(np.arange(len(sizes)), sizes)
+    position = np.arange(sizes.sum()) - starts[trade]
+    is_last = position == regular[trade]
+
+    if rule == DateGeneration.forward:
+        regular_dates = unadjusted_ordinals(effective[trade], position, count, unit, end_of_month)
+        unadjusted = np.where(is_last, termination[trade], regular_dates)
+    else:
+        regular_dates = unadjusted_ordinals(termination[trade], position - regular[trade], count, unit, end_of_month)
+        unadjusted = np.where(position == 0, effective[trade], regular_dates)
+
+    adjusted = adjust_ordinals(calendar, unadjusted, convention)
+    adjusted[is_last] = adjust_ordinals(calendar, unadjusted[is_last], termination_convention)
+
+    # Within each run of dates adjusting to the same day keep the first, or
+    # the termination date if the run ends the schedule.
+    run_start = np.ones(len(adjusted), dtype=bool)
+    run_start[1:] = (trade[1:] != trade[:-1]) | (adjusted[1:] != adjusted[:-1])
+    run = np.cumsum(run_start) - 1
+    run_ends_schedule = np.zeros(run[-1] + 1 if len(run) else 0, dtype=bool)
+    run_ends_schedule[run[is_last]] = True
+    keep = np.where(run_ends_schedule[run], is_last, run_start)
+
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(trade[keep], minlength=len(sizes)))
+
+    return offsets, from_ordinals(unadjusted[keep], as_datetime64), from_ordinals(adjusted[keep], as_datetime64)
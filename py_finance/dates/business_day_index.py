@@ -0,0 +1,155 @@
+from array import array
+from datetime import date
+from py_finance.dates import day_serial
+from py_finance.dates.business_day_convention import BusinessDayConvention
+
+class BusinessDayIndex(object):
+
+    """
+    A precomputed table of the business days of a calendar over a window of
+    whole years.
+
+    Days are addressed by their proleptic Gregorian ordinal (date.toordinal()).
+    For every day in the window the index holds the number of business days
+    strictly before it (a prefix sum), and for every business day its ordinal,
+    so counting and stepping over business days are array lookups.
+
+    The index also holds, for every day, the business day each business day
+    convention adjusts it to, so adjusting is a single array read (two for
+    the nearest business day). A value of 0 marks an adjustment which leaves
+    the window. Queries which leave the window return None so the caller can
+    fall back to walking the calendar.
+    """
+
+    def __init__(self, calendar, year_from, year_to):
+
+        if year_from > year_to:
+            raise ValueError("The first year must not be after the last year")
+
+        self.year_from = year_from
+        self.year_to = year_to
+        self.first = date(year_from, 1, 1).toordinal()
+        self.last = date(year_to, 12, 31).toordinal()
+
+        # counts[i] is the number of business days in [first, first + i).
+        self.counts = array('l', [0])
+        # business_days[k] is the ordinal of the k-th business day in the window.
+        self.business_days = array('l')
+
+        count = 0
+        for year in range(year_from, year_to + 1):
+            holidays = calendar.holiday_bits(year)
+            start = date(year, 1, 1).toordinal()
+            for day in range(calendar.days_in_year(year)):
+                ordinal = start + day
+                if not ((holidays >> day) & 1 or day_serial.is_weekend(ordinal)):
+                    self.business_days.append(ordinal)
+                    count += 1
+                self.counts.append(count)
+
+        days = self.last - self.first + 1
+        self.previous_business_days = array('l', [0]) * days
+        self.next_business_days = array('l', [0]) * days
+        self.modified_previous_business_days = array('l', [0]) * days
+        self.modified_next_business_days = array('l', [0]) * days
+
+        previous_business_day = 0
+        for i in range(days):
+            if self.counts[i + 1] != self.counts[i]:
+                previous_business_day = self.first + i
+            self.previous_business_days[i] = previous_business_day
+
+        next_business_day = 0
+        for i in range(days - 1, -1, -1):
+            if self.counts[i + 1] != self.counts[i]:
+                next_business_day = self.first + i
+            self.next_business_days[i] = next_business_day
+
+        for i in range(days):
+            month = date.fromordinal(self.first + i).month
+            following = self.next_business_days[i]
+            preceding = self.previous_business_days[i]
+            is_following_in_month = following != 0 and date.fromordinal(following).month == month
+            is_preceding_in_month = preceding != 0 and date.fromordinal(preceding).month == month
+            self.modified_next_business_days[i] = following if is_following_in_month or following == 0 else preceding
+            self.modified_previous_business_days[i] = preceding if is_preceding_in_month or preceding == 0 else following
+
+        self.__adjustments = {
+            BusinessDayConvention.following: self.next_business_days,
+            BusinessDayConvention.preceding: self.previous_business_days,
+            BusinessDayConvention.modified_following: self.modified_next_business_days,
+            BusinessDayConvention.modified_preceding: self.modified_previous_business_days
+        }
+
+    def covers(self, ordinal):
+        return self.first <= ordinal <= self.last
+
+    def is_business_day(self, ordinal):
+        i = ordinal - self.first
+        return self.counts[i + 1] != self.counts[i]
+
+    def add_business_days(self, ordinal, count):
+
+        if not self.covers(ordinal):
+            return None
+
+        i = ordinal - self.first
+
+        if count > 0:
+            # The business days strictly after the date start at counts[i + 1].
+            k = self.counts[i + 1] + count - 1
+        elif count < 0:
+            # The business days strictly before the date end at counts[i] - 1.
+            k = self.counts[i] + count
+        else:
+            return ordinal
+
+        if 0 <= k < len(self.business_days):
+            return self.business_days[k]
+        else:
+            return None
+
+    def business_day_count(self, start, end):
+
+        """
+        Returns the number of business days in [start, end), or None if the
+        range is not within the window.
+        """
+
+        if start < self.first or end > self.last + 1 or start > end:
+            return None
+
+        return self.counts[end - self.first] - self.counts[start - self.first]
+
+    def adjust(self, ordinal, convention):
+
+        if not self.covers(ordinal):
+            return None
+
+        if convention == BusinessDayConvention.none:
+            return ordinal
+        elif convention == BusinessDayConvention.nerarest:
+            return self.nearest_business_day(ordinal)
+
+        adjusted = self.__adjustments[convention][ordinal - self.first]
+        return adjusted if adjusted != 0 else None
+
+    def nearest_business_day(self, ordinal, prefer_forward = True):
+
+        if not self.covers(ordinal):
+            return None
+
+        i = ordinal - self.first
+        following = self.next_business_days[i]
+        preceding = self.previous_business_days[i]
+
+        if following == 0 or preceding == 0:
+            return None
+
+        forward_distance = following - ordinal
+        backward_distance = ordinal - preceding
+
+        if forward_distance < backward_distance or (forward_distance == backward_distance and prefer_forward):
+            return following
+        else:
+            return preceding
@@ -2,33 +2,126 @@ from datetime import date, timedelta
 from py_finance.dates.day_of_week import DayOfWeek
 from py_finance.dates.business_day_convention import BusinessDayConvention
 from py_finance.dates.time_unit import TimeUnit
+from py_finance.dates.business_day_index import BusinessDayIndex
+from py_finance.dates.period_ends import PeriodEnds
+from py_finance.dates import day_serial
 from py_cal_cal import pycalcal
 
 class Calendar(object):
     
+    __index = None
+    __period_ends = None
+    
+    def build_index(self, year_from, year_to):
+        
+        """
+        Precomputes the business days between the start of year_from and the
+        end of year_to. Business day lookups inside the window become array
+        lookups; those outside it walk the calendar as before.
+        """
+        
+        self.__index = BusinessDayIndex(self, year_from, year_to)
+        return self.__index
+    
+    def clear_index(self):
+        self.__index = None
+    
+    @property
+    def index(self):
+        return self.__index
+    
+    def holidays_changed(self):
+        
+        """
+        Rebuilds what the calendar derives from its holidays, for calendars
+        whose holidays change. The index is rebuilt over the same window and
+        the period end table is recreated on next use.
+        """
+        
+        index = self.__index
+        if index is not None:
+            self.__index = BusinessDayIndex(self, index.year_from, index.year_to)
+        self.__period_ends = None
+    
+    def period_ends(self):
+        
+        """
+        Returns the table of month ends, quarter ends and IMM dates of the
+        calendar, created on first use. See py_finance.dates.period_ends.
+        """
+        
+        if self.__period_ends is None:
+            self.__period_ends = PeriodEnds(self)
+        return self.__period_ends
+    
     def is_holiday(self, value):
         return False
+    
+    def is_holiday_ordinal(self, ordinal):
+        
+        """
+        Returns whether the day serial (date.toordinal()) is a holiday.
+        Calendars which hold their holidays as day serials override this so
+        no date is created.
+        """
+        
+        return self.is_holiday(date.fromordinal(ordinal))
+    
+    def holiday_bits(self, year):
+        
+        """
+        Returns the holidays of the given year as an integer bitset, where
+        bit n is set if the day n days after 1 January is a holiday.
+        """
+        
+        bits = 0
+        start = day_serial.year_start(year)
+        for day in range(self.days_in_year(year)):
+            if self.is_holiday_ordinal(start + day):
+                bits |= 1 << day
+        return bits
         
     def is_business_day(self, value):
+        index = self.__index
+        if index is not None:
+            ordinal = value.toordinal()
+            if index.covers(ordinal):
+                return index.is_business_day(ordinal)
         return not (self.is_weekend(value) or self.is_holiday(value))
+    
+    def is_business_day_ordinal(self, ordinal):
+        index = self.__index
+        if index is not None and index.covers(ordinal):
+            return index.is_business_day(ordinal)
+        # Saturdays and Sundays are tested inline as this is the innermost
+        # step of every business day walk.
+        return (ordinal + 6) % 7 < DayOfWeek.saturday and not self.is_holiday_ordinal(ordinal)
 
     def nearest_business_day(self, target_date, prefer_forward = True):
-        if self.is_business_day(target_date):
-            return target_date
+        return date.fromordinal(self.nearest_business_day_ordinal(target_date.toordinal(), prefer_forward))
+    
+    def nearest_business_day_ordinal(self, ordinal, prefer_forward = True):
+        index = self.__index
+        if index is not None:
+            nearest = index.nearest_business_day(ordinal, prefer_forward)
+            if nearest is not None:
+                return nearest
+        
+        if self.is_business_day_ordinal(ordinal):
+            return ordinal
         
-        one_day = timedelta(1)
-        forward_date = target_date + one_day
-        backward_date = target_date - one_day
+        forward = ordinal + 1
+        backward = ordinal - 1
         
         while True:
-            is_forward_ok = self.is_business_day(forward_date)
-            is_backward_ok = self.is_business_day(backward_date)
+            is_forward_ok = self.is_business_day_ordinal(forward)
+            is_backward_ok = self.is_business_day_ordinal(backward)
             if is_forward_ok and (prefer_forward or not is_backward_ok):
-                return forward_date
+                return forward
             elif is_backward_ok:
-                return backward_date
-            forward_date += one_day
-            backward_date -= one_day
+                return backward
+            forward += 1
+            backward -= 1
         
     def adjust(self, target_date, convention = BusinessDayConvention.following):
         
@@ -39,40 +132,132 @@ class Calendar(object):
         
         if convention == BusinessDayConvention.none or self.is_business_day(target_date):
             return target_date
-        elif convention == BusinessDayConvention.following:
-            return self.add_business_days(target_date, 1)
+        
+        return date.fromordinal(self.__adjust(target_date.toordinal(), convention, target_date.day, target_date.month, target_date.year))
+    
+    def adjust_ordinal(self, ordinal, convention = BusinessDayConvention.following):
+        
+        if convention == BusinessDayConvention.none or self.is_business_day_ordinal(ordinal):
+            return ordinal
+        
+        return self.__adjust(ordinal, convention)
+    
+    def __adjust(self, ordinal, convention, day = None, month = None, year = None):
+        
+        """
+        Adjusts a day serial which is not a business day. The modified
+        conventions need the day, month and year of the day serial, which
+        are computed if not given.
+        """
+        
+        index = self.__index
+        if index is not None:
+            adjusted = index.adjust(ordinal, convention)
+            if adjusted is not None:
+                return adjusted
+        
+        if convention == BusinessDayConvention.following:
+            return self.add_business_days_ordinal(ordinal, 1)
         elif convention == BusinessDayConvention.preceding:
-            return self.add_business_days(target_date, -1)
+            return self.add_business_days_ordinal(ordinal, -1)
         elif convention == BusinessDayConvention.modified_following:
-            adjusted_date = self.add_business_days(target_date, 1)
+            adjusted = self.add_business_days_ordinal(ordinal, 1)
+            if day is None:
+                year, month, day = day_serial.year_month_day(ordinal)
             
-            if adjusted_date.month == target_date.month:
-                return adjusted_date
+            if adjusted <= ordinal - day + day_serial.days_in_month(year, month):
+                return adjusted
             else:
-                return self.add_business_days(target_date, -1)
+                return self.add_business_days_ordinal(ordinal, -1)
         elif convention == BusinessDayConvention.modified_preceding:
-            adjusted_date = self.add_business_days(target_date, -1)
+            adjusted = self.add_business_days_ordinal(ordinal, -1)
+            if day is None:
+                day = day_serial.year_month_day(ordinal)[2]
             
-            if adjusted_date.month == target_date.month:
-                return adjusted_date
+            if adjusted > ordinal - day:
+                return adjusted
             else:
-                return self.add_business_days(target_date, 1)
+                return self.add_business_days_ordinal(ordinal, 1)
+        elif convention == BusinessDayConvention.nerarest:
+            return self.nearest_business_day_ordinal(ordinal)
         else:
             raise ValueError("Invalid business day convention")
     
     def add_business_days(self, target_date, count):
+        return date.fromordinal(self.add_business_days_ordinal(target_date.toordinal(), count))
+    
+    def add_business_days_ordinal(self, ordinal, count):
+        
+        index = self.__index
+        if index is not None:
+            result = index.add_business_days(ordinal, count)
+            if result is not None:
+                return result
         
         sign = 1 if count > 0 else -1
-        signed_day = timedelta(sign)
         
         while count != 0:
-            target_date += signed_day
+            ordinal += sign
             count -= sign
             
-            while not self.is_business_day(target_date):
-                target_date += signed_day
+            while not self.is_business_day_ordinal(ordinal):
+                ordinal += sign
         
-        return target_date
+        return ordinal
+
+    def business_days(self, start, end, step = 1):
+        
+        """
+        Yields every step-th business day from start (inclusive) to end
+        (exclusive), starting with the first.
+        """
+        
+        for ordinal in self.business_day_ordinals(start.toordinal(), end.toordinal(), step):
+            yield date.fromordinal(ordinal)
+    
+    def business_day_ordinals(self, start, end, step = 1):
+        
+        if step <= 0:
+            raise ValueError("The step must be positive")
+        if start >= end:
+            return
+        
+        index = self.__index
+        if index is not None and index.covers(start) and index.covers(end - 1):
+            for ordinal in index.business_days[index.counts[start - index.first]:index.counts[end - index.first]:step]:
+                yield ordinal
+            return
+        
+        # Take the business days of each year from its holidays and weekends
+        # as a bitset, jumping from one set bit to the next.
+        skip = 0
+        year = day_serial.year_of(start)
+        first = day_serial.year_start(year)
+        while first < end:
+            days = self.days_in_year(year)
+            lower = max(start - first, 0)
+            upper = min(end - first, days)
+            business = ~(self.holiday_bits(year) | day_serial.weekend_bits(year)) & ((1 << upper) - (1 << lower))
+            while business:
+                lowest = business & -business
+                business ^= lowest
+                if skip == 0:
+                    yield first + lowest.bit_length() - 1
+                    skip = step - 1
+                else:
+                    skip -= 1
+            year += 1
+            first += days
+    
+    def business_days_array(self, start, end):
+        
+        """
+        Returns the business days from start (inclusive) to end (exclusive)
+        as a datetime64[D] array. See py_finance.dates.batch.
+        """
+        
+        from py_finance.dates import batch
+        return batch.from_ordinals(batch.business_day_ordinals_between(self, start.toordinal(), end.toordinal()), True)
 
     def add_weeks(self, target_date, count, convention = BusinessDayConvention.following):
             d1 = target_date + timedelta(count * 7)
@@ -98,21 +283,83 @@ class Calendar(object):
             return self.adjust(self.add_months(target_date, 12 * count, end_of_month), convention)
         else:
             raise ValueError("Unhandled TimeUnit")
+    
+    def advance_ordinal(self, ordinal, count, unit, convention = BusinessDayConvention.following, end_of_month = False):
+        
+        if count == 0:
+            return self.adjust_ordinal(ordinal, convention)
+        elif unit == TimeUnit.days:
+            return self.add_business_days_ordinal(ordinal, count)
+        elif unit == TimeUnit.weeks:
+            return self.adjust_ordinal(ordinal + 7 * count, convention)
+        elif unit == TimeUnit.months:
+            return self.adjust_ordinal(day_serial.add_months(ordinal, count, end_of_month), convention)
+        elif unit == TimeUnit.years:
+            return self.adjust_ordinal(day_serial.add_months(ordinal, 12 * count, end_of_month), convention)
+        else:
+            raise ValueError("Unhandled TimeUnit")
+        
+    def adjust_many(self, dates, convention = BusinessDayConvention.following):
+        
+        """
+        Adjusts an array of datetime64[D] dates or integer day serials.
+        See py_finance.dates.batch.
+        """
+        
+        from py_finance.dates import batch
+        return batch.adjust_many(self, dates, convention)
+    
+    def add_business_days_many(self, dates, count):
+        from py_finance.dates import batch
+        return batch.add_business_days_many(self, dates, count)
+    
+    def advance_many(self, dates, count, unit, convention = BusinessDayConvention.following, end_of_month = False):
+        
+        """
+        Advances an array of datetime64[D] dates or integer day serials.
+        See py_finance.dates.batch.
+        """
+        
+        from py_finance.dates import batch
+        return batch.advance_many(self, dates, count, unit, convention, end_of_month)
         
+    def business_day_counts(self, starts, ends):
+        
+        """
+        Returns the business day counts of arrays of datetime64[D] dates or
+        integer day serials, as business_day_count. See py_finance.dates.batch.
+        """
+        
+        from py_finance.dates import batch
+        return batch.business_day_counts(self, starts, ends)
+    
     def business_day_count(self, start, end):
+        
+        """
+        Returns the number of business days from start (inclusive) to end
+        (exclusive). If start is after end the count is negative.
+        """
+
+        return self.business_day_count_ordinal(start.toordinal(), end.toordinal())
+    
+    def business_day_count_ordinal(self, start, end):
 
         if start > end:
-            return self.business_days_between(end, start)
-        else:
-            days = 0
-            one_day = timedelta(1)
-            target_date = date(start.year, start.month, start.day)
-            while start < end:
-                while not self.is_business_day(target_date):
-                    target_date += one_day
-                target_date += one_day
+            return -self.business_day_count_ordinal(end, start)
+        
+        index = self.__index
+        if index is not None:
+            days = index.business_day_count(start, end)
+            if days is not None:
+                return days
+
+        days = 0
+        ordinal = start
+        while ordinal < end:
+            if self.is_business_day_ordinal(ordinal):
                 days += 1
-            return days
+            ordinal += 1
+        return days
 
     @classmethod
     def is_leap_year(cls, year):
@@ -126,7 +373,7 @@ class Calendar(object):
     
     @classmethod
     def days_in_year(cls, year):
-        return 366 if cls.isLeapYear(year) else 365
+        return 366 if cls.is_leap_year(year) else 365
 
     @classmethod
     def is_weekend(cls, target_date):
@@ -142,16 +389,8 @@ class Calendar(object):
         if months == 0:
             return target_date
         
-        month = target_date.month + months;
-        year = target_date.year
-
-        if months > 0:
-            year += month // 12
-            month = month % 12
-        else:
-            if month <= 0:
-                year += -month // 12 - 1
-                month %= 12
+        year, month = divmod(target_date.year * 12 + target_date.month - 1 + months, 12)
+        month += 1
 
         days_in_month = cls.days_in_month(year, month)
     
@@ -160,6 +399,21 @@ class Calendar(object):
         else:
             return date(year, month, min(target_date.day, days_in_month))
     
+    @classmethod
+    def add_months_ordinal(cls, ordinal, months, end_of_month = False):
+        return day_serial.add_months(ordinal, months, end_of_month)
+    
+    @classmethod
+    def add_months_many(cls, dates, months, end_of_month = False):
+        
+        """
+        Adds months to an array of datetime64[D] dates or integer day serials,
+        as add_months. See py_finance.dates.batch.
+        """
+        
+        from py_finance.dates import batch
+        return batch.add_months_many(dates, months, end_of_month)
+    
     @classmethod
     def end_of_month(cls, year, month):
         return date(year, month, cls.days_in_month(year, month))
@@ -0,0 +1,144 @@
+"""
+Instrumentation of calendars.
+
+instrument(calendar) replaces the calendar's business day and holiday
+methods on that instance with wrappers counting the calls and timing them.
+Calendars which are not instrumented run the plain methods, so the
+instrumentation costs nothing until it is switched on, and remove() puts
+the plain methods back.
+
+The counts are not synchronised, so they are approximate when the calendar
+is shared between threads. flush() passes the counts, times and holiday
+cache hits and misses since the last flush, and the number of years cached,
+to a sink, a function taking a metric name and a value in the style of a
+statsd client:
+
+    instrumentation = instrument(get_calendar("UK"), sink = statsd.gauge)
+    ...
+    instrumentation.flush()
+"""
+
+import timeit
+from collections import namedtuple
+
+MethodStatistics = namedtuple("MethodStatistics", ["calls", "seconds"])
+
+METHODS = (
+    "is_holiday",
+    "is_holiday_ordinal",
+    "is_business_day",
+    "is_business_day_ordinal",
+    "adjust",
+    "advance",
+    "add_business_days",
+    "business_day_count",
+    "holiday_bits",
+    "fetch_holidays"
+)
+
+class CalendarInstrumentation(object):
+
+    def __init__(self, calendar, sink = None, methods = METHODS, prefix = None, timer = timeit.default_timer):
+
+        self.calendar = calendar
+        self.sink = sink
+        self.prefix = prefix or "calendar." + (getattr(calendar, "name", None) or type(calendar).__name__)
+        self.timer = timer
+        self.__calls = {}
+        self.__seconds = {}
+        self.__year_seconds = {}
+        # The cache hits and misses at the last flush or reset.
+        self.__cache_counts = self.__current_cache_counts()
+        self.__methods = [name for name in methods if hasattr(calendar, name)]
+
+        for name in self.__methods:
+            self.__calls[name] = 0
+            self.__seconds[name] = 0.0
+            setattr(calendar, name, self.__wrap(name, getattr(calendar, name)))
+
+    def __wrap(self, name, method):
+
+        calls = self.__calls
+        seconds = self.__seconds
+        year_seconds = self.__year_seconds
+        timer = self.timer
+
+        if name == "fetch_holidays":
+            # The time to generate each year is kept separately.
+            def fetch_holidays(year):
+                start = timer()
+                try:
+                    return method(year)
+                finally:
+                    elapsed = timer() - start
+                    calls[name] += 1
+                    seconds[name] += elapsed
+                    year_seconds[year] = year_seconds.get(year, 0.0) + elapsed
+            return fetch_holidays
+
+        def wrapper(*args, **kwargs):
+            start = timer()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                calls[name] += 1
+                seconds[name] += timer() - start
+        return wrapper
+
+    def statistics(self):
+        """Returns the MethodStatistics of each instrumented method by name."""
+        return dict((name, MethodStatistics(self.__calls[name], self.__seconds[name])) for name in self.__methods)
+
+    def fetch_seconds(self):
+        """Returns the time spent fetching the holidays of each year."""
+        return dict(self.__year_seconds)
+
+    def cache_statistics(self):
+        """Returns the calendar's holiday cache statistics, or None if it has no cache."""
+        cache_statistics = getattr(self.calendar, "cache_statistics", None)
+        return cache_statistics() if cache_statistics is not None else None
+
+    def reset(self):
+        for name in self.__methods:
+            self.__calls[name] = 0
+            self.__seconds[name] = 0.0
+        self.__year_seconds.clear()
+        self.__cache_counts = self.__current_cache_counts()
+
+    def flush(self):
+
+        """
+        Passes the counts, times and cache hits and misses since the last
+        flush to the sink, with the number of years cached, then resets the
+        counts.
+        """
+
+        if self.sink is not None:
+            for name, statistics in sorted(self.statistics().items()):
+                self.sink("{0}.{1}.calls".format(self.prefix, name), statistics.calls)
+                self.sink("{0}.{1}.seconds".format(self.prefix, name), statistics.seconds)
+            cache_statistics = self.cache_statistics()
+            if cache_statistics is not None:
+                hits, misses = self.__cache_counts
+                # Clearing the cache restarts its counts.
+                self.sink(self.prefix + ".cache.hits", _since(cache_statistics.hits, hits))
+                self.sink(self.prefix + ".cache.misses", _since(cache_statistics.misses, misses))
+                self.sink(self.prefix + ".cache.years", len(cache_statistics.cached_years))
+        self.reset()
+
+    def __current_cache_counts(self):
+        cache_statistics = self.cache_statistics()
+        return (cache_statistics.hits, cache_statistics.misses) if cache_statistics is not None else (0, 0)
+
+    def remove(self):
+        """Restores the calendar's plain methods."""
+        for name in self.__methods:
+            if name in vars(self.calendar):
+                delattr(self.calendar, name)
+        self.__methods = []
+
+def _since(count, previous):
+    return count - previous if count >= previous else count
+
+def instrument(calendar, sink = None, methods = METHODS, prefix = None):
+    return CalendarInstrumentation(calendar, sink, methods, prefix)
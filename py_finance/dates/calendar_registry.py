@@ -0,0 +1,82 @@
+"""
+Calendars by name.
+
+get_calendar returns the calendar registered under a name, such as "UK",
+"TARGET" or "US-NYSE". Names joined with "+", such as "UK+TARGET", give a
+joint calendar whose holidays are the holidays of any of the calendars.
+
+A calendar's module is imported the first time it is asked for, and the
+same instance is returned on every lookup, so its holiday cache is shared
+by everything using the calendar.
+"""
+
+import importlib
+import threading
+from py_finance.dates.joint_calendar import JointCalendar
+from py_finance.dates.joint_calendar_rule import JointCalendarRule
+
+_registry = {
+    "UK": ("py_finance.dates.calendars.united_kingdom", "UnitedKingdom"),
+    "TARGET": ("py_finance.dates.calendars.target", "Target"),
+    "US-Settlement": ("py_finance.dates.calendars.united_states", "UnitedStatesSettlement"),
+    "US-NYSE": ("py_finance.dates.calendars.united_states", "UnitedStatesNyse"),
+    "US-GovtBond": ("py_finance.dates.calendars.united_states", "UnitedStatesGovernmentBond"),
+    "US-NERC": ("py_finance.dates.calendars.united_states", "UnitedStatesNerc")
+}
+
+_calendars = {}
+_lock = threading.RLock()
+
+def register_calendar(name, factory):
+
+    """
+    Registers a calendar under a name. The factory is either a callable
+    returning the calendar, or a (module name, class name) pair which is
+    imported on first lookup.
+    """
+
+    if "+" in name:
+        raise ValueError("Calendar names may not contain '+'")
+
+    with _lock:
+        _registry[name] = factory
+        _calendars.pop(name, None)
+
+def unregister_calendar(name):
+    with _lock:
+        del _registry[name]
+        _calendars.pop(name, None)
+
+def calendar_names():
+    return sorted(_registry)
+
+def get_calendar(name):
+
+    """
+    Returns the calendar with the given name, creating it on first use.
+    """
+
+    calendar = _calendars.get(name)
+    if calendar is not None:
+        return calendar
+
+    with _lock:
+        calendar = _calendars.get(name)
+        if calendar is None:
+            calendar = _calendars[name] = _create(name)
+        return calendar
+
+def _create(name):
+
+    if "+" in name:
+        return JointCalendar([get_calendar(part) for part in name.split("+")], JointCalendarRule.join_holidays, name)
+
+    factory = _registry.get(name)
+    if factory is None:
+        raise ValueError("Unknown calendar: " + name)
+
+    if isinstance(factory, tuple):
+        module_name, class_name = factory
+        factory = getattr(importlib.import_module(module_name), class_name)
+
+    return factory()
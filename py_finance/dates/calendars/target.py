@@ -1,40 +1,21 @@
-from datetime import timedelta, date
-from py_finance.dates.business_day_convention import BusinessDayConvention
-from py_finance.dates.yearly_calendar import YearlyCalendar
-from py_finance.dates.calendar import Calendar
+from py_finance.dates.calendar_month import JulianMonth
+from py_finance.dates.holiday_rules import compile_holiday_rules, FixedDate, EasterOffset
+from py_finance.dates.observance import Observance
+from py_finance.dates.rule_calendar import RuleCalendar
 
-class Target(YearlyCalendar):
+RULES = [
+    FixedDate("New Year's Day", JulianMonth.january, 1, Observance.following),
+    EasterOffset("Good Friday", -2, year_from = 2000),
+    EasterOffset("Easter Monday", 1, year_from = 2000),
+    FixedDate("Labour Day", JulianMonth.may, 1, year_from = 2000),
+    FixedDate("Christmas", JulianMonth.december, 25),
+    FixedDate("Day of Goodwill", JulianMonth.december, 26, year_from = 2000),
+    FixedDate("New Year's Eve", JulianMonth.december, 31, years = (1998, 1999, 2001))
+]
 
-    def __init__(self, params):
-        YearlyCalendar.__init__(self, "TARGET")
+class Target(RuleCalendar):
 
-    def fetch_holidays(self, year):
-        self.__generate_holidays(year)
-    
-    @classmethod
-    def __generate_holidays(cls, year):
-        
-        empty = Calendar()
-        
-        # New Year's Day
-        yield empty.adjust(date(year, 1, 1), BusinessDayConvention.following)
-        
-        if year >= 2000:
-            # Good Friday and Easter Monday
-            easter_monday = empty.easter(year);
-            yield easter_monday + timedelta(-3)
-            yield easter_monday
-            
-        if year >= 2000:
-            # Labour Day
-            yield date(year, 5, 1)
+    evaluator = compile_holiday_rules(RULES)
 
-        # Christmas
-        yield date(year, 12, 25)
-
-        if year >= 2000:
-            # Day of Goodwill
-            yield date(year, 12, 26)
-
-        if year == 1998 or year == 1999 or year == 2001:
-            yield date(year, 12, 31)
+    def __init__(self):
+        RuleCalendar.__init__(self, "TARGET", self.evaluator)
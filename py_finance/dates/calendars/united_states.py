@@ -1,252 +1,170 @@
-from datetime import date, timedelta
-from py_finance.dates.calendar import Calendar
+from datetime import date, time, timedelta
 from py_finance.dates.calendar_month import JulianMonth
 from py_finance.dates.day_of_week import DayOfWeek
-from py_finance.dates.yearly_calendar import YearlyCalendar
-
-class UnitedStatesSettlement(YearlyCalendar):
+from py_finance.dates.holiday_rules import compile_holiday_rules, FixedDate, NthWeekday, LastWeekday, EasterOffset, OneOff
+from py_finance.dates.observance import Observance
+from py_finance.dates.rule_calendar import RuleCalendar
+from py_finance.dates.trading_session_calendar import TradingSessionCalendar
+
+SETTLEMENT_RULES = [
+    # New Year's Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("New Year's Day", JulianMonth.january, 1, Observance.nearest),
+    # Martin Luther King's birthday (third Monday in January)
+    NthWeekday("Martin Luther King's birthday", JulianMonth.january, 3, DayOfWeek.monday),
+    # Washington's birthday (third Monday in February)
+    NthWeekday("Washington's birthday", JulianMonth.february, 3, DayOfWeek.monday),
+    # Memorial Day (last Monday in May)
+    LastWeekday("Memorial Day", JulianMonth.may, DayOfWeek.monday),
+    # Independence Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("Independence Day", JulianMonth.july, 4, Observance.nearest),
+    # Labor Day (first Monday in September)
+    NthWeekday("Labor Day", JulianMonth.september, 1, DayOfWeek.monday),
+    # Columbus Day (second Monday in October)
+    NthWeekday("Columbus Day", JulianMonth.october, 2, DayOfWeek.monday),
+    # Veteran's Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("Veteran's Day", JulianMonth.november, 11, Observance.nearest),
+    # Thanksgiving Day (fourth Thursday in November)
+    NthWeekday("Thanksgiving Day", JulianMonth.november, 4, DayOfWeek.thursday),
+    # Christmas (Monday if Sunday or Friday if Saturday)
+    FixedDate("Christmas", JulianMonth.december, 25, Observance.nearest)
+]
+
+def _wednesdays(first, last):
+    while first <= last:
+        yield first
+        first += timedelta(7)
+
+NYSE_RULES = [
+    # New Year's Day (possibly moved to Monday if on Sunday)
+    FixedDate("New Year's Day", JulianMonth.january, 1, Observance.sunday_to_monday),
+    # Washington's birthday (third Monday in February)
+    NthWeekday("Washington's birthday", JulianMonth.february, 3, DayOfWeek.monday),
+    EasterOffset("Good Friday", -2),
+    # Memorial Day (last Monday in May)
+    LastWeekday("Memorial Day", JulianMonth.may, DayOfWeek.monday),
+    # Independence Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("Independence Day", JulianMonth.july, 4, Observance.nearest),
+    # Labor Day (first Monday in September)
+    NthWeekday("Labor Day", JulianMonth.september, 1, DayOfWeek.monday),
+    # Thanksgiving Day (fourth Thursday in November)
+    NthWeekday("Thanksgiving Day", JulianMonth.november, 4, DayOfWeek.thursday),
+    # Christmas (Monday if Sunday or Friday if Saturday)
+    FixedDate("Christmas", JulianMonth.december, 25, Observance.nearest),
+    # Martin Luther King's birthday (third Monday in January)
+    NthWeekday("Martin Luther King's birthday", JulianMonth.january, 3, DayOfWeek.monday, year_from = 1998),
+    # Presidential election days
+    NthWeekday("Presidential election day", JulianMonth.november, 1, DayOfWeek.tuesday, True, year_to = 1968),
+    NthWeekday("Presidential election day (quadrennial)", JulianMonth.november, 1, DayOfWeek.tuesday, True, years = range(1972, 1981, 4)),
+
+    # Special closings
+    OneOff("Hurricane Sandy", [date(2012, JulianMonth.october, 29), date(2012, JulianMonth.october, 30)]),
+    OneOff("President Ford's funeral", [date(2007, JulianMonth.january, 2)]),
+    OneOff("President Reagan's funeral", [date(2004, JulianMonth.june, 11)]),
+    OneOff("September 11-14, 2001", [date(2001, JulianMonth.september, day) for day in range(11, 15)]),
+    OneOff("President Nixon's funeral", [date(1994, JulianMonth.april, 27)]),
+    OneOff("Hurricane Gloria", [date(1985, JulianMonth.september, 27)]),
+    OneOff("1977 Blackout", [date(1977, JulianMonth.july, 14)]),
+    OneOff("Funeral of former President Lyndon B. Johnson", [date(1973, JulianMonth.january, 25)]),
+    OneOff("Funeral of former President Harry S. Truman", [date(1972, JulianMonth.december, 28)]),
+    OneOff("National Day of Participation for the lunar exploration", [date(1969, JulianMonth.july, 21)]),
+    OneOff("Funeral of former President Eisenhower", [date(1969, JulianMonth.march, 31)]),
+    OneOff("Closed all day - heavy snow", [date(1969, JulianMonth.february, 10)]),
+    OneOff("Day after Independence Day", [date(1968, JulianMonth.july, 5)]),
+    # June 12-Dec. 31, 1968
+    # Four day week (closed on Wednesdays) - Paperwork Crisis
+    OneOff("Paperwork Crisis", _wednesdays(date(1968, JulianMonth.june, 12), date(1968, JulianMonth.december, 31))),
+    OneOff("Day of mourning for Martin Luther King Jr.", [date(1968, JulianMonth.april, 9)]),
+    OneOff("Funeral of President Kennedy", [date(1963, JulianMonth.november, 25)]),
+    OneOff("Day before Decoration Day", [date(1961, JulianMonth.may, 29)]),
+    OneOff("Day after Christmas", [date(1958, JulianMonth.december, 26)]),
+    OneOff("Christmas Eve", [date(year, JulianMonth.december, 24) for year in (1954, 1956, 1965)])
+]
+
+GOVERNMENT_BOND_RULES = [
+    # New Year's Day (possibly moved to Monday if on Sunday)
+    FixedDate("New Year's Day", JulianMonth.january, 1, Observance.sunday_to_monday),
+    # Martin Luther King's birthday (third Monday in January)
+    NthWeekday("Martin Luther King's birthday", JulianMonth.january, 3, DayOfWeek.monday),
+    # Washington's birthday (third Monday in February)
+    NthWeekday("Washington's birthday", JulianMonth.february, 3, DayOfWeek.monday),
+    EasterOffset("Good Friday", -2),
+    # Memorial Day (last Monday in May)
+    LastWeekday("Memorial Day", JulianMonth.may, DayOfWeek.monday),
+    # Independence Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("Independence Day", JulianMonth.july, 4, Observance.nearest),
+    # Labor Day (first Monday in September)
+    NthWeekday("Labor Day", JulianMonth.september, 1, DayOfWeek.monday),
+    # Columbus Day (second Monday in October)
+    NthWeekday("Columbus Day", JulianMonth.october, 2, DayOfWeek.monday),
+    # Veteran's Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("Veteran's Day", JulianMonth.november, 11, Observance.nearest),
+    # Thanksgiving Day (fourth Thursday in November)
+    NthWeekday("Thanksgiving Day", JulianMonth.november, 4, DayOfWeek.thursday),
+    # Christmas (Monday if Sunday or Friday if Saturday)
+    FixedDate("Christmas", JulianMonth.december, 25, Observance.nearest)
+]
+
+NERC_RULES = [
+    # New Year's Day (possibly moved to Monday if on Sunday)
+    FixedDate("New Year's Day", JulianMonth.january, 1, Observance.sunday_to_monday),
+    # Memorial Day (last Monday in May)
+    LastWeekday("Memorial Day", JulianMonth.may, DayOfWeek.monday),
+    # Independence Day (Monday if Sunday or Friday if Saturday)
+    FixedDate("Independence Day", JulianMonth.july, 4, Observance.nearest),
+    # Labor Day (first Monday in September)
+    NthWeekday("Labor Day", JulianMonth.september, 1, DayOfWeek.monday),
+    # Thanksgiving Day (fourth Thursday in November)
+    NthWeekday("Thanksgiving Day", JulianMonth.november, 4, DayOfWeek.thursday),
+    # Christmas (Monday if Sunday or Friday if Saturday)
+    FixedDate("Christmas", JulianMonth.december, 25, Observance.nearest)
+]
+
+# The regular NYSE early closes at 1pm. A rule falling on a holiday or a
+# weekend is ignored, so the day before Independence Day is only an early
+# close when Independence Day is not observed on it.
+NYSE_EARLY_CLOSE_RULES = [
+    FixedDate("Day before Independence Day", JulianMonth.july, 3, year_from = 1996),
+    NthWeekday("Day after Thanksgiving", JulianMonth.november, 4, DayOfWeek.thursday, days_after = 1, year_from = 1993),
+    FixedDate("Christmas Eve", JulianMonth.december, 24, year_from = 1993)
+]
+
+class UnitedStatesSettlement(RuleCalendar):
+
+    evaluator = compile_holiday_rules(SETTLEMENT_RULES)
 
     def __init__(self):
-        YearlyCalendar.__init__(self, "US-Settlement")
-    
-    def fetch_holidays(self, year):
-        self.__generate_holidays(year)
-    
-    @classmethod
-    def __generate_holidays(cls, year):
-        
-        empty = Calendar()
-        
-        # New Year's Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.january, 1))
-        
-        # Martin Luther King's birthday (third Monday in January)
-        yield Calendar.add_nth_day_of_week(date(year, JulianMonth.january, 1), 3, DayOfWeek.monday, False)
-        
-        # Washington's birthday (third Monday in February)
-        yield Calendar.add_nth_day_of_week(date(year, JulianMonth.february, 1), 3, DayOfWeek.monday, False)
-        
-        # Memorial Day (last Monday in May)
-        yield Calendar.add_nth_day_of_week(Calendar.end_of_month(year, JulianMonth.may), -1, DayOfWeek.monday, False)
-        
-        # Independence Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.july, 4))
-
-        # Labor Day (first Monday in September)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.september, 1), 1, DayOfWeek.monday, False)
-
-        # Columbus Day (second Monday in October)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.october, 1), 2, DayOfWeek.monday, False)
-
-        # Veteran's Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.november, 11))
-
-        # Thanksgiving Day (fourth Thursday in November)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.november, 1), 4, DayOfWeek.thursday, False)
-
-        # Christmas (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.december, 25))
-
-class UnitedStatesNyse(YearlyCalendar):
-    
+        RuleCalendar.__init__(self, "US-Settlement", self.evaluator)
+
+class UnitedStatesNyse(RuleCalendar):
+
+    evaluator = compile_holiday_rules(NYSE_RULES)
+
     def __init__(self):
-        YearlyCalendar.__init__(self, "US-NYSE")
-    
-    def fetch_holidays(self, year):
-        return YearlyCalendar.fetch_holidays(self, year)
-    
-    @classmethod
-    def __generatte_holidays(cls, year):
-        
-        empty = Calendar()
-        
-        # New Year's Day (possibly moved to Monday if on Sunday)
-        new_years_day = date(year, JulianMonth.january, 1)
-        yield (new_years_day if new_years_day.weekday() != DayOfWeek.sunday else new_years_day + timedelta(1))
-        
-        # Washington's birthday (third Monday in February)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.february, 1), 3, DayOfWeek.monday, False)
-        
-        # Good Friday
-        yield empty.easter(year) - timedelta(3)
-
-        # Memorial Day (last Monday in May)
-        yield empty.add_nth_day_of_week(empty.end_of_month(year, JulianMonth.may), -1, DayOfWeek.monday, False)
-
-        # Independence Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.july, 4))
-
-        # Labor Day (first Monday in September)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.september, 1), 1, DayOfWeek.monday, False)
-
-        # Thanksgiving Day (fourth Thursday in November)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.november, 1), 4, DayOfWeek.thursday, False)
-
-        # Christmas (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.december, 25))
-
-        if year >= 1998:
-            # Martin Luther King's birthday (third Monday in January)
-            yield Calendar.add_nth_day_of_week(date(year, JulianMonth.january, 1), 3, DayOfWeek.monday, False)
-
-        if year <= 1968 or (year <= 1980 and year % 4 == 0):
-            # Presidential election days
-            yield Calendar.add_nth_day_of_week(date(year, JulianMonth.november, 1), 1, DayOfWeek.tuesday, True)
-
-        # Special closings
-        if year == 2012:
-            # Hurricane Sandy
-            yield date(2012, JulianMonth.october, 29)
-            yield date(2012, JulianMonth.october, 30)
-
-        if year == 2007:
-            # President Ford's funeral
-            yield date(2007, JulianMonth.january, 2)
-        
-        if year == 2004:
-            # President Reagan's funeral
-            yield date(2004, JulianMonth.june, 11)
-        
-        if year == 2001:
-            # September 11-14, 2001
-            yield date(2001, JulianMonth.september, 11)
-            yield date(2001, JulianMonth.september, 12)
-            yield date(2001, JulianMonth.september, 13)
-            yield date(2001, JulianMonth.september, 14)
-            
-        if year == 1994:
-            # President Nixon's funeral
-            yield date(1994, JulianMonth.april, 27)
-            
-        if year == 1985:
-            # Hurricane Gloria
-            yield date(1985, JulianMonth.september, 27)
-            
-        if year == 1977:
-            # 1977 Blackout
-            yield date(1977, JulianMonth.july, 14)
-            
-        if year == 1973:
-            # Funeral of former President Lyndon B. Johnson.
-            yield date(1973, JulianMonth.january, 25)
-            
-        if year == 1972:
-            # Funeral of former President Harry S. Truman
-            yield date(1972, JulianMonth.december, 28)
-            
-        if year == 1969:
-            # National Day of Participation for the lunar exploration.
-            yield date(1969, JulianMonth.july, 21)
-            # Funeral of former President Eisenhower.
-            yield date(1969, JulianMonth.march, 31)
-            # Closed all day - heavy snow.
-            yield date(1969, JulianMonth.february, 10)
-            
-        if year == 1968:
-            # Day after Independence Day.
-            yield date(1968, JulianMonth.july, 5)
-            # June 12-Dec. 31, 1968
-            # Four day week (closed on Wednesdays) - Paperwork Crisis
-            d = date(1968, JulianMonth.june, 12)
-            while d.year == 1968:
-                yield d
-                d += timedelta(7)
-            # Day of mourning for Martin Luther King Jr.
-            yield date(1968, JulianMonth.april, 9)
-        
-        if year == 1963:
-            # Funeral of President Kennedy
-            yield date(1963, JulianMonth.november, 25)
-        
-        if year == 1961:
-            # Day before Decoration Day
-            yield date(1961, JulianMonth.may, 29)
-            
-        if year == 1958:
-            # Day after Christmas
-            yield date(1958, JulianMonth.december, 26)
-            
-        if year == 1954 or year == 1956 or year == 1965:
-            # Christmas Eve
-            yield date(year, JulianMonth.december, 24)
-
-
-class UnitedStatesGovernmentBond(YearlyCalendar):
+        RuleCalendar.__init__(self, "US-NYSE", self.evaluator)
+
+class UnitedStatesNyseSessions(TradingSessionCalendar):
+
+    """
+    The NYSE trading sessions, from 9:30am to 4pm New York time with the
+    regular 1pm early closes.
+    """
+
+    early_close_evaluator = compile_holiday_rules(NYSE_EARLY_CLOSE_RULES)
+
+    def __init__(self, calendar = None):
+        TradingSessionCalendar.__init__(
+            self, calendar or UnitedStatesNyse(), time(9, 30), time(16), time(13), self.early_close_evaluator)
+
+class UnitedStatesGovernmentBond(RuleCalendar):
+
+    evaluator = compile_holiday_rules(GOVERNMENT_BOND_RULES)
 
     def __init__(self):
-        YearlyCalendar.__init__(self, "US-GovtBond")
-    
-    def fetch_holidays(self, year):
-        self.__generate_holidays(year)
-    
-    @classmethod
-    def __generate_holidays(cls, year):
-        
-        empty = Calendar()
-        
-        # New Year's Day (possibly moved to Monday if on Sunday)
-        new_years_day = date(year, JulianMonth.january, 1)
-        yield (new_years_day if new_years_day.weekday() != DayOfWeek.sunday else new_years_day + timedelta(1))
-        
-        # Martin Luther King's birthday (third Monday in January)
-        yield Calendar.add_nth_day_of_week(date(year, JulianMonth.january, 1), 3, DayOfWeek.monday, False)
-        
-        # Washington's birthday (third Monday in February)
-        yield Calendar.add_nth_day_of_week(date(year, JulianMonth.february, 1), 3, DayOfWeek.monday, False)
-        
-        # Good Friday
-        yield empty.easter(year) - timedelta(3)
-
-        # Memorial Day (last Monday in May)
-        yield Calendar.add_nth_day_of_week(Calendar.end_of_month(year, JulianMonth.may), -1, DayOfWeek.monday, False)
-        
-        # Independence Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.july, 4))
-
-        # Labor Day (first Monday in September)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.september, 1), 1, DayOfWeek.monday, False)
-
-        # Columbus Day (second Monday in October)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.october, 1), 2, DayOfWeek.monday, False)
-
-        # Veteran's Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.november, 11))
-
-        # Thanksgiving Day (fourth Thursday in November)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.november, 1), 4, DayOfWeek.thursday, False)
-
-        # Christmas (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.december, 25))
-
-
-class UnitedStatesNerc(YearlyCalendar):
+        RuleCalendar.__init__(self, "US-GovtBond", self.evaluator)
+
+class UnitedStatesNerc(RuleCalendar):
+
+    evaluator = compile_holiday_rules(NERC_RULES)
 
     def __init__(self):
-        YearlyCalendar.__init__(self, "US-NERC")
-    
-    def fetch_holidays(self, year):
-        self.__generate_holidays(year)
-    
-    @classmethod
-    def __generate_holidays(cls, year):
-        
-        empty = Calendar()
-        
-        # New Year's Day (possibly moved to Monday if on Sunday)
-        new_years_day = date(year, JulianMonth.january, 1)
-        yield (new_years_day if new_years_day.weekday() != DayOfWeek.sunday else new_years_day + timedelta(1))
-        
-        # Memorial Day (last Monday in May)
-        yield Calendar.add_nth_day_of_week(Calendar.end_of_month(year, JulianMonth.may), -1, DayOfWeek.monday, False)
-        
-        # Independence Day (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.july, 4))
-
-        # Labor Day (first Monday in September)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.september, 1), 1, DayOfWeek.monday, False)
-
-        # Thanksgiving Day (fourth Thursday in November)
-        yield empty.add_nth_day_of_week(date(year, JulianMonth.november, 1), 4, DayOfWeek.thursday, False)
-
-        # Christmas (Monday if Sunday or Friday if Saturday)
-        yield empty.nearest_business_day(date(year, JulianMonth.december, 25))
+        RuleCalendar.__init__(self, "US-NERC", self.evaluator)
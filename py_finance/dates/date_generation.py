@@ -0,0 +1,6 @@
+# pip install enum34
+from enum import Enum
+
+class DateGeneration (Enum):
+    backward = 0
+    forward = 1
@@ -0,0 +1,287 @@
+"""
+Day count conventions.
+
+Each convention gives the number of days and the year fraction between two
+dates. The scalar methods take datetime.date values; the array methods
+day_counts and year_fractions take NumPy datetime64[D] arrays or integer day
+serials (see py_finance.dates.batch) and compute a whole accrual table in
+one pass.
+"""
+
+# pip install numpy
+import numpy as np
+from datetime import date
+from py_finance.dates import batch
+from py_finance.dates.calendar import Calendar
+from py_finance.dates.thirty_360_convention import Thirty360Convention
+
+class DayCount(object):
+
+    name = None
+
+    def day_count(self, start, end):
+        return (end - start).days
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+        raise NotImplementedError()
+
+    def day_counts(self, starts, ends):
+        start_ordinals, end_ordinals = self._ordinals(starts, ends)
+        return end_ordinals - start_ordinals
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+        start_ordinals, end_ordinals = self._ordinals(starts, ends)
+        return np.array([
+            self.year_fraction(date.fromordinal(int(start)), date.fromordinal(int(end)))
+            for start, end in zip(start_ordinals, end_ordinals)], dtype=np.float64)
+
+    @classmethod
+    def _ordinals(cls, starts, ends):
+        start_ordinals, _ = batch.to_ordinals(starts)
+        end_ordinals, _ = batch.to_ordinals(ends)
+        return start_ordinals, end_ordinals
+
+    def __str__(self):
+        return self.name
+
+class Actual360(DayCount):
+
+    name = "ACT/360"
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+        return self.day_count(start, end) / 360.0
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+        return self.day_counts(starts, ends) / 360.0
+
+class Actual365Fixed(DayCount):
+
+    name = "ACT/365F"
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+        return self.day_count(start, end) / 365.0
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+        return self.day_counts(starts, ends) / 365.0
+
+class Thirty360(DayCount):
+
+    """
+    The 30/360 conventions.
+
+    bond_basis: a start on the 31st moves to the 30th, and an end on the 31st
+    moves to the 30th if the start is on the 30th or 31st.
+    european (30E/360): any 31st moves to the 30th.
+    isda (30E/360 ISDA): the last day of a month moves to the 30th, except
+    an end in February which is the termination date.
+    """
+
+    __names = {
+        Thirty360Convention.bond_basis: "30/360",
+        Thirty360Convention.european: "30E/360",
+        Thirty360Convention.isda: "30E/360 ISDA"
+    }
+
+    def __init__(self, convention = Thirty360Convention.bond_basis, termination_date = None):
+        self.convention = convention
+        self.termination_date = termination_date
+        self.name = self.__names[convention]
+
+    def day_count(self, start, end):
+
+        d1, d2 = start.day, end.day
+
+        if self.convention == Thirty360Convention.bond_basis:
+            if d1 == 31:
+                d1 = 30
+            if d2 == 31 and d1 >= 30:
+                d2 = 30
+        elif self.convention == Thirty360Convention.european:
+            d1 = min(d1, 30)
+            d2 = min(d2, 30)
+        elif self.convention == Thirty360Convention.isda:
+            if Calendar.is_end_of_month(start):
+                d1 = 30
+            if Calendar.is_end_of_month(end) and not (end == self.termination_date and end.month == 2):
+                d2 = 30
+        else:
+            raise ValueError("Invalid 30/360 convention")
+
+        return 360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+        return self.day_count(start, end) / 360.0
+
+    def day_counts(self, starts, ends):
+
+        start_ordinals, end_ordinals = self._ordinals(starts, ends)
+        y1, m1, d1 = batch.year_month_day(start_ordinals)
+        y2, m2, d2 = batch.year_month_day(end_ordinals)
+
+        if self.convention == Thirty360Convention.bond_basis:
+            d1 = np.where(d1 == 31, 30, d1)
+            d2 = np.where((d2 == 31) & (d1 >= 30), 30, d2)
+        elif self.convention == Thirty360Convention.european:
+            d1 = np.minimum(d1, 30)
+            d2 = np.minimum(d2, 30)
+        elif self.convention == Thirty360Convention.isda:
+            d1 = np.where(batch.is_end_of_month(start_ordinals), 30, d1)
+            is_termination = end_ordinals == (self.termination_date.toordinal() if self.termination_date is not None else 0)
+            d2 = np.where(batch.is_end_of_month(end_ordinals) & ~(is_termination & (m2 == 2)), 30, d2)
+        else:
+            raise ValueError("Invalid 30/360 convention")
+
+        return 360 * (y2 - y1) + 30 * (m2 - m1) + (d2 - d1)
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+        return self.day_counts(starts, ends) / 360.0
+
+class ActualActualIsda(DayCount):
+
+    """
+    ACT/ACT ISDA: the days falling in each calendar year are divided by the
+    number of days in that year.
+    """
+
+    name = "ACT/ACT ISDA"
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+
+        if start > end:
+            return -self.year_fraction(end, start)
+
+        y1, y2 = start.year, end.year
+
+        if y1 == y2:
+            return (end - start).days / float(Calendar.days_in_year(y1))
+
+        return ((date(y1 + 1, 1, 1) - start).days / float(Calendar.days_in_year(y1))
+                + (y2 - y1 - 1)
+                + (end - date(y2, 1, 1)).days / float(Calendar.days_in_year(y2)))
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+
+        start_ordinals, end_ordinals = self._ordinals(starts, ends)
+        first = np.minimum(start_ordinals, end_ordinals)
+        last = np.maximum(start_ordinals, end_ordinals)
+        sign = np.where(start_ordinals > end_ordinals, -1.0, 1.0)
+
+        y1, _, _ = batch.year_month_day(first)
+        y2, _, _ = batch.year_month_day(last)
+        y1_start, y1_end = batch.year_starts(y1), batch.year_starts(y1 + 1)
+        y2_start, y2_end = batch.year_starts(y2), batch.year_starts(y2 + 1)
+
+        same_year = (last - first) / (y1_end - y1_start).astype(np.float64)
+        spanning = ((y1_end - first) / (y1_end - y1_start).astype(np.float64)
+                    + (y2 - y1 - 1)
+                    + (last - y2_start) / (y2_end - y2_start).astype(np.float64))
+
+        return sign * np.where(y1 == y2, same_year, spanning)
+
+class ActualActualIcma(DayCount):
+
+    """
+    ACT/ACT ICMA: the days are divided by the length of the reference
+    (coupon) period times the number of periods in a year. Accruals
+    outside the reference period are split into whole notional periods,
+    as for long first and final coupons.
+    """
+
+    name = "ACT/ACT ICMA"
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+
+        if start == end:
+            return 0.0
+        if start > end:
+            return -self.year_fraction(end, start, reference_start, reference_end)
+
+        reference_start = reference_start or start
+        reference_end = reference_end or end
+
+        if not (reference_end > reference_start and reference_end > start):
+            raise ValueError("Invalid reference period")
+
+        months = int(round(12 * (reference_end - reference_start).days / 365.0))
+        if months == 0:
+            reference_start, reference_end, months = start, Calendar.add_months(start, 12), 12
+
+        period = months / 12.0
+
+        if end <= reference_end:
+            if start >= reference_start:
+                return period * (end - start).days / float((reference_end - reference_start).days)
+
+            # A long first coupon.
+            previous_reference = Calendar.add_months(reference_start, -months)
+            if end > reference_start:
+                return (self.year_fraction(start, reference_start, previous_reference, reference_start)
+                        + self.year_fraction(reference_start, end, reference_start, reference_end))
+            else:
+                return self.year_fraction(start, end, previous_reference, reference_start)
+
+        # A long final coupon.
+        if reference_start > start:
+            raise ValueError("Invalid reference period")
+
+        total = self.year_fraction(start, reference_end, reference_start, reference_end)
+        i = 0
+        while True:
+            next_reference_start = Calendar.add_months(reference_end, months * i)
+            next_reference_end = Calendar.add_months(reference_end, months * (i + 1))
+            if end < next_reference_end:
+                break
+            total += period
+            i += 1
+
+        return total + self.year_fraction(next_reference_start, end, next_reference_start, next_reference_end)
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+
+        start_ordinals, end_ordinals = self._ordinals(starts, ends)
+        reference_start_ordinals = start_ordinals if reference_starts is None else batch.to_ordinals(reference_starts)[0]
+        reference_end_ordinals = end_ordinals if reference_ends is None else batch.to_ordinals(reference_ends)[0]
+
+        days = (end_ordinals - start_ordinals).astype(np.float64)
+        reference_days = (reference_end_ordinals - reference_start_ordinals).astype(np.float64)
+        months = np.round(12 * reference_days / 365.0)
+
+        regular = ((start_ordinals < end_ordinals)
+                   & (start_ordinals >= reference_start_ordinals)
+                   & (end_ordinals <= reference_end_ordinals)
+                   & (months != 0))
+
+        result = np.where(regular, months / 12.0 * days / np.where(regular, reference_days, 1.0), 0.0)
+
+        # Irregular periods are split into notional periods one at a time.
+        for k in np.flatnonzero(~regular & (start_ordinals != end_ordinals)):
+            result[k] = self.year_fraction(
+                date.fromordinal(int(start_ordinals[k])),
+                date.fromordinal(int(end_ordinals[k])),
+                None if reference_starts is None else date.fromordinal(int(reference_start_ordinals[k])),
+                None if reference_ends is None else date.fromordinal(int(reference_end_ordinals[k])))
+
+        return result
+
+class Business252(DayCount):
+
+    """
+    BUS/252: the business days of the calendar divided by 252.
+    """
+
+    name = "BUS/252"
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+
+    def day_count(self, start, end):
+        return self.calendar.business_day_count(start, end)
+
+    def year_fraction(self, start, end, reference_start = None, reference_end = None):
+        return self.day_count(start, end) / 252.0
+
+    def day_counts(self, starts, ends):
+        return batch.business_day_counts(self.calendar, starts, ends)
+
+    def year_fractions(self, starts, ends, reference_starts = None, reference_ends = None):
+        return self.day_counts(starts, ends) / 252.0
@@ -0,0 +1,106 @@
+"""
+Integer day serials.
+
+A day serial is the proleptic Gregorian ordinal of a date, as returned by
+date.toordinal(), which is the rata die fixed date of py_calendrical
+(GregorianDate.to_fixed): 1 January of year 1 is day 1. The functions here
+do the calendar arithmetic the Calendar needs on plain ints, so business
+day walks and holiday lookups need not create a date for every day.
+"""
+
+from py_finance.dates.day_of_week import DayOfWeek
+
+_month_days = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def is_leap_year(year):
+    return ((year % 4 == 0) and ((year % 100 != 0) or (year % 400 == 0)))
+
+def days_in_month(year, month):
+    return 29 if month == 2 and is_leap_year(year) else _month_days[month - 1]
+
+def year_start(year):
+    """Returns the day serial of 1 January of the year."""
+    y = year - 1
+    return y * 365 + y // 4 - y // 100 + y // 400 + 1
+
+def from_year_month_day(year, month, day):
+    """Returns the day serial of the date, as GregorianDate.to_fixed."""
+    return (year_start(year)
+            + (367 * month - 362) // 12
+            + (0 if month <= 2 else (-1 if is_leap_year(year) else -2))
+            + day - 1)
+
+def year_of(serial):
+
+    """
+    Returns the year of the day serial. The estimate from the mean length of
+    a year is the year or the one after, so one comparison corrects it.
+    """
+
+    year = 400 * (serial + 1) // 146097 + 1
+    y = year - 1
+    if y * 365 + y // 4 - y // 100 + y // 400 >= serial:
+        return y
+    return year
+
+def year_month_day(serial):
+    """Returns the year, month and day of the day serial, as GregorianDate.from_fixed."""
+    year = year_of(serial)
+    is_leap = is_leap_year(year)
+    prior_days = serial - year_start(year)
+    correction = 0 if prior_days < (60 if is_leap else 59) else (1 if is_leap else 2)
+    month = (12 * (prior_days + correction) + 373) // 367
+    return year, month, serial - from_year_month_day(year, month, 1) + 1
+
+def weekday(serial):
+    """Returns the day of the week of the day serial, where Monday is 0 as for date.weekday()."""
+    return (serial + 6) % 7
+
+def is_weekend(serial):
+    return (serial + 6) % 7 > DayOfWeek.friday
+
+_weekend_bits = {}
+
+def weekend_bits(year):
+
+    """
+    Returns the weekends of the year as an integer bitset, where bit n is set
+    if the day n days after 1 January is a Saturday or Sunday.
+    """
+
+    start = year_start(year)
+    days = 366 if is_leap_year(year) else 365
+    key = (weekday(start), days)
+    bits = _weekend_bits.get(key)
+    if bits is None:
+        bits = 0
+        for day in range(days):
+            if is_weekend(start + day):
+                bits |= 1 << day
+        _weekend_bits[key] = bits
+    return bits
+
+def is_end_of_month(serial):
+    year, month, day = year_month_day(serial)
+    return day == days_in_month(year, month)
+
+def add_months(serial, months, end_of_month = False):
+
+    """
+    Adds months to the day serial with the same rules as Calendar.add_months.
+    """
+
+    if months == 0:
+        return serial
+
+    year, month, day = year_month_day(serial)
+    days = days_in_month(year, month)
+
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+    target_days = days_in_month(year, month)
+
+    if end_of_month and day == days:
+        return from_year_month_day(year, month, target_days)
+    else:
+        return from_year_month_day(year, month, min(day, target_days))
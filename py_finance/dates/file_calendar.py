@@ -0,0 +1,230 @@
+"""
+Calendars read from holiday files.
+
+A FileCalendar reads its holidays from a CSV file, with a date in one column
+of each row, or an iCalendar (.ics) file, with an all day event for each
+holiday. The file is read a line at a time into one bitset per year, where
+bit n is set if the day n days after 1 January is a holiday, so a lookup is
+a dictionary read and a shift however long the file is.
+
+reload() reads the file again if it has changed. Rows appended to a CSV
+file are read on their own; any other change reads the whole file, as does
+any change after a last row without a newline was read, since that row may
+have been only partly written. The new holidays replace the old in a single
+assignment, so one instance can be shared by threads while it reloads, and
+a business day index built on the calendar is rebuilt with them. Given a
+check_interval, lookups call reload() themselves at most once per interval.
+
+Recurrence rules in iCalendar files are not expanded: each holiday must be
+an event of its own.
+"""
+
+import csv
+import os
+import threading
+import time
+from datetime import datetime
+from py_finance.dates import day_serial
+from py_finance.dates.calendar import Calendar
+
+CSV = "csv"
+ICALENDAR = "ics"
+
+class FileCalendar(Calendar):
+
+    def __init__(self, path, name = None, file_format = None, date_column = 0, date_format = "%Y-%m-%d", check_interval = None):
+
+        self.path = path
+        self.name = name or os.path.splitext(os.path.basename(path))[0]
+        self.file_format = file_format or (ICALENDAR if path.lower().endswith((".ics", ".ical")) else CSV)
+        self.date_column = date_column
+        self.date_format = date_format
+        self.check_interval = check_interval
+
+        if self.file_format not in (CSV, ICALENDAR):
+            raise ValueError("Unknown holiday file format: " + str(self.file_format))
+
+        self.__years = {}
+        self.__stat = None
+        self.__offset = 0
+        self.__last_line = b""
+        self.__column = None
+        self.__rows = 0
+        self.__partial = False
+        self.__next_check = None
+        # Rebuilding the index reads the holidays, which may call reload().
+        self.__lock = threading.RLock()
+        self.reload()
+
+    def is_holiday(self, target_date):
+        return self.__is_holiday(target_date.toordinal(), target_date.year)
+
+    def is_holiday_ordinal(self, ordinal):
+        return self.__is_holiday(ordinal, day_serial.year_of(ordinal))
+
+    def holiday_bits(self, year):
+        self.__check()
+        return self.__years.get(year, 0)
+
+    def holidays(self):
+        """Returns the sorted holidays as day serials."""
+        holidays = []
+        for year, bits in sorted(self.__years.items()):
+            start = day_serial.year_start(year)
+            day = 0
+            while bits:
+                if bits & 1:
+                    holidays.append(start + day)
+                bits >>= 1
+                day += 1
+        return holidays
+
+    def reload(self):
+
+        """
+        Reads the file if it has changed since it was last read. Returns
+        whether the holidays were read.
+        """
+
+        with self.__lock:
+
+            stat = os.stat(self.path)
+            previous = self.__stat
+            if previous is not None and (stat.st_mtime, stat.st_size) == (previous.st_mtime, previous.st_size):
+                return False
+
+            try:
+                self.__years = self.__read(stat)
+                self.__stat = stat
+            except Exception:
+                # Read the whole file next time.
+                self.__stat = None
+                raise
+
+            self.holidays_changed()
+
+            return True
+
+    def __read(self, stat):
+
+        with open(self.path, "rb") as holiday_file:
+            if self.file_format == CSV and self.__is_appended(holiday_file, stat):
+                years = dict(self.__years)
+                holiday_file.seek(self.__offset)
+            else:
+                years = {}
+                self.__offset = 0
+                self.__last_line = b""
+                self.__column = None
+                self.__rows = 0
+                self.__partial = False
+
+            if self.file_format == CSV:
+                ordinals = self.__read_csv(holiday_file)
+            else:
+                ordinals = self.__read_icalendar(holiday_file)
+
+            for ordinal in ordinals:
+                year = day_serial.year_of(ordinal)
+                years[year] = years.get(year, 0) | (1 << (ordinal - day_serial.year_start(year)))
+
+        return years
+
+    def __check(self):
+        if self.check_interval is not None:
+            now = time.time()
+            if self.__next_check is None or now >= self.__next_check:
+                self.__next_check = now + self.check_interval
+                self.reload()
+
+    def __is_holiday(self, ordinal, year):
+        self.__check()
+        return (self.__years.get(year, 0) >> (ordinal - day_serial.year_start(year))) & 1 == 1
+
+    def __is_appended(self, holiday_file, stat):
+
+        # The file has only grown if the last line read is still where it was.
+        if self.__stat is None or self.__partial or stat.st_size < self.__offset or not self.__last_line:
+            return False
+
+        holiday_file.seek(self.__offset - len(self.__last_line))
+        return holiday_file.read(len(self.__last_line)) == self.__last_line
+
+    def __read_csv(self, holiday_file):
+
+        for line in iter(holiday_file.readline, b""):
+
+            if not line.endswith(b"\n"):
+                # The last row, which may yet be added to.
+                self.__partial = True
+
+            self.__offset += len(line)
+            self.__last_line = line
+
+            text = line.decode("utf-8").strip()
+            if not text or text.startswith("#"):
+                continue
+
+            row = next(csv.reader([text]))
+            self.__rows += 1
+
+            if self.__column is None:
+                if isinstance(self.date_column, int):
+                    self.__column = self.date_column
+                else:
+                    # The first row is a header naming the date column.
+                    self.__column = [value.strip() for value in row].index(self.date_column)
+                    continue
+
+            try:
+                value = datetime.strptime(row[self.__column].strip(), self.date_format).date()
+            except ValueError:
+                if self.__rows == 1:
+                    # A header row.
+                    continue
+                raise ValueError("Invalid date in {0}: {1}".format(self.path, text))
+
+            yield value.toordinal()
+
+    def __read_icalendar(self, holiday_file):
+
+        start = end = None
+        for name, value in _unfolded_properties(holiday_file):
+            if name == "BEGIN" and value == "VEVENT":
+                start = end = None
+            elif name == "DTSTART":
+                start = _icalendar_date(value)
+            elif name == "DTEND":
+                end = _icalendar_date(value)
+            elif name == "END" and value == "VEVENT" and start is not None:
+                # The end of an all day event is the day after it.
+                for ordinal in range(start, max(end or start + 1, start + 1)):
+                    yield ordinal
+
+def _unfolded_properties(holiday_file):
+
+    """
+    Yields the name and value of each property of an iCalendar file, joining
+    lines folded onto the next.
+    """
+
+    current = None
+    for line in iter(holiday_file.readline, b""):
+        line = line.decode("utf-8").rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield _property(current)
+        current = line
+    if current is not None:
+        yield _property(current)
+
+def _property(line):
+    name, _, value = line.partition(":")
+    # Drop the parameters, as in DTSTART;VALUE=DATE:20150101.
+    return name.split(";")[0].upper(), value.strip()
+
+def _icalendar_date(value):
+    return day_serial.from_year_month_day(int(value[0:4]), int(value[4:6]), int(value[6:8]))
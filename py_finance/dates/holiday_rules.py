@@ -0,0 +1,237 @@
+"""
+Declarative holiday rules.
+
+A calendar's holidays are described by a list of rules, which are compiled
+into a HolidayEvaluator producing the holidays of a whole year at a time.
+Values shared between rules, such as the date of Easter, are computed once
+per year, and one-off closures are indexed by year so they cost nothing in
+other years.
+
+Every rule has a name and may be restricted to a range of years
+(year_from, year_to), to a collection of years (years) or exclude some
+years (except_years). Rules may refer to the dates of earlier rules by name.
+"""
+
+from datetime import date, timedelta
+from py_finance.dates.calendar import Calendar
+from py_finance.dates.day_of_week import DayOfWeek
+from py_finance.dates.observance import Observance
+
+def observe(target_date, observance):
+
+    """
+    Moves a holiday falling at a weekend to the day it is observed.
+    """
+
+    if observance == Observance.none:
+        return target_date
+
+    weekday = target_date.weekday()
+
+    if observance == Observance.following:
+        if weekday == DayOfWeek.saturday:
+            return target_date + timedelta(2)
+        elif weekday == DayOfWeek.sunday:
+            return target_date + timedelta(1)
+    elif observance == Observance.nearest:
+        if weekday == DayOfWeek.saturday:
+            return target_date - timedelta(1)
+        elif weekday == DayOfWeek.sunday:
+            return target_date + timedelta(1)
+    elif observance == Observance.sunday_to_monday:
+        if weekday == DayOfWeek.sunday:
+            return target_date + timedelta(1)
+    else:
+        raise ValueError("Invalid observance")
+
+    return target_date
+
+class YearContext(object):
+
+    """
+    The values shared by the rules evaluated for a year.
+    """
+
+    def __init__(self, year):
+        self.year = year
+        self.dates = {}
+        self.__easter = None
+
+    @property
+    def easter(self):
+        if self.__easter is None:
+            self.__easter = Calendar.easter(self.year)
+        return self.__easter
+
+class HolidayRule(object):
+
+    def __init__(self, name, year_from = None, year_to = None, years = None, except_years = None):
+        self.name = name
+        self.year_from = year_from
+        self.year_to = year_to
+        self.years = None if years is None else frozenset(years)
+        self.except_years = frozenset(except_years or ())
+
+    def is_valid(self, year):
+        return ((self.year_from is None or year >= self.year_from)
+                and (self.year_to is None or year <= self.year_to)
+                and (self.years is None or year in self.years)
+                and year not in self.except_years)
+
+    def dates(self, context):
+        """Returns the dates of the holiday in the year of the context."""
+        raise NotImplementedError()
+
+class FixedDate(HolidayRule):
+
+    """
+    A holiday on the same day every year, optionally moved from a weekend.
+    """
+
+    def __init__(self, name, month, day, observance = Observance.none, **validity):
+        HolidayRule.__init__(self, name, **validity)
+        self.month = month
+        self.day = day
+        self.observance = observance
+
+    def dates(self, context):
+        return (observe(date(context.year, self.month, self.day), self.observance),)
+
+class NthWeekday(HolidayRule):
+
+    """
+    The nth given weekday of a month, such as the third Monday in January.
+    If strictly_after is set and the month starts on that weekday, the count
+    starts from the following week. The holiday may be a number of days
+    after that weekday, such as the day after Thanksgiving.
+    """
+
+    def __init__(self, name, month, nth, weekday, strictly_after = False, days_after = 0, **validity):
+        HolidayRule.__init__(self, name, **validity)
+        self.month = month
+        self.nth = nth
+        self.weekday = weekday
+        self.strictly_after = strictly_after
+        self.days_after = days_after
+
+    def dates(self, context):
+        target_date = Calendar.add_nth_day_of_week(date(context.year, self.month, 1), self.nth, self.weekday, self.strictly_after)
+        return (target_date + timedelta(self.days_after),)
+
+class LastWeekday(HolidayRule):
+
+    """
+    The last given weekday of a month, such as the last Monday in May.
+    """
+
+    def __init__(self, name, month, weekday, **validity):
+        HolidayRule.__init__(self, name, **validity)
+        self.month = month
+        self.weekday = weekday
+
+    def dates(self, context):
+        return (Calendar.add_nth_day_of_week(Calendar.end_of_month(context.year, self.month), -1, self.weekday, False),)
+
+class EasterOffset(HolidayRule):
+
+    """
+    A holiday a number of days from Easter Sunday, such as Good Friday (-2).
+    """
+
+    def __init__(self, name, offset, **validity):
+        HolidayRule.__init__(self, name, **validity)
+        self.offset = offset
+
+    def dates(self, context):
+        return (context.easter + timedelta(self.offset),)
+
+class WeekdaysAfter(HolidayRule):
+
+    """
+    A holiday the given number of weekdays after the holiday of an earlier
+    rule, such as Boxing Day following an observed Christmas Day.
+    """
+
+    def __init__(self, name, rule_name, weekdays, **validity):
+        HolidayRule.__init__(self, name, **validity)
+        self.rule_name = rule_name
+        self.weekdays = weekdays
+
+    def dates(self, context):
+        target_date = context.dates[self.rule_name][0]
+        for _ in range(self.weekdays):
+            target_date += timedelta(1)
+            while target_date.weekday() > DayOfWeek.friday:
+                target_date += timedelta(1)
+        return (target_date,)
+
+class OneOff(HolidayRule):
+
+    """
+    Closures on particular dates, such as a royal wedding.
+    """
+
+    def __init__(self, name, dates, **validity):
+        HolidayRule.__init__(self, name, **validity)
+        self.one_off_dates = tuple(dates)
+
+    def is_valid(self, year):
+        return HolidayRule.is_valid(self, year) and any(value.year == year for value in self.one_off_dates)
+
+    def dates(self, context):
+        return tuple(value for value in self.one_off_dates if value.year == context.year)
+
+class HolidayEvaluator(object):
+
+    """
+    Evaluates compiled holiday rules a year at a time.
+    """
+
+    def __init__(self, rules):
+
+        names = set()
+        for rule in rules:
+            if isinstance(rule, WeekdaysAfter) and rule.rule_name not in names:
+                raise ValueError("Rule '{0}' refers to '{1}' which is not an earlier rule".format(rule.name, rule.rule_name))
+            names.add(rule.name)
+
+        self.rules = tuple(rules)
+        self.__recurring = tuple(rule for rule in rules if not isinstance(rule, OneOff))
+        self.__one_off = {}
+        for rule in rules:
+            if isinstance(rule, OneOff):
+                for value in rule.one_off_dates:
+                    if HolidayRule.is_valid(rule, value.year):
+                        self.__one_off.setdefault(value.year, []).append(value)
+
+    def holidays(self, year):
+
+        """
+        Returns the holidays of the rules for the year. Holidays moved from a
+        weekend may fall in the year before or after.
+        """
+
+        context = YearContext(year)
+        holidays = []
+        for rule in self.__recurring:
+            if rule.is_valid(year):
+                dates = rule.dates(context)
+                context.dates[rule.name] = dates
+                holidays.extend(dates)
+        holidays.extend(self.__one_off.get(year, ()))
+        return holidays
+
+    def holidays_between(self, year_from, year_to):
+
+        """
+        Returns the sorted, distinct holidays of the rules for the years from
+        year_from to year_to inclusive.
+        """
+
+        holidays = set()
+        for year in range(year_from, year_to + 1):
+            holidays.update(self.holidays(year))
+        return sorted(holidays)
+
+def compile_holiday_rules(rules):
+    return HolidayEvaluator(rules)
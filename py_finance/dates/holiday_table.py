@@ -0,0 +1,180 @@
+"""
+Compiled holiday tables.
+
+A holiday table holds the holidays of a number of named calendars over a
+range of years in a compact binary file: one bitset of 46 bytes per calendar
+and year, where bit n is set if the day n days after 1 January is a holiday.
+The file is opened with mmap, so every process reading the same table shares
+the same read-only pages and no holidays are generated at start up.
+
+To compile the built in calendars:
+
+    python -m py_finance.dates.holiday_table holidays.bin 1950 2100
+"""
+
+import binascii
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from py_finance.dates.day_serial import year_of, year_start
+
+MAGIC = b"PFHT"
+VERSION = 1
+
+_header = struct.Struct("<4sHH")
+_entry = struct.Struct("<32sHHQ")
+_byte = struct.Struct("B")
+
+YEAR_SIZE = 46
+
+def compile_holiday_table(path, calendars, year_from, year_to):
+
+    """
+    Writes the holidays of the calendars between year_from and year_to
+    (inclusive) to a holiday table. Each calendar must have a name. The file
+    is written to a temporary file and renamed, so readers never see a
+    partial table.
+    """
+
+    calendars = list(calendars)
+    data_offset = _header.size + _entry.size * len(calendars)
+    block_size = YEAR_SIZE * (year_to - year_from + 1)
+
+    # A temporary file of its own in the same directory, so concurrent
+    # writers do not share it and the rename stays on one file system.
+    descriptor, temporary_path = tempfile.mkstemp(prefix = os.path.basename(path) + ".", suffix = ".tmp", dir = os.path.dirname(path) or ".")
+    renamed = False
+    try:
+        with os.fdopen(descriptor, "wb") as table_file:
+
+            table_file.write(_header.pack(MAGIC, VERSION, len(calendars)))
+            for i, calendar in enumerate(calendars):
+                name = calendar.name.encode("ascii")
+                if len(name) > 32:
+                    raise ValueError("Calendar names in a holiday table are limited to 32 characters")
+                table_file.write(_entry.pack(name, year_from, year_to, data_offset + i * block_size))
+
+            for calendar in calendars:
+                for year in range(year_from, year_to + 1):
+                    bits = calendar.holiday_bits(year)
+                    table_file.write(bytearray((bits >> (8 * i)) & 0xFF for i in range(YEAR_SIZE)))
+
+        # mkstemp creates the file readable only by its owner.
+        os.chmod(temporary_path, 0o644)
+        os.rename(temporary_path, path)
+        renamed = True
+    finally:
+        if not renamed:
+            os.remove(temporary_path)
+
+class HolidayTable(object):
+
+    """
+    A read only, memory mapped holiday table.
+    """
+
+    def __init__(self, path):
+
+        self.path = path
+
+        with open(path, "rb") as table_file:
+            self.stat = os.fstat(table_file.fileno())
+            self.__map = mmap.mmap(table_file.fileno(), 0, access = mmap.ACCESS_READ)
+
+        magic, version, count = _header.unpack_from(self.__map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a holiday table: " + path)
+
+        self.__calendars = {}
+        for i in range(count):
+            name, year_from, year_to, offset = _entry.unpack_from(self.__map, _header.size + i * _entry.size)
+            self.__calendars[name.rstrip(b"\0").decode("ascii")] = (year_from, year_to, offset)
+
+    def close(self):
+        self.__map.close()
+
+    def is_current(self):
+        """Returns whether the file at the path is still the one mapped."""
+        try:
+            return _file_key(os.stat(self.path)) == _file_key(self.stat)
+        except OSError:
+            return False
+
+    def names(self):
+        return sorted(self.__calendars)
+
+    def years(self, name):
+        year_from, year_to, _ = self.__calendars[name]
+        return year_from, year_to
+
+    def covers(self, name, year):
+        entry = self.__calendars.get(name)
+        return entry is not None and entry[0] <= year <= entry[1]
+
+    def is_holiday(self, name, target_date):
+        return self.is_holiday_ordinal(name, target_date.toordinal(), target_date.year)
+
+    def is_holiday_ordinal(self, name, ordinal, year = None):
+        year_from, _, offset = self.__calendars[name]
+        if year is None:
+            year = year_of(ordinal)
+        day = ordinal - year_start(year)
+        value = _byte.unpack_from(self.__map, offset + (year - year_from) * YEAR_SIZE + day // 8)[0]
+        return (value >> (day % 8)) & 1 == 1
+
+    def holiday_bits(self, name, year):
+        year_from, _, offset = self.__calendars[name]
+        start = offset + (year - year_from) * YEAR_SIZE
+        return int(binascii.hexlify(self.__map[start:start + YEAR_SIZE][::-1]), 16)
+
+_tables = {}
+
+def _file_key(stat):
+    return stat.st_ino, stat.st_mtime, stat.st_size
+
+def open_holiday_table(path):
+
+    """
+    Returns the holiday table at the path, opening it on first use. Tables
+    are shared by every calendar in the process. If the file has been
+    replaced since the table was opened, as by compile_holiday_table, the
+    new file is opened; calendars given the old table keep reading it until
+    they open the table again.
+    """
+
+    path = os.path.abspath(path)
+    table = _tables.get(path)
+    if table is None or not table.is_current():
+        table = _tables[path] = HolidayTable(path)
+    return table
+
+def close_holiday_table(path):
+
+    """
+    Closes the shared holiday table at the path, if it is open, and removes
+    it from the tables of the process. Calendars reading it must not be used
+    until they open a table again.
+    """
+
+    table = _tables.pop(os.path.abspath(path), None)
+    if table is not None:
+        table.close()
+
+def default_calendars():
+    from py_finance.dates.calendar_registry import calendar_names, get_calendar
+    return [get_calendar(name) for name in calendar_names()]
+
+def main(args):
+
+    if len(args) != 3:
+        sys.stderr.write("usage: python -m py_finance.dates.holiday_table <path> <year from> <year to>\n")
+        return 2
+
+    path, year_from, year_to = args[0], int(args[1]), int(args[2])
+    compile_holiday_table(path, default_calendars(), year_from, year_to)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
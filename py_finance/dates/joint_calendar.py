@@ -0,0 +1,65 @@
+from py_finance.dates import day_serial
+from py_finance.dates.calendar import Calendar
+from py_finance.dates.joint_calendar_rule import JointCalendarRule
+
+class JointCalendar(Calendar):
+
+    """
+    A calendar combining other calendars.
+
+    With JointCalendarRule.join_holidays a day is a holiday if it is a
+    holiday in any of the calendars; with JointCalendarRule.join_business_days
+    it is a holiday only if it is a holiday in all of them. The holidays of
+    each year are merged once into a single bitset, so a lookup costs the same
+    as for a single calendar.
+    """
+
+    def __init__(self, calendars, rule = JointCalendarRule.join_holidays, name = None):
+
+        if len(calendars) == 0:
+            raise ValueError("A joint calendar needs at least one calendar")
+
+        self.calendars = tuple(calendars)
+        self.rule = rule
+        self.name = name
+        self.__years = {}
+
+    def is_holiday(self, target_date):
+        return self.__is_holiday(target_date.toordinal(), target_date.year)
+
+    def is_holiday_ordinal(self, ordinal):
+        return self.__is_holiday(ordinal, day_serial.year_of(ordinal))
+
+    def holiday_bits(self, year):
+
+        merged = self.__years.get(year)
+        if merged is None:
+            merged = self.__merge_year(year)
+
+        return merged[1]
+
+    def __is_holiday(self, ordinal, year):
+
+        merged = self.__years.get(year)
+        if merged is None:
+            merged = self.__merge_year(year)
+
+        start, bits = merged
+        return (bits >> (ordinal - start)) & 1 == 1
+
+    def __merge_year(self, year):
+
+        if self.rule == JointCalendarRule.join_holidays:
+            bits = 0
+            for calendar in self.calendars:
+                bits |= calendar.holiday_bits(year)
+        elif self.rule == JointCalendarRule.join_business_days:
+            bits = -1
+            for calendar in self.calendars:
+                bits &= calendar.holiday_bits(year)
+        else:
+            raise ValueError("Invalid joint calendar rule")
+
+        merged = (day_serial.year_start(year), bits)
+        self.__years[year] = merged
+        return merged
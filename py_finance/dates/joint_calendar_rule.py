@@ -0,0 +1,6 @@
+# pip install enum34
+from enum import Enum
+
+class JointCalendarRule (Enum):
+    join_holidays = 0
+    join_business_days = 1
@@ -0,0 +1,8 @@
+# pip install enum34
+from enum import Enum
+
+class Observance (Enum):
+    none = 0
+    following = 1
+    nearest = 2
+    sunday_to_monday = 3
@@ -0,0 +1,96 @@
+"""
+Period end dates of a calendar.
+
+A PeriodEnds table holds, for each year it is asked about, the first and
+last business day of every month and the IMM dates (the third Wednesday of
+March, June, September and December). A year is computed the first time it
+is used and kept, so month end accruals and futures rolls read a table
+rather than adjusting the same dates again for every trade. Calendar.period_ends()
+returns the table shared by all users of a calendar.
+"""
+
+from datetime import date
+from py_finance.dates import day_serial
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.day_of_week import DayOfWeek
+
+IMM_MONTHS = (3, 6, 9, 12)
+
+class PeriodEnds(object):
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.__years = {}
+
+    def first_business_day(self, year, month):
+        return date.fromordinal(self.__year(year)[0][month - 1])
+
+    def last_business_day(self, year, month):
+        return date.fromordinal(self.__year(year)[1][month - 1])
+
+    def is_last_business_day_of_month(self, target_date):
+        return target_date.toordinal() == self.__year(target_date.year)[1][target_date.month - 1]
+
+    def imm_date(self, year, month):
+        return date.fromordinal(self.__year(year)[2][IMM_MONTHS.index(month)])
+
+    def next_imm_date(self, target_date):
+
+        """
+        Returns the first IMM date after the given date.
+        """
+
+        ordinal = target_date.toordinal()
+        for year in (target_date.year, target_date.year + 1):
+            for imm in self.__year(year)[2]:
+                if imm > ordinal:
+                    return date.fromordinal(imm)
+
+    def first_business_days(self, start, end):
+        """Returns the first business days of the months from start (inclusive) to end (exclusive)."""
+        return self.__between(start, end, 0)
+
+    def last_business_days(self, start, end):
+        """Returns the last business days of the months from start (inclusive) to end (exclusive)."""
+        return self.__between(start, end, 1)
+
+    def quarter_ends(self, start, end):
+        """Returns the last business days of the quarters from start (inclusive) to end (exclusive)."""
+        return [value for value in self.__between(start, end, 1) if value.month in IMM_MONTHS]
+
+    def imm_dates(self, start, end):
+        """Returns the IMM dates from start (inclusive) to end (exclusive)."""
+        return self.__between(start, end, 2)
+
+    def __between(self, start, end, table):
+        first, last = start.toordinal(), end.toordinal()
+        return [
+            date.fromordinal(ordinal)
+            for year in range(start.year, end.year + 1)
+            for ordinal in self.__year(year)[table]
+            if first <= ordinal < last]
+
+    def __year(self, year):
+        tables = self.__years.get(year)
+        if tables is None:
+            tables = self.__years[year] = self.__build(year)
+        return tables
+
+    def __build(self, year):
+
+        calendar = self.calendar
+        first_business_days = []
+        last_business_days = []
+        for month in range(1, 13):
+            first = day_serial.from_year_month_day(year, month, 1)
+            last = first + day_serial.days_in_month(year, month) - 1
+            first_business_days.append(calendar.adjust_ordinal(first, BusinessDayConvention.following))
+            last_business_days.append(calendar.adjust_ordinal(last, BusinessDayConvention.preceding))
+
+        imm_dates = []
+        for month in IMM_MONTHS:
+            first = day_serial.from_year_month_day(year, month, 1)
+            # The first Wednesday of the month, then two weeks on.
+            imm_dates.append(first + (DayOfWeek.wednesday - day_serial.weekday(first)) % 7 + 14)
+
+        return tuple(first_business_days), tuple(last_business_days), tuple(imm_dates)
@@ -0,0 +1,156 @@
+"""
+Schedules for a book of trades.
+
+generate_schedules takes the trades as columns: effective and termination
+dates, the tenor as a count and a TimeUnit, the calendar name (see
+py_finance.dates.calendar_registry) and the business day convention of each
+trade. The trades are cut into chunks which are generated in a process pool,
+the trades of each chunk grouped by calendar, tenor and convention and
+generated together with Schedule.generate_many.
+
+If the path of a compiled holiday table (see py_finance.dates.holiday_table)
+is given, every worker reads the holidays of the years it covers from the
+table, so the holidays are shared memory mapped pages rather than generated
+again in each process.
+"""
+
+# pip install futures
+from concurrent.futures import ProcessPoolExecutor
+# pip install numpy
+import numpy as np
+from py_finance.dates import batch
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.calendar_registry import get_calendar
+from py_finance.dates.date_generation import DateGeneration
+from py_finance.dates.holiday_table import open_holiday_table
+from py_finance.dates.joint_calendar import JointCalendar
+from py_finance.dates.time_unit import TimeUnit
+
+def generate_schedules(effective_dates, termination_dates, counts, units, calendar_names, conventions,
+                       termination_convention = None,
+                       end_of_month = False,
+                       rule = DateGeneration.backward,
+                       holiday_table = None,
+                       max_workers = None,
+                       chunk_size = 20000):
+
+    """
+    Generates the schedules of a book of trades.
+
+    The effective and termination dates are arrays of datetime64[D] dates or
+    integer day serials; counts, units, calendar_names and conventions have
+    an element per trade. The termination dates are adjusted with the
+    termination_convention, or the trade's convention if it is None.
+
+    The trades are generated in chunks of chunk_size across max_workers
+    processes (the number of processors if None). With max_workers = 1 they
+    are generated in the calling process.
+
+    The result is a tuple (offsets, unadjusted, adjusted) as for
+    Schedule.generate_many: the dates of trade k are
+    unadjusted[offsets[k]:offsets[k + 1]] and adjusted[offsets[k]:offsets[k + 1]],
+    in input order and in the representation of the inputs.
+    """
+
+    effective, as_datetime64 = batch.to_ordinals(effective_dates)
+    termination, _ = batch.to_ordinals(termination_dates)
+    counts = _int_column(counts)
+    units = _int_column(units)
+    conventions = _int_column(conventions)
+    names, name_codes = np.unique(np.asarray(calendar_names), return_inverse=True)
+
+    if not (len(effective) == len(termination) == len(counts) == len(units) == len(name_codes) == len(conventions)):
+        raise ValueError("Every column must have an element for each trade")
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be positive")
+
+    chunks = [
+        (holiday_table, [str(name) for name in names],
+         effective[i:i + chunk_size], termination[i:i + chunk_size], counts[i:i + chunk_size],
+         units[i:i + chunk_size], name_codes[i:i + chunk_size], conventions[i:i + chunk_size],
+         termination_convention, end_of_month, rule)
+        for i in range(0, len(effective), chunk_size)]
+
+    if max_workers == 1:
+        results = [_generate_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers) as executor:
+            results = list(executor.map(_generate_chunk, chunks))
+
+    offsets = np.zeros(len(effective) + 1, dtype=np.int64)
+    position = 0
+    for i, (chunk_offsets, _, _) in enumerate(results):
+        start = i * chunk_size
+        offsets[start + 1:start + len(chunk_offsets)] = chunk_offsets[1:] + position
+        position += chunk_offsets[-1]
+
+    unadjusted = np.concatenate([result[1] for result in results]) if results else np.zeros(0, dtype=np.int64)
+    adjusted = np.concatenate([result[2] for result in results]) if results else np.zeros(0, dtype=np.int64)
+
+    return offsets, batch.from_ordinals(unadjusted, as_datetime64), batch.from_ordinals(adjusted, as_datetime64)
+
+def _int_column(values):
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return values.astype(np.int64)
+    # Enum members are given as their values.
+    return np.array([getattr(value, "value", value) for value in values], dtype=np.int64)
+
+# The holiday table each calendar has been given in this process.
+_calendar_tables = {}
+
+def _open_holiday_table(calendar, path):
+
+    if isinstance(calendar, JointCalendar):
+        for part in calendar.calendars:
+            _open_holiday_table(part, path)
+    elif hasattr(calendar, "open_holiday_table"):
+        # A table rewritten since the calendar was given it is opened again.
+        table = open_holiday_table(path)
+        if _calendar_tables.get(calendar.name) is not table:
+            calendar.open_holiday_table(path)
+            _calendar_tables[calendar.name] = table
+
+def _generate_chunk(chunk):
+
+    """
+    Generates the schedules of a chunk of trades, returning day serials.
+    """
+
+    (holiday_table, names, effective, termination, counts, units, name_codes, conventions,
+     termination_convention, end_of_month, rule) = chunk
+
+    trades = len(effective)
+    keys = np.stack([name_codes, counts, units, conventions], axis=1)
+    groups, group_of_trade = np.unique(keys, axis=0, return_inverse=True)
+
+    sizes = np.zeros(trades, dtype=np.int64)
+    results = []
+    for g, (name_code, count, unit, convention) in enumerate(groups):
+        calendar = get_calendar(names[name_code])
+        if holiday_table is not None:
+            _open_holiday_table(calendar, holiday_table)
+
+        trade_indices = np.flatnonzero(group_of_trade == g)
+        convention = BusinessDayConvention(int(convention))
+        group_offsets, unadjusted, adjusted = batch.schedules_many(
+            calendar, effective[trade_indices], termination[trade_indices], int(count), TimeUnit(int(unit)),
+            convention, convention if termination_convention is None else termination_convention,
+            end_of_month, rule)
+        sizes[trade_indices] = np.diff(group_offsets)
+        results.append((trade_indices, group_offsets, unadjusted, adjusted))
+
+    offsets = np.zeros(trades + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(sizes)
+
+    # Move the dates of each group to the positions of its trades.
+    unadjusted = np.empty(offsets[-1], dtype=np.int64)
+    adjusted = np.empty(offsets[-1], dtype=np.int64)
+    for trade_indices, group_offsets, group_unadjusted, group_adjusted in results:
+        group_sizes = np.diff(group_offsets)
+        trade_of_date = np.repeat(trade_indices, group_sizes)
+        position = np.arange(group_offsets[-1]) - np.repeat(group_offsets[:-1], group_sizes)
+        target = offsets[trade_of_date] + position
+        unadjusted[target] = group_unadjusted
+        adjusted[target] = group_adjusted
+
+    return offsets, unadjusted, adjusted
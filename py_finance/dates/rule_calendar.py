@@ -0,0 +1,15 @@
+from py_finance.dates.yearly_calendar import YearlyCalendar
+
+class RuleCalendar(YearlyCalendar):
+
+    """
+    A calendar whose holidays are generated by compiled holiday rules. See
+    py_finance.dates.holiday_rules.
+    """
+
+    def __init__(self, name, evaluator, max_years = None):
+        YearlyCalendar.__init__(self, name, max_years)
+        self.evaluator = evaluator
+
+    def fetch_holidays(self, year):
+        return self.evaluator.holidays(year)
@@ -0,0 +1,150 @@
+from datetime import timedelta
+from py_finance.dates.calendar import Calendar
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.date_generation import DateGeneration
+from py_finance.dates.time_unit import TimeUnit, AVERAGE_DAYS
+
+class Schedule(object):
+
+    """
+    A schedule of regular dates between an effective date and a termination
+    date.
+
+    Iterating the schedule lazily yields (unadjusted, adjusted) date pairs in
+    chronological order, so long schedules are never held in memory. With
+    forward generation the regular dates roll forward from the effective date
+    and any stub is at the end; with backward generation they roll back from
+    the termination date and any stub is at the start. The termination date
+    is adjusted with the termination convention, every other date with the
+    convention. Where two consecutive dates adjust to the same business day
+    the schedule keeps the effective or termination date, otherwise the
+    earlier date.
+    """
+
+    def __init__(self, calendar, effective_date, termination_date, count, unit,
+                 convention = BusinessDayConvention.following,
+                 termination_convention = BusinessDayConvention.following,
+                 end_of_month = False,
+                 rule = DateGeneration.backward):
+
+        if effective_date >= termination_date:
+            raise ValueError("The effective date must be before the termination date")
+        if count <= 0:
+            raise ValueError("The tenor must be positive")
+
+        self.calendar = calendar
+        self.effective_date = effective_date
+        self.termination_date = termination_date
+        self.count = count
+        self.unit = unit
+        self.convention = convention
+        self.termination_convention = termination_convention
+        self.end_of_month = end_of_month
+        self.rule = rule
+
+    def __iter__(self):
+        return self.__deduplicate(self.__unadjusted_dates())
+
+    def unadjusted_date(self, anchor, periods):
+
+        """
+        Returns the date the given number of tenors from the anchor date,
+        before business day adjustment.
+        """
+
+        count = periods * self.count
+
+        if self.unit == TimeUnit.days:
+            return anchor + timedelta(count)
+        elif self.unit == TimeUnit.weeks:
+            return anchor + timedelta(7 * count)
+        elif self.unit == TimeUnit.months:
+            return Calendar.add_months(anchor, count, self.end_of_month)
+        elif self.unit == TimeUnit.years:
+            return Calendar.add_months(anchor, 12 * count, self.end_of_month)
+        else:
+            raise ValueError("Unhandled TimeUnit")
+
+    def regular_periods(self):
+
+        """
+        Returns the number of regular dates, counting the date the schedule is
+        generated from, which lie strictly inside the schedule.
+        """
+
+        if self.rule == DateGeneration.forward:
+            anchor, sign = self.effective_date, 1
+            inside = lambda value: value < self.termination_date
+        else:
+            anchor, sign = self.termination_date, -1
+            inside = lambda value: value > self.effective_date
+
+        days = (self.termination_date - self.effective_date).days
+        periods = int(days / (AVERAGE_DAYS[self.unit] * self.count))
+
+        while periods > 0 and not inside(self.unadjusted_date(anchor, sign * periods)):
+            periods -= 1
+        while inside(self.unadjusted_date(anchor, sign * (periods + 1))):
+            periods += 1
+
+        return periods + 1
+
+    def __unadjusted_dates(self):
+
+        if self.rule == DateGeneration.forward:
+            regular_periods = self.regular_periods()
+            periods = 0
+            while periods < regular_periods:
+                yield self.unadjusted_date(self.effective_date, periods)
+                periods += 1
+            yield self.termination_date
+        elif self.rule == DateGeneration.backward:
+            yield self.effective_date
+            periods = self.regular_periods()
+            while periods > 0:
+                periods -= 1
+                yield self.unadjusted_date(self.termination_date, -periods)
+        else:
+            raise ValueError("Unhandled DateGeneration")
+
+    def __deduplicate(self, unadjusted_dates):
+
+        held = None
+
+        for unadjusted in unadjusted_dates:
+
+            if unadjusted == self.termination_date:
+                adjusted = self.calendar.adjust(unadjusted, self.termination_convention)
+            else:
+                adjusted = self.calendar.adjust(unadjusted, self.convention)
+
+            if held is None:
+                held = (unadjusted, adjusted)
+            elif adjusted != held[1]:
+                yield held
+                held = (unadjusted, adjusted)
+            elif unadjusted == self.termination_date:
+                held = (unadjusted, adjusted)
+
+        yield held
+
+    @classmethod
+    def generate_many(cls, calendar, effective_dates, termination_dates, count, unit,
+                      convention = BusinessDayConvention.following,
+                      termination_convention = BusinessDayConvention.following,
+                      end_of_month = False,
+                      rule = DateGeneration.backward):
+
+        """
+        Generates the schedules of many trades sharing a tenor and conventions.
+
+        The effective and termination dates are arrays of datetime64[D] dates
+        or integer day serials. The result is a tuple (offsets, unadjusted,
+        adjusted) where the dates of trade k are unadjusted[offsets[k]:offsets[k + 1]]
+        and adjusted[offsets[k]:offsets[k + 1]], in the representation of the
+        inputs. The dates match iterating a Schedule for each trade.
+        """
+
+        from py_finance.dates import batch
+        return batch.schedules_many(calendar, effective_dates, termination_dates, count, unit,
+                                    convention, termination_convention, end_of_month, rule)
@@ -1,9 +1,23 @@
 from py_finance.dates.calendar import Calendar
 
 class SimpleCalendar(Calendar):
-    
+
+    """
+    A calendar with a fixed list of holidays. The holidays are read when the
+    calendar is created and cannot be changed afterwards; holidays is a
+    read-only tuple of them. Create a new calendar for other holidays.
+    """
+
     def __init__(self, holidays = []):
-        self.holidays = holidays
-        
+        self.__holidays = tuple(holidays)
+        self.__ordinals = frozenset(holiday.toordinal() for holiday in self.__holidays)
+
+    @property
+    def holidays(self):
+        return self.__holidays
+
     def is_holiday(self, value):
-        return value in self.holidays
+        return value.toordinal() in self.__ordinals
+
+    def is_holiday_ordinal(self, ordinal):
+        return ordinal in self.__ordinals
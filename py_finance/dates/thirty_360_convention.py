@@ -0,0 +1,7 @@
+# pip install enum34
+from enum import Enum
+
+class Thirty360Convention (Enum):
+    bond_basis = 0
+    european = 1
+    isda = 2
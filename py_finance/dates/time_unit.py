@@ -6,3 +6,11 @@ class TimeUnit(Enum):
     weeks = 1
     months = 2
     years = 3
+
+# The average length of each time unit in days, used to estimate the number of periods.
+AVERAGE_DAYS = {
+    TimeUnit.days: 1.0,
+    TimeUnit.weeks: 7.0,
+    TimeUnit.months: 365.2425 / 12,
+    TimeUnit.years: 365.2425
+}
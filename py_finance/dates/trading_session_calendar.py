@@ -0,0 +1,178 @@
+"""
+Trading sessions of an exchange calendar.
+
+A TradingSessionCalendar adds session hours to a date level calendar: each
+business day of the calendar has one session, from the open to the close,
+and days on which an early close rule falls close at the early close time
+instead. Times are naive datetimes in the exchange's local time.
+
+The sessions are held a year at a time as arrays of the open and close
+instants, in seconds since midnight on the day before day serial 1, with
+the running total of the session lengths. A year is built the first time it
+is used, and a query is a binary search of those arrays, so checking whether
+the exchange is open or counting the trading seconds in an interval costs
+the same however far apart the times are within a year.
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime, time
+from py_finance.dates import day_serial
+
+SECONDS_PER_DAY = 86400
+
+class TradingSessionCalendar(object):
+
+    def __init__(self, calendar, open_time = time(9, 30), close_time = time(16), early_close_time = time(13), early_closes = None):
+
+        """
+        Creates the sessions of the calendar. early_closes is a holiday
+        evaluator (see py_finance.dates.holiday_rules) giving the days which
+        close at the early close time; those which are not business days of
+        the calendar are ignored.
+        """
+
+        if not open_time < close_time or not open_time < early_close_time:
+            raise ValueError("The sessions must close after they open")
+
+        self.calendar = calendar
+        self.name = getattr(calendar, "name", None)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.early_close_time = early_close_time
+        self.early_closes = early_closes
+        self.__open_seconds = _seconds_of_day(open_time)
+        self.__close_seconds = _seconds_of_day(close_time)
+        self.__early_close_seconds = _seconds_of_day(early_close_time)
+        self.__years = {}
+
+    def sessions(self, year):
+
+        """
+        Returns the opens and closes of the sessions of the year as lists of
+        datetimes.
+        """
+
+        opens, closes, _ = self.__year(year)
+        return [_to_datetime(value) for value in opens], [_to_datetime(value) for value in closes]
+
+    def is_early_close(self, target_date):
+        ordinal = target_date.toordinal()
+        opens, closes, _ = self.__year(target_date.year)
+        k = bisect_right(opens, ordinal * SECONDS_PER_DAY + self.__open_seconds) - 1
+        return k >= 0 and opens[k] // SECONDS_PER_DAY == ordinal and closes[k] - opens[k] < self.__close_seconds - self.__open_seconds
+
+    def is_open(self, ts):
+        seconds = _to_seconds(ts)
+        opens, closes, _ = self.__year(ts.year)
+        k = bisect_right(opens, seconds) - 1
+        return k >= 0 and seconds < closes[k]
+
+    def next_open(self, ts):
+
+        """
+        Returns the open of the first session opening after the given time, or
+        None if there is none within the next ten years.
+        """
+
+        seconds = _to_seconds(ts)
+        for year in range(ts.year, ts.year + 10):
+            opens, _, _ = self.__year(year)
+            k = bisect_right(opens, seconds)
+            if k < len(opens):
+                return _to_datetime(opens[k])
+        return None
+
+    def next_close(self, ts):
+
+        """
+        Returns the close of the session open at the given time, or of the
+        next session if the exchange is closed, or None if there is none
+        within the next ten years.
+        """
+
+        seconds = _to_seconds(ts)
+        for year in range(ts.year, ts.year + 10):
+            _, closes, _ = self.__year(year)
+            k = bisect_right(closes, seconds)
+            if k < len(closes):
+                return _to_datetime(closes[k])
+        return None
+
+    def seconds_to_close(self, ts):
+        """Returns the seconds until the close of the session open at the given time, or None if the exchange is closed."""
+        if not self.is_open(ts):
+            return None
+        return (self.next_close(ts) - ts).total_seconds()
+
+    def trading_seconds_between(self, t1, t2):
+
+        """
+        Returns the seconds from t1 to t2 during which the exchange is open,
+        or minus the seconds from t2 to t1 if t2 is before t1.
+        """
+
+        if t2 < t1:
+            return -self.trading_seconds_between(t2, t1)
+
+        total = 0.0
+        for year in range(t1.year, t2.year + 1):
+            # The times are taken from the start of the year, so the fraction
+            # of a second keeps its precision.
+            base = day_serial.year_start(year) * SECONDS_PER_DAY
+            lower = _to_seconds(t1) - base + t1.microsecond / 1e6 if year == t1.year else 0
+            upper = _to_seconds(t2) - base + t2.microsecond / 1e6 if year == t2.year else None
+            total += self.__trading_seconds(year, base, lower, upper)
+        return total
+
+    def __trading_seconds(self, year, base, lower, upper):
+
+        opens, closes, totals = self.__year(year)
+        # The first session closing after the lower bound and the last opening before the upper.
+        first = bisect_right(closes, base + int(lower))
+        last = len(opens) if upper is None else bisect_right(opens, base + int(upper))
+        if upper is not None and last > 0 and opens[last - 1] - base == upper:
+            last -= 1
+        if first >= last:
+            return 0.0
+
+        seconds = float(totals[last] - totals[first])
+        seconds -= max(lower - (opens[first] - base), 0)
+        if upper is not None:
+            seconds -= max((closes[last - 1] - base) - upper, 0)
+        return seconds
+
+    def __year(self, year):
+        tables = self.__years.get(year)
+        if tables is None:
+            tables = self.__years[year] = self.__build(year)
+        return tables
+
+    def __build(self, year):
+
+        start = day_serial.year_start(year)
+        early_closes = set()
+        if self.early_closes is not None:
+            early_closes.update(value.toordinal() for value in self.early_closes.holidays(year))
+
+        opens = array("l")
+        closes = array("l")
+        totals = array("l", [0])
+        for ordinal in self.calendar.business_day_ordinals(start, day_serial.year_start(year + 1)):
+            midnight = ordinal * SECONDS_PER_DAY
+            opens.append(midnight + self.__open_seconds)
+            closes.append(midnight + (self.__early_close_seconds if ordinal in early_closes else self.__close_seconds))
+            totals.append(totals[-1] + closes[-1] - opens[-1])
+
+        return opens, closes, totals
+
+def _seconds_of_day(value):
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+def _to_seconds(ts):
+    """Returns the whole seconds of the datetime, as for the session tables."""
+    return ts.toordinal() * SECONDS_PER_DAY + ts.hour * 3600 + ts.minute * 60 + ts.second
+
+def _to_datetime(seconds):
+    ordinal, seconds = divmod(seconds, SECONDS_PER_DAY)
+    return datetime.combine(datetime.fromordinal(ordinal).date(), time(seconds // 3600, seconds // 60 % 60, seconds % 60))
@@ -1,25 +1,195 @@
+import threading
+from collections import namedtuple, OrderedDict
+from datetime import MINYEAR, MAXYEAR
+from py_finance.dates import day_serial
 from py_finance.dates.calendar import Calendar
+from py_finance.dates.holiday_table import open_holiday_table
+
+CacheStatistics = namedtuple("CacheStatistics", ["hits", "misses", "cached_years", "max_years"])
+
+# The number of years whose fetched holidays are kept while loading, so
+# loading consecutive years fetches each of them once.
+FETCHED_YEARS = 3
 
 class YearlyCalendar(Calendar):
-    
-    def __init__(self, name):
-        self.__years_fetched = set()
-        self.__holidays = set()
-        
+
+    """
+    A calendar whose holidays are generated a year at a time by fetch_holidays.
+
+    The holidays of each year are cached. The cache is safe to share between
+    threads: when several threads ask for a year which is not cached, one
+    generates it while the others wait. If max_years is given the cache
+    holds at most that many years, discarding the least recently used.
+    The hit and miss counts are not synchronised, so they are approximate
+    under concurrent access.
+    """
+
+    def __init__(self, name, max_years = None):
+        self.name = name
+        self.max_years = max_years
+        self.__years = OrderedDict()
+        self.__fetched = OrderedDict()
+        self.__loading = {}
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__table = None
+        # Each cached year is held as its first and last day serials and
+        # its holidays. The most recently used year is kept to hand so
+        # business day walks skip the year lookup.
+        self.__recent = (0, -1, frozenset())
+
     def is_holiday(self, target_date):
-        
-        if not self.__is_cached(target_date.year):
-            self.__cache_holidays(target_date.year)
+        return self.__is_holiday(target_date.toordinal(), target_date.year)
+
+    def is_holiday_ordinal(self, ordinal):
+
+        first, last, holidays = self.__recent
+        if first <= ordinal <= last:
+            self.__hits += 1
+            return ordinal in holidays
+
+        year = day_serial.year_of(ordinal)
+
+        table = self.__table
+        if table is not None and table.covers(self.name, year):
+            return table.is_holiday_ordinal(self.name, ordinal, year)
 
-        return target_date in self.__holidays
+        self.__recent = entry = self.__holidays_in(year)
+        return ordinal in entry[2]
+
+    def holiday_bits(self, year):
+
+        table = self.__table
+        if table is not None and table.covers(self.name, year):
+            return table.holiday_bits(self.name, year)
+
+        bits = 0
+        start = day_serial.year_start(year)
+        for holiday in self.__holidays_in(year)[2]:
+            bits |= 1 << (holiday - start)
+        return bits
 
     def fetch_holidays(self, year):
         return []
 
-    def __is_cached(self, year):
-        return year in self.__years_fetched
-    
-    def __cache_holidays(self, year):
-        for holiday in self.fetch_holidays(year):
-            self.__holidays.add(holiday)
-        self.__years_fetched.add(year)
+    def open_holiday_table(self, path):
+
+        """
+        Reads the holidays of the years covered by a compiled holiday table
+        from the table rather than generating them. See
+        py_finance.dates.holiday_table.
+        """
+
+        self.__table = open_holiday_table(path)
+        return self.__table
+
+    def prefetch(self, year_from, year_to):
+
+        """
+        Caches the holidays of the years from year_from to year_to inclusive.
+        """
+
+        for year in range(year_from, year_to + 1):
+            self.__holidays_in(year)
+
+    def cache_statistics(self):
+        return CacheStatistics(self.__hits, self.__misses, list(self.__years), self.max_years)
+
+    def clear_cache(self):
+        with self.__lock:
+            self.__years.clear()
+            self.__fetched.clear()
+            self.__recent = (0, -1, frozenset())
+            self.__hits = 0
+            self.__misses = 0
+
+    def __is_holiday(self, ordinal, year):
+
+        table = self.__table
+        if table is not None and table.covers(self.name, year):
+            return table.is_holiday_ordinal(self.name, ordinal, year)
+
+        self.__recent = entry = self.__holidays_in(year)
+        return ordinal in entry[2]
+
+    def __holidays_in(self, year):
+
+        holidays = self.__years.get(year)
+        if holidays is None:
+            return self.__load(year)
+
+        self.__hits += 1
+
+        if self.max_years is not None:
+            with self.__lock:
+                if year in self.__years:
+                    # Move the year to the most recently used end.
+                    self.__years[year] = self.__years.pop(year)
+
+        return holidays
+
+    def __load(self, year):
+
+        while True:
+
+            with self.__lock:
+                holidays = self.__years.get(year)
+                if holidays is not None:
+                    self.__hits += 1
+                    return holidays
+
+                event = self.__loading.get(year)
+                is_loader = event is None
+                if is_loader:
+                    event = self.__loading[year] = threading.Event()
+                    self.__misses += 1
+
+            if not is_loader:
+                # Another thread is generating the year; wait for it, then
+                # look again, loading it here if that thread failed.
+                event.wait()
+                continue
+
+            try:
+                holidays = self.__generate(year)
+                with self.__lock:
+                    self.__years[year] = holidays
+                    if self.max_years is not None and len(self.__years) > self.max_years:
+                        self.__years.popitem(last = False)
+            finally:
+                with self.__lock:
+                    del self.__loading[year]
+                event.set()
+
+            return holidays
+
+    def __generate(self, year):
+        # Holidays may be observed in the year before or after the one they
+        # are fetched for, such as New Year's Day moved back to 31 December.
+        # They are held as day serials so lookups need not create a date.
+        holidays = set()
+        for fetch_year in (year - 1, year, year + 1):
+            if MINYEAR <= fetch_year <= MAXYEAR:
+                holidays.update(self.__fetch(fetch_year).get(year, ()))
+        return (day_serial.year_start(year), day_serial.year_start(year + 1) - 1, frozenset(holidays))
+
+    def __fetch(self, fetch_year):
+
+        # The holidays fetched for the year as day serials by the year in
+        # which they are observed. The last few are kept, as they are the
+        # neighbours of the next year loaded.
+        with self.__lock:
+            observed = self.__fetched.get(fetch_year)
+        if observed is not None:
+            return observed
+
+        observed = {}
+        for holiday in self.fetch_holidays(fetch_year):
+            observed.setdefault(holiday.year, []).append(holiday.toordinal())
+
+        with self.__lock:
+            self.__fetched[fetch_year] = observed
+            if len(self.__fetched) > FETCHED_YEARS:
+                self.__fetched.popitem(last = False)
+        return observed
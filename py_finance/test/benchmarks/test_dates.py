@@ -0,0 +1,23 @@
+import unittest
+from py_finance.benchmarks.dates import run_benchmarks, compare, COLD, WARM
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run(self):
+        results = run_benchmarks(["adjust"], ["UK"], repeat = 1)
+        self.assertEqual(["adjust/UK/cold", "adjust/UK/warm"], [result["name"] for result in results["results"]])
+        for result in results["results"]:
+            self.assertTrue(0 < result["min"] <= result["median"])
+
+    def test_holiday_generation(self):
+        results = run_benchmarks(["holiday_generation"], ["UK"], repeat = 3)
+        cold, warm = [result["median"] for result in results["results"]]
+        self.assertLess(warm, cold, "Warm calendars have their holidays cached.")
+
+    def test_compare(self):
+        baseline = {"results": [{"name": "a", "median": 1.0}, {"name": "b", "median": 1.0}, {"name": "c", "median": 1.0}]}
+        current = {"results": [{"name": "a", "median": 1.05}, {"name": "b", "median": 1.5}, {"name": "d", "median": 1.0}]}
+        self.assertEqual([("a", 1.0, 1.05, 1.05, False), ("b", 1.0, 1.5, 1.5, True)], compare(baseline, current, 0.1))
+
+if __name__ == "__main__":
+    unittest.main()
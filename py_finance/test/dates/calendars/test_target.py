@@ -1,10 +1,20 @@
 import unittest
 
+from datetime import date
+
+from py_finance.dates.calendars.target import Target
+
 class TestTarget(unittest.TestCase):
 
     def testName(self):
         pass
 
+    def testEaster(self):
+        calendar = Target()
+        self.assertTrue(calendar.is_holiday(date(2015, 4, 3)), "Good Friday")
+        self.assertTrue(calendar.is_holiday(date(2015, 4, 6)), "Easter Monday")
+        self.assertFalse(calendar.is_holiday(date(1999, 4, 2)), "Good Friday was not a holiday before 2000.")
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
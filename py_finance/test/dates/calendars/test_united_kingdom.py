@@ -15,6 +15,16 @@ class Test(unittest.TestCase):
     def testIsBusinessDay(self):
         self.assertFalse(self.calendar.is_business_day(date(2014, 12, 25)))
 
+    def testEaster(self):
+        self.assertFalse(self.calendar.is_business_day(date(2015, 4, 3)), "Good Friday")
+        self.assertFalse(self.calendar.is_business_day(date(2015, 4, 6)), "Easter Monday")
+        self.assertTrue(self.calendar.is_business_day(date(2015, 4, 2)), "Maundy Thursday")
+
+    def testBoxingDay(self):
+        # Christmas Day 2010 was a Saturday.
+        self.assertFalse(self.calendar.is_business_day(date(2010, 12, 27)), "Christmas Day observed")
+        self.assertFalse(self.calendar.is_business_day(date(2010, 12, 28)), "Boxing Day observed")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
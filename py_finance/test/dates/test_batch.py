@@ -0,0 +1,81 @@
+import unittest
+from datetime import date, timedelta
+import numpy as np
+from py_finance.dates.simple_calendar import SimpleCalendar
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.time_unit import TimeUnit
+
+HOLIDAYS = (date(2014, 12, 25), date(2014, 12, 26), date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 5, 1), date(2015, 8, 31), date(2015, 12, 25), date(2015, 12, 28), date(2016, 1, 1))
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.scalar = SimpleCalendar(HOLIDAYS)
+        self.vector = SimpleCalendar(HOLIDAYS)
+        self.dates = [date(2014, 12, 1) + timedelta(offset) for offset in range(420)]
+        self.ordinals = np.array([value.toordinal() for value in self.dates])
+
+    def assert_matches(self, expected, actual):
+        self.assertEqual([value.toordinal() for value in expected], list(actual))
+
+    def test_adjust_many(self):
+        for convention in BusinessDayConvention:
+            expected = [self.scalar.adjust(value, convention) for value in self.dates]
+            self.assert_matches(expected, self.vector.adjust_many(self.ordinals, convention))
+
+    def test_adjust_many_datetime64(self):
+        values = np.array(self.dates, dtype='datetime64[D]')
+        adjusted = self.vector.adjust_many(values, BusinessDayConvention.modified_following)
+        self.assertEqual(np.dtype('datetime64[D]'), adjusted.dtype)
+        self.assertEqual([self.scalar.adjust(value, BusinessDayConvention.modified_following) for value in self.dates], adjusted.tolist())
+
+    def test_advance_many(self):
+        for unit in TimeUnit:
+            for count in (-13, -1, 0, 1, 2, 13):
+                for end_of_month in (False, True):
+                    expected = [self.scalar.advance(value, count, unit, BusinessDayConvention.modified_following, end_of_month) for value in self.dates]
+                    actual = self.vector.advance_many(self.ordinals, count, unit, BusinessDayConvention.modified_following, end_of_month)
+                    self.assert_matches(expected, actual)
+
+    def test_add_months_many(self):
+        months = np.arange(-25, 26)
+        values = np.array(self.dates, dtype='datetime64[D]')
+        for end_of_month in (False, True):
+            grid = SimpleCalendar.add_months_many(values[:, np.newaxis], months, end_of_month)
+            self.assertEqual((len(self.dates), len(months)), grid.shape)
+            for value, row in zip(self.dates, grid.tolist()):
+                self.assertEqual([SimpleCalendar.add_months(value, int(count), end_of_month) for count in months], row)
+        offsets = np.arange(len(self.dates)) % 37 - 18
+        expected = [SimpleCalendar.add_months(value, int(count), True) for value, count in zip(self.dates, offsets)]
+        self.assert_matches(expected, SimpleCalendar.add_months_many(self.ordinals, offsets, True))
+
+    def test_calendar_index_unchanged(self):
+        index = self.vector.build_index(2015, 2015)
+        expected = [self.scalar.add_business_days(value, 400) for value in self.dates]
+        self.assert_matches(expected, self.vector.add_business_days_many(self.ordinals, 400))
+        self.assertIs(index, self.vector.index, "The calendar's index should be left as it is.")
+        unindexed = SimpleCalendar(HOLIDAYS)
+        unindexed.adjust_many(self.ordinals)
+        self.assertIsNone(unindexed.index)
+
+    def test_distant_dates(self):
+        values = np.array(["2015-12-25", "2015-12-26", "9999-12-30", "0001-01-01"], dtype='datetime64[D]')
+        adjusted = self.vector.adjust_many(values, BusinessDayConvention.following)
+        self.assertEqual([self.scalar.adjust(value, BusinessDayConvention.following) for value in values.tolist()], adjusted.tolist())
+        from py_finance.dates import batch
+        self.assertEqual((1965, 2064), batch._index_years(values.astype(np.int64) + batch.EPOCH_ORDINAL, 1))
+
+    def test_business_day_counts(self):
+        starts = self.ordinals[::7]
+        ends = self.ordinals[::-7]
+        expected = [self.scalar.business_day_count(date.fromordinal(int(start)), date.fromordinal(int(end))) for start, end in zip(starts, ends)]
+        self.assertEqual(expected, list(self.vector.business_day_counts(starts, ends)), "Reversed pairs are negative.")
+        from py_finance.dates import batch
+        self.assertEqual(expected, list(batch.business_day_counts(self.vector, starts, ends, chunk_size = 5)))
+        self.assertEqual((2, 30), self.vector.business_day_counts(starts[:60].reshape(2, 30), ends[:60].reshape(2, 30)).shape)
+
+    def test_invalid_dates(self):
+        self.assertRaises(TypeError, self.vector.adjust_many, np.array([1.5, 2.5]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from datetime import date
+from datetime import date, timedelta
+import numpy as np
 from py_finance.dates.calendar import Calendar
 from py_finance.dates.simple_calendar import SimpleCalendar
 from py_finance.dates.business_day_convention import BusinessDayConvention
@@ -53,6 +54,15 @@ class TestCalendar(unittest.TestCase):
         self.assertTrue(c2.is_holiday(date(2014, 12, 25)), "Thursday 25 December 2014 is a holiday.")
         self.assertTrue(c2.is_holiday(date(2014, 12, 26)), "Friday 26 December 2014 is a holiday.")
         self.assertFalse(c2.is_holiday(date(2014, 12, 27)), "Saturday 27 December 2014 is not a holiday.")
+
+    def test_holidays_read_only(self):
+        holidays = [date(2014, 12, 25)]
+        c2 = SimpleCalendar(holidays)
+        holidays.append(date(2014, 12, 26))
+        self.assertEqual((date(2014, 12, 25),), c2.holidays, "The holidays are copied when the calendar is created.")
+        self.assertFalse(c2.is_holiday(date(2014, 12, 26)))
+        with self.assertRaises(AttributeError):
+            c2.holidays = holidays
     
     def test_is_business_day(self):
         c2 = SimpleCalendar((date(2014, 12, 25), date(2014, 12, 26)))
@@ -77,6 +87,10 @@ class TestCalendar(unittest.TestCase):
         self.assertEqual(date(2012, 1, 28), Calendar.add_months(date(2013, 4, 28), -15, True), "Should not go to end of month.")
         self.assertEqual(date(2013, 4, 30), Calendar.add_months(date(2013, 5, 31), -1, True), "Should not stay in May.")
         self.assertEqual(date(2013, 4, 30), Calendar.add_months(date(2013, 5, 31), -1, False), "Should not stay in May.")
+        # December
+        self.assertEqual(date(2013, 12, 30), Calendar.add_months(date(2013, 11, 30), 1), "Should land in December.")
+        self.assertEqual(date(2012, 12, 30), Calendar.add_months(date(2013, 11, 30), -11), "Should land in December.")
+        self.assertEqual(date(2012, 12, 15), Calendar.add_months(date(2013, 12, 15), -12), "Should go back a whole year.")
     
     def test_easter(self):
         self.assertEquals(date(2001, 4, 15), Calendar.easter(2001), "Easter 2001")
@@ -155,5 +169,94 @@ class TestCalendar(unittest.TestCase):
         # BusinessDayConvention.following
         self.assertEqual(jan_second, cal.adjust(jan_first, BusinessDayConvention.following), "Adjusted to January 2.")
     
+    def test_business_day_count(self):
+        cal = SimpleCalendar((date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 5, 1), date(2015, 12, 25), date(2015, 12, 16)))
+        self.assertEqual(5, cal.business_day_count(date(2014, 12, 29), date(2015, 1, 6)), "Should skip New Years Day and the weekend.")
+        self.assertEqual(0, cal.business_day_count(date(2015, 1, 3), date(2015, 1, 5)), "A weekend has no business days.")
+        self.assertEqual(-5, cal.business_day_count(date(2015, 1, 6), date(2014, 12, 29)), "Reversed dates give a negative count.")
+
+class TestCalendarOrdinals(unittest.TestCase):
+    
+    def test_matches_dates(self):
+        calendar = SimpleCalendar((date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 5, 1), date(2015, 12, 25)))
+        start = date(2014, 12, 25)
+        for offset in range(0, 380, 2):
+            target_date = start + timedelta(offset)
+            ordinal = target_date.toordinal()
+            self.assertEqual(calendar.is_business_day(target_date), calendar.is_business_day_ordinal(ordinal))
+            self.assertEqual(calendar.add_business_days(target_date, 3).toordinal(), calendar.add_business_days_ordinal(ordinal, 3))
+            self.assertEqual(calendar.business_day_count(start, target_date), calendar.business_day_count_ordinal(start.toordinal(), ordinal))
+            for convention in BusinessDayConvention:
+                self.assertEqual(calendar.adjust(target_date, convention).toordinal(), calendar.adjust_ordinal(ordinal, convention))
+
+class TestBusinessDays(unittest.TestCase):
+    
+    def setUp(self):
+        self.calendar = SimpleCalendar((date(2014, 12, 25), date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 12, 25), date(2016, 1, 1)))
+        self.start = date(2014, 12, 20)
+        self.end = date(2016, 1, 10)
+    
+    def walk(self, step):
+        expected = []
+        target_date = self.calendar.adjust(self.start)
+        while target_date < self.end:
+            expected.append(target_date)
+            target_date = self.calendar.add_business_days(target_date, step)
+        return expected
+    
+    def test_business_days(self):
+        for step in (1, 2, 5):
+            self.assertEqual(self.walk(step), list(self.calendar.business_days(self.start, self.end, step)), "Should match the walk.")
+        self.assertEqual([], list(self.calendar.business_days(self.end, self.start)))
+        self.calendar.build_index(2014, 2016)
+        self.assertEqual(self.walk(3), list(self.calendar.business_days(self.start, self.end, 3)), "Should match the walk with an index.")
+    
+    def test_business_days_array(self):
+        expected = np.array(self.walk(1), dtype='datetime64[D]')
+        self.assertTrue(np.array_equal(expected, self.calendar.business_days_array(self.start, self.end)))
+        self.calendar.build_index(2014, 2016)
+        self.assertTrue(np.array_equal(expected, self.calendar.business_days_array(self.start, self.end)), "Should match with an index.")
+
+class TestCalendarIndex(unittest.TestCase):
+    
+    def setUp(self):
+        holidays = (date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 5, 1), date(2015, 12, 25), date(2015, 12, 16), date(2016, 1, 1))
+        self.walk = SimpleCalendar(holidays)
+        self.indexed = SimpleCalendar(holidays)
+        self.indexed.build_index(2015, 2015)
+    
+    def test_add_business_days(self):
+        for offset in range(-10, 375):
+            target_date = date(2015, 1, 1) + timedelta(offset)
+            for count in (-30, -5, -1, 0, 1, 5, 30):
+                self.assertEqual(self.walk.add_business_days(target_date, count), self.indexed.add_business_days(target_date, count), "Should match the walk.")
+    
+    def test_business_day_count(self):
+        start = date(2014, 12, 20)
+        for offset in range(0, 390, 7):
+            end = start + timedelta(offset)
+            self.assertEqual(self.walk.business_day_count(start, end), self.indexed.business_day_count(start, end), "Should match the walk.")
+            self.assertEqual(self.walk.business_day_count(end, start), self.indexed.business_day_count(end, start), "Should match the walk.")
+    
+    def test_nearest_business_day(self):
+        for offset in range(-10, 375):
+            target_date = date(2015, 1, 1) + timedelta(offset)
+            self.assertEqual(self.walk.nearest_business_day(target_date, True), self.indexed.nearest_business_day(target_date, True), "Should match the walk.")
+            self.assertEqual(self.walk.nearest_business_day(target_date, False), self.indexed.nearest_business_day(target_date, False), "Should match the walk.")
+    
+    def test_adjust(self):
+        for offset in range(-10, 375):
+            target_date = date(2015, 1, 1) + timedelta(offset)
+            for convention in (BusinessDayConvention.none, BusinessDayConvention.following, BusinessDayConvention.preceding, BusinessDayConvention.modified_following, BusinessDayConvention.modified_preceding, BusinessDayConvention.nerarest):
+                self.assertEqual(self.walk.adjust(target_date, convention), self.indexed.adjust(target_date, convention), "Should match the walk.")
+    
+    def test_adjustment_tables(self):
+        index = self.indexed.index
+        self.assertEqual(date(2015, 1, 2).toordinal(), index.adjust(date(2015, 1, 1).toordinal(), BusinessDayConvention.following))
+        self.assertEqual(date(2015, 4, 2).toordinal(), index.adjust(date(2015, 4, 6).toordinal(), BusinessDayConvention.preceding))
+        self.assertEqual(date(2015, 5, 29).toordinal(), index.adjust(date(2015, 5, 31).toordinal(), BusinessDayConvention.modified_following))
+        self.assertIsNone(index.adjust(date(2015, 1, 1).toordinal(), BusinessDayConvention.preceding), "The adjustment leaves the index.")
+        self.assertIsNone(index.adjust(date(2015, 12, 31).toordinal() + 1, BusinessDayConvention.following), "The date is outside the index.")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,46 @@
+import unittest
+from datetime import date
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.calendar_instrumentation import instrument
+from py_finance.dates.calendars.united_kingdom import UnitedKingdom
+
+class TestCalendarInstrumentation(unittest.TestCase):
+
+    def test_counts(self):
+        calendar = UnitedKingdom()
+        instrumentation = instrument(calendar)
+        calendar.adjust(date(2015, 12, 25), BusinessDayConvention.following)
+        statistics = instrumentation.statistics()
+        self.assertEqual(1, statistics["adjust"].calls)
+        self.assertEqual(1, statistics["is_business_day"].calls)
+        self.assertEqual(1, statistics["is_holiday"].calls)
+        self.assertEqual(3, statistics["fetch_holidays"].calls, "The years either side are fetched.")
+        self.assertEqual([2014, 2015, 2016], sorted(instrumentation.fetch_seconds()))
+        self.assertEqual(1, instrumentation.cache_statistics().misses)
+
+    def test_flush(self):
+        calendar = UnitedKingdom()
+        metrics = {}
+        instrumentation = instrument(calendar, lambda name, value: metrics.__setitem__(name, value))
+        calendar.is_business_day(date(2015, 12, 28))
+        instrumentation.flush()
+        self.assertEqual(1, metrics["calendar.UK.is_business_day.calls"])
+        self.assertEqual(1, metrics["calendar.UK.cache.misses"])
+        self.assertEqual(0, instrumentation.statistics()["is_business_day"].calls, "Flushing resets the counts.")
+        calendar.is_business_day(date(2015, 12, 29))
+        calendar.is_business_day(date(2016, 12, 29))
+        instrumentation.flush()
+        self.assertEqual(2, metrics["calendar.UK.is_business_day.calls"])
+        self.assertEqual(1, metrics["calendar.UK.cache.hits"], "The cache counts are since the last flush.")
+        self.assertEqual(1, metrics["calendar.UK.cache.misses"])
+        self.assertEqual(2, metrics["calendar.UK.cache.years"])
+
+    def test_remove(self):
+        calendar = UnitedKingdom()
+        instrumentation = instrument(calendar)
+        instrumentation.remove()
+        self.assertNotIn("is_holiday", vars(calendar))
+        self.assertTrue(calendar.is_holiday(date(2015, 12, 25)))
+
+if __name__ == "__main__":
+    unittest.main()
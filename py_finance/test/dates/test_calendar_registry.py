@@ -0,0 +1,34 @@
+import unittest
+from datetime import date
+from py_finance.dates.calendar_registry import get_calendar, register_calendar, unregister_calendar, calendar_names
+from py_finance.dates.joint_calendar import JointCalendar
+from py_finance.dates.simple_calendar import SimpleCalendar
+
+class TestCalendarRegistry(unittest.TestCase):
+
+    def test_get_calendar(self):
+        calendar = get_calendar("US-NYSE")
+        self.assertEqual("US-NYSE", calendar.name)
+        self.assertIs(calendar, get_calendar("US-NYSE"), "Calendars are shared.")
+        self.assertTrue(calendar.is_holiday(date(2015, 4, 3)), "Good Friday.")
+
+    def test_joint_calendar(self):
+        calendar = get_calendar("UK+TARGET")
+        self.assertIsInstance(calendar, JointCalendar)
+        self.assertEqual("UK+TARGET", calendar.name)
+        self.assertIs(get_calendar("UK"), calendar.calendars[0])
+        self.assertTrue(calendar.is_holiday(date(2015, 5, 4)), "A UK holiday.")
+        self.assertTrue(calendar.is_holiday(date(2015, 5, 1)), "A TARGET holiday.")
+
+    def test_register_calendar(self):
+        register_calendar("TEST", lambda: SimpleCalendar([date(2015, 6, 1)]))
+        try:
+            self.assertIn("TEST", calendar_names())
+            self.assertTrue(get_calendar("TEST").is_holiday(date(2015, 6, 1)))
+        finally:
+            unregister_calendar("TEST")
+        self.assertNotIn("TEST", calendar_names())
+        self.assertRaises(ValueError, get_calendar, "UNKNOWN")
+
+if __name__ == "__main__":
+    unittest.main()
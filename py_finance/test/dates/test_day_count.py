@@ -0,0 +1,64 @@
+import unittest
+from datetime import date, timedelta
+import numpy as np
+from py_finance.dates.day_count import Actual360, Actual365Fixed, Thirty360, ActualActualIsda, ActualActualIcma, Business252
+from py_finance.dates.thirty_360_convention import Thirty360Convention
+from py_finance.dates.simple_calendar import SimpleCalendar
+
+class TestDayCount(unittest.TestCase):
+
+    def setUp(self):
+        self.starts = [date(2003, 10, 1) + timedelta(offset) for offset in range(0, 900, 7)]
+        self.ends = [start + timedelta(offset * 13 % 900 - 40) for offset, start in enumerate(self.starts)]
+
+    def assert_arrays_match(self, day_count):
+        expected = [day_count.year_fraction(start, end) for start, end in zip(self.starts, self.ends)]
+        actual = day_count.year_fractions(np.array(self.starts, dtype='datetime64[D]'), np.array(self.ends, dtype='datetime64[D]'))
+        for e, a in zip(expected, actual):
+            self.assertAlmostEqual(e, a, 12)
+
+    def test_actual(self):
+        self.assertAlmostEqual(181 / 360.0, Actual360().year_fraction(date(2015, 1, 1), date(2015, 7, 1)), 12)
+        self.assertAlmostEqual(181 / 365.0, Actual365Fixed().year_fraction(date(2015, 1, 1), date(2015, 7, 1)), 12)
+        self.assert_arrays_match(Actual360())
+        self.assert_arrays_match(Actual365Fixed())
+
+    def test_thirty_360(self):
+        self.assertEqual(60, Thirty360(Thirty360Convention.bond_basis).day_count(date(2015, 1, 31), date(2015, 3, 31)))
+        self.assertEqual(62, Thirty360(Thirty360Convention.bond_basis).day_count(date(2015, 1, 29), date(2015, 3, 31)), "The end is not moved.")
+        self.assertEqual(32, Thirty360(Thirty360Convention.european).day_count(date(2015, 2, 28), date(2015, 3, 31)))
+        self.assertEqual(30, Thirty360(Thirty360Convention.isda).day_count(date(2015, 2, 28), date(2015, 3, 31)))
+        self.assertEqual(28, Thirty360(Thirty360Convention.isda, date(2015, 2, 28)).day_count(date(2015, 1, 31), date(2015, 2, 28)), "February termination dates are not moved.")
+        for convention in Thirty360Convention:
+            self.assert_arrays_match(Thirty360(convention, date(2004, 2, 29)))
+
+    def test_actual_actual_isda(self):
+        self.assertAlmostEqual(0.497724380567, ActualActualIsda().year_fraction(date(2003, 11, 1), date(2004, 5, 1)), 12)
+        self.assertAlmostEqual(-0.497724380567, ActualActualIsda().year_fraction(date(2004, 5, 1), date(2003, 11, 1)), 12)
+        self.assert_arrays_match(ActualActualIsda())
+
+    def test_actual_actual_icma(self):
+        day_count = ActualActualIcma()
+        self.assertAlmostEqual(0.5, day_count.year_fraction(date(2003, 11, 1), date(2004, 5, 1), date(2003, 11, 1), date(2004, 5, 1)), 12)
+        self.assertAlmostEqual(0.410958904110, day_count.year_fraction(date(1999, 2, 1), date(1999, 7, 1), date(1998, 7, 1), date(1999, 7, 1)), 12)
+        self.assertAlmostEqual(0.915760869565, day_count.year_fraction(date(2002, 8, 15), date(2003, 7, 15), date(2003, 1, 15), date(2003, 7, 15)), 12)
+        reference_starts = np.array([date(2003, 11, 1), date(1998, 7, 1), date(2003, 1, 15)], dtype='datetime64[D]')
+        reference_ends = np.array([date(2004, 5, 1), date(1999, 7, 1), date(2003, 7, 15)], dtype='datetime64[D]')
+        starts = np.array([date(2003, 11, 1), date(1999, 2, 1), date(2002, 8, 15)], dtype='datetime64[D]')
+        actual = day_count.year_fractions(starts, reference_ends, reference_starts, reference_ends)
+        for e, a in zip([0.5, 0.410958904110, 0.915760869565], actual):
+            self.assertAlmostEqual(e, a, 12)
+        self.assert_arrays_match(day_count)
+
+    def test_business_252(self):
+        calendar = SimpleCalendar([date(2015, 1, 1), date(2015, 12, 25)])
+        self.assertAlmostEqual(21 / 252.0, Business252(calendar).year_fraction(date(2015, 1, 1), date(2015, 2, 1)), 12)
+        self.assert_arrays_match(Business252(calendar))
+        starts = np.array(self.starts[:120], dtype='datetime64[D]').reshape(12, 10)
+        ends = np.array(self.ends[:120], dtype='datetime64[D]').reshape(12, 10)
+        fractions = Business252(calendar).year_fractions(starts, ends)
+        self.assertEqual((12, 10), fractions.shape)
+        self.assertAlmostEqual(Business252(calendar).year_fraction(self.starts[13], self.ends[13]), fractions[1, 3], 12)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from datetime import date, timedelta
+from py_finance.dates import day_serial
+from py_finance.dates.calendar import Calendar
+
+class TestDaySerial(unittest.TestCase):
+    
+    def test_year_month_day(self):
+        for target_date in (date(1, 1, 1), date(1600, 2, 29), date(1900, 3, 1), date(2000, 2, 29), date(2000, 12, 31), date(2015, 3, 1), date(9999, 12, 31)):
+            ordinal = target_date.toordinal()
+            self.assertEqual((target_date.year, target_date.month, target_date.day), day_serial.year_month_day(ordinal))
+            self.assertEqual(ordinal, day_serial.from_year_month_day(target_date.year, target_date.month, target_date.day))
+            self.assertEqual(target_date.year, day_serial.year_of(ordinal))
+    
+    def test_weekday(self):
+        start = date(2014, 12, 1)
+        for offset in range(14):
+            target_date = start + timedelta(offset)
+            self.assertEqual(target_date.weekday(), day_serial.weekday(target_date.toordinal()))
+            self.assertEqual(Calendar.is_weekend(target_date), day_serial.is_weekend(target_date.toordinal()))
+    
+    def test_add_months(self):
+        start = date(2015, 1, 1)
+        for offset in range(0, 730, 3):
+            target_date = start + timedelta(offset)
+            for months in (-13, -1, 0, 1, 2, 12, 25):
+                for end_of_month in (False, True):
+                    expected = Calendar.add_months(target_date, months, end_of_month)
+                    self.assertEqual(expected.toordinal(), day_serial.add_months(target_date.toordinal(), months, end_of_month))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+from datetime import date
+from py_finance.dates.file_calendar import FileCalendar
+
+ICALENDAR = """BEGIN:VCALENDAR
+VERSION:2.0
+BEGIN:VEVENT
+SUMMARY:New Year's Day
+DTSTART;VALUE=DATE:20150101
+DTEND;VALUE=DATE:20150102
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Christmas and
+  Boxing Day
+DTSTART;VALUE=DATE:20151225
+DTEND;VALUE=DATE:20151229
+END:VEVENT
+END:VCALENDAR
+"""
+
+class TestFileCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, text, mode = "w"):
+        path = os.path.join(self.directory, name)
+        with open(path, mode) as holiday_file:
+            holiday_file.write(text)
+        return path
+
+    def test_csv(self):
+        path = self.write("exchange.csv", "Date,Name\n2015-12-25,Christmas\n2015-01-01,New Year\n\n# Comment\n2015-12-25,Christmas\n")
+        calendar = FileCalendar(path, date_column = "Date")
+        self.assertEqual("exchange", calendar.name)
+        self.assertTrue(calendar.is_holiday(date(2015, 12, 25)))
+        self.assertTrue(calendar.is_holiday_ordinal(date(2015, 1, 1).toordinal()))
+        self.assertFalse(calendar.is_holiday(date(2015, 12, 24)))
+        self.assertFalse(calendar.is_holiday(date(2016, 1, 1)), "A year without holidays.")
+        self.assertEqual([date(2015, 1, 1).toordinal(), date(2015, 12, 25).toordinal()], calendar.holidays(), "Sorted without duplicates.")
+
+    def test_csv_without_final_newline(self):
+        path = self.write("exchange.csv", "2015-12-25\n2016-01-1")
+        calendar = FileCalendar(path)
+        self.assertTrue(calendar.is_holiday(date(2016, 1, 1)), "The last row is read.")
+        self.write("exchange.csv", "5\n2016-12-26\n", "a")
+        self.assertTrue(calendar.reload())
+        self.assertFalse(calendar.is_holiday(date(2016, 1, 1)), "The row was only partly written.")
+        self.assertTrue(calendar.is_holiday(date(2016, 1, 15)))
+        self.assertTrue(calendar.is_holiday(date(2016, 12, 26)))
+
+    def test_csv_header_after_comment(self):
+        path = self.write("exchange.csv", "# Exchange holidays\n\nDate\n2015-12-25\n")
+        calendar = FileCalendar(path)
+        self.assertEqual([date(2015, 12, 25).toordinal()], calendar.holidays())
+
+    def test_reload_with_index(self):
+        path = self.write("exchange.csv", "2021-01-01\n")
+        calendar = FileCalendar(path)
+        calendar.build_index(2020, 2022)
+        self.assertTrue(calendar.is_business_day(date(2021, 3, 2)))
+        self.write("exchange.csv", "2021-03-02\n", "a")
+        self.assertTrue(calendar.reload())
+        self.assertEqual((2020, 2022), (calendar.index.year_from, calendar.index.year_to), "The index is rebuilt over the same years.")
+        self.assertFalse(calendar.is_business_day(date(2021, 3, 2)))
+        self.assertEqual(date(2021, 3, 3), calendar.adjust(date(2021, 3, 2)))
+        self.assertEqual(date(2021, 3, 1), calendar.add_business_days(date(2021, 2, 26), 1))
+        self.assertEqual(date(2021, 3, 3), calendar.add_business_days(date(2021, 3, 1), 1))
+        self.assertEqual([np.datetime64("2021-03-03")], list(calendar.adjust_many(np.array(["2021-03-02"], dtype = "datetime64[D]"))))
+
+    def test_icalendar(self):
+        calendar = FileCalendar(self.write("exchange.ics", ICALENDAR))
+        self.assertEqual([date(2015, 1, 1), date(2015, 12, 25), date(2015, 12, 26), date(2015, 12, 27), date(2015, 12, 28)],
+                         [date.fromordinal(ordinal) for ordinal in calendar.holidays()])
+
+    def test_reload(self):
+        path = self.write("exchange.csv", "2015-12-25\n")
+        calendar = FileCalendar(path)
+        self.assertFalse(calendar.reload(), "The file has not changed.")
+        self.write("exchange.csv", "2016-12-26\n", "a")
+        self.assertTrue(calendar.reload())
+        self.assertTrue(calendar.is_holiday(date(2015, 12, 25)))
+        self.assertTrue(calendar.is_holiday(date(2016, 12, 26)), "The appended row is read.")
+        self.write("exchange.csv", "2017-12-25\n")
+        self.assertTrue(calendar.reload())
+        self.assertFalse(calendar.is_holiday(date(2015, 12, 25)), "A rewritten file is read again.")
+        self.assertTrue(calendar.is_holiday(date(2017, 12, 25)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from datetime import date
+from py_finance.dates.calendar_month import JulianMonth
+from py_finance.dates.day_of_week import DayOfWeek
+from py_finance.dates.holiday_rules import compile_holiday_rules, observe, FixedDate, NthWeekday, LastWeekday, EasterOffset, WeekdaysAfter, OneOff
+from py_finance.dates.observance import Observance
+
+class TestHolidayRules(unittest.TestCase):
+
+    def test_observe(self):
+        # Saturday 4 July 2015
+        self.assertEqual(date(2015, 7, 4), observe(date(2015, 7, 4), Observance.none))
+        self.assertEqual(date(2015, 7, 6), observe(date(2015, 7, 4), Observance.following))
+        self.assertEqual(date(2015, 7, 3), observe(date(2015, 7, 4), Observance.nearest))
+        self.assertEqual(date(2015, 7, 4), observe(date(2015, 7, 4), Observance.sunday_to_monday))
+        # Sunday 5 July 2015
+        self.assertEqual(date(2015, 7, 6), observe(date(2015, 7, 5), Observance.sunday_to_monday))
+
+    def test_rules(self):
+        evaluator = compile_holiday_rules([
+            FixedDate("Christmas Day", JulianMonth.december, 25, Observance.following),
+            WeekdaysAfter("Boxing Day", "Christmas Day", 1),
+            NthWeekday("Martin Luther King's birthday", JulianMonth.january, 3, DayOfWeek.monday),
+            NthWeekday("Election Day", JulianMonth.november, 1, DayOfWeek.tuesday, True, years = (2016,)),
+            LastWeekday("Memorial Day", JulianMonth.may, DayOfWeek.monday, year_from = 2011),
+            EasterOffset("Good Friday", -2),
+            OneOff("Closure", [date(2012, 10, 29), date(2016, 1, 4)])
+        ])
+        self.assertEqual(sorted([date(2016, 12, 26), date(2016, 12, 27), date(2016, 1, 18), date(2016, 11, 8), date(2016, 5, 30), date(2016, 3, 25), date(2016, 1, 4)]), sorted(evaluator.holidays(2016)))
+        self.assertEqual(sorted([date(2010, 12, 27), date(2010, 12, 28), date(2010, 1, 18), date(2010, 4, 2)]), sorted(evaluator.holidays(2010)))
+        self.assertEqual(15, len(evaluator.holidays_between(2013, 2015)))
+
+    def test_invalid_reference(self):
+        self.assertRaises(ValueError, compile_holiday_rules, [WeekdaysAfter("Boxing Day", "Christmas Day", 1)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, timedelta
+from py_finance.dates.holiday_table import compile_holiday_table, open_holiday_table, close_holiday_table, HolidayTable, year_start
+from py_finance.dates.calendars.united_kingdom import UnitedKingdom
+from py_finance.dates.calendars.united_states import UnitedStatesSettlement
+
+class TestHolidayTable(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "holidays.bin")
+        compile_holiday_table(self.path, [UnitedKingdom(), UnitedStatesSettlement()], 2010, 2020)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_year_start(self):
+        for year in (1, 1900, 2000, 2015, 2016):
+            self.assertEqual(date(year, 1, 1).toordinal(), year_start(year))
+
+    def test_table(self):
+        table = HolidayTable(self.path)
+        self.assertEqual(["UK", "US-Settlement"], table.names())
+        self.assertEqual((2010, 2020), table.years("UK"))
+        self.assertTrue(table.covers("UK", 2020))
+        self.assertFalse(table.covers("UK", 2021))
+        self.assertFalse(table.covers("TARGET", 2015))
+        self.assertTrue(table.is_holiday("UK", date(2015, 12, 25)))
+        self.assertFalse(table.is_holiday("UK", date(2015, 12, 24)))
+        table.close()
+
+    def test_calendar(self):
+        generated = UnitedStatesSettlement()
+        mapped = UnitedStatesSettlement()
+        mapped.open_holiday_table(self.path)
+        # The range runs past the table, where the holidays are generated.
+        for offset in range(-10, 4400):
+            target_date = date(2010, 1, 1) + timedelta(offset)
+            self.assertEqual(generated.is_holiday(target_date), mapped.is_holiday(target_date), str(target_date))
+        self.assertEqual(generated.holiday_bits(2015), mapped.holiday_bits(2015))
+
+    def test_open_rewritten_table(self):
+        table = open_holiday_table(self.path)
+        self.assertIs(table, open_holiday_table(self.path), "An unchanged table is shared.")
+        compile_holiday_table(self.path, [UnitedKingdom()], 2000, 2030)
+        self.assertFalse(table.is_current())
+        rewritten = open_holiday_table(self.path)
+        self.assertEqual((2000, 2030), rewritten.years("UK"))
+        self.assertEqual((2010, 2020), table.years("UK"), "The old table can still be read.")
+        close_holiday_table(self.path)
+        self.assertIsNot(rewritten, open_holiday_table(self.path), "A closed table is opened again.")
+        close_holiday_table(self.path)
+
+    def test_failed_write(self):
+        calendar = UnitedKingdom()
+        calendar.name = "A calendar name longer than 32 characters"
+        with self.assertRaises(ValueError):
+            compile_holiday_table(self.path, [calendar], 2010, 2020)
+        self.assertEqual(["holidays.bin"], os.listdir(self.directory), "The temporary file is removed.")
+        self.assertEqual(["UK", "US-Settlement"], HolidayTable(self.path).names(), "The table is unchanged.")
+
+if __name__ == "__main__":
+    unittest.main()
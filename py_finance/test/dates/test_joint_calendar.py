@@ -0,0 +1,47 @@
+import unittest
+from datetime import date, timedelta
+from py_finance.dates.joint_calendar import JointCalendar
+from py_finance.dates.joint_calendar_rule import JointCalendarRule
+from py_finance.dates.simple_calendar import SimpleCalendar
+
+class TestJointCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.first = SimpleCalendar([date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 12, 25)])
+        self.second = SimpleCalendar([date(2015, 1, 1), date(2015, 5, 4), date(2015, 12, 25), date(2015, 12, 28)])
+
+    def test_join_holidays(self):
+        calendar = JointCalendar((self.first, self.second), JointCalendarRule.join_holidays)
+        self.assertTrue(calendar.is_holiday(date(2015, 1, 1)), "A holiday in both calendars.")
+        self.assertTrue(calendar.is_holiday(date(2015, 4, 3)), "A holiday in the first calendar.")
+        self.assertTrue(calendar.is_holiday(date(2015, 5, 4)), "A holiday in the second calendar.")
+        self.assertFalse(calendar.is_holiday(date(2015, 5, 5)), "A holiday in neither calendar.")
+
+    def test_join_business_days(self):
+        calendar = JointCalendar((self.first, self.second), JointCalendarRule.join_business_days)
+        self.assertTrue(calendar.is_holiday(date(2015, 1, 1)), "A holiday in both calendars.")
+        self.assertFalse(calendar.is_holiday(date(2015, 4, 3)), "A holiday in the first calendar only.")
+        self.assertFalse(calendar.is_holiday(date(2015, 5, 4)), "A holiday in the second calendar only.")
+        self.assertFalse(calendar.is_holiday(date(2016, 1, 1)), "Years without holidays.")
+
+    def test_matches_calendars(self):
+        for rule in JointCalendarRule:
+            calendar = JointCalendar((self.first, self.second), rule)
+            for offset in range(-5, 370):
+                target_date = date(2015, 1, 1) + timedelta(offset)
+                is_holidays = (self.first.is_holiday(target_date), self.second.is_holiday(target_date))
+                expected = any(is_holidays) if rule == JointCalendarRule.join_holidays else all(is_holidays)
+                self.assertEqual(expected, calendar.is_holiday(target_date))
+
+    def test_index(self):
+        walk = JointCalendar((self.first, self.second))
+        indexed = JointCalendar((self.first, self.second))
+        indexed.build_index(2015, 2015)
+        start = date(2015, 1, 1)
+        for offset in range(0, 365, 5):
+            end = start + timedelta(offset)
+            self.assertEqual(walk.business_day_count(start, end), indexed.business_day_count(start, end))
+            self.assertEqual(walk.add_business_days(end, 3), indexed.add_business_days(end, 3))
+
+if __name__ == "__main__":
+    unittest.main()
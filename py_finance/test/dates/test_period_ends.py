@@ -0,0 +1,40 @@
+import unittest
+from datetime import date
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.calendar import Calendar
+from py_finance.dates.day_of_week import DayOfWeek
+from py_finance.dates.simple_calendar import SimpleCalendar
+
+class TestPeriodEnds(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = SimpleCalendar((date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 12, 25), date(2015, 12, 31), date(2016, 1, 1)))
+        self.period_ends = self.calendar.period_ends()
+
+    def test_shared(self):
+        self.assertIs(self.period_ends, self.calendar.period_ends())
+
+    def test_month_ends(self):
+        for month in range(1, 13):
+            first = date(2015, month, 1)
+            last = Calendar.end_of_month(2015, month)
+            self.assertEqual(self.calendar.adjust(first, BusinessDayConvention.following), self.period_ends.first_business_day(2015, month))
+            self.assertEqual(self.calendar.adjust(last, BusinessDayConvention.preceding), self.period_ends.last_business_day(2015, month))
+        self.assertEqual(date(2015, 12, 30), self.period_ends.last_business_day(2015, 12), "31 December is a holiday.")
+        self.assertTrue(self.period_ends.is_last_business_day_of_month(date(2015, 1, 30)))
+        self.assertFalse(self.period_ends.is_last_business_day_of_month(date(2015, 1, 31)))
+
+    def test_ranges(self):
+        self.assertEqual([date(2015, 3, 31), date(2015, 6, 30), date(2015, 9, 30), date(2015, 12, 30)], self.period_ends.quarter_ends(date(2015, 1, 1), date(2016, 1, 1)))
+        self.assertEqual([date(2015, 12, 1), date(2016, 1, 4)], self.period_ends.first_business_days(date(2015, 11, 15), date(2016, 1, 15)))
+        self.assertEqual([date(2015, 11, 30), date(2015, 12, 30)], self.period_ends.last_business_days(date(2015, 11, 15), date(2016, 1, 15)))
+
+    def test_imm_dates(self):
+        expected = [Calendar.add_nth_day_of_week(date(2015, month, 1), 3, DayOfWeek.wednesday, False) for month in (3, 6, 9, 12)]
+        self.assertEqual(expected, self.period_ends.imm_dates(date(2015, 1, 1), date(2016, 1, 1)))
+        self.assertEqual(date(2015, 3, 18), self.period_ends.imm_date(2015, 3))
+        self.assertEqual(date(2015, 6, 17), self.period_ends.next_imm_date(date(2015, 3, 18)), "The next IMM date is after the date.")
+        self.assertEqual(date(2016, 3, 16), self.period_ends.next_imm_date(date(2015, 12, 20)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from datetime import date, timedelta
+import numpy as np
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.calendar_registry import get_calendar
+from py_finance.dates.holiday_table import compile_holiday_table
+from py_finance.dates.portfolio import generate_schedules
+from py_finance.dates.schedule import Schedule
+from py_finance.dates.time_unit import TimeUnit
+
+class TestPortfolio(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(7)
+        self.starts, self.ends, self.counts, self.units, self.names, self.conventions = [], [], [], [], [], []
+        for _ in range(60):
+            start = date(2010, 1, 1) + timedelta(generator.randint(0, 3000))
+            self.starts.append(start)
+            self.ends.append(start + timedelta(generator.randint(40, 2000)))
+            count, unit = generator.choice([(3, TimeUnit.months), (6, TimeUnit.months), (1, TimeUnit.years), (2, TimeUnit.weeks)])
+            self.counts.append(count)
+            self.units.append(unit)
+            self.names.append(generator.choice(["UK", "TARGET", "US-NYSE", "UK+TARGET"]))
+            self.conventions.append(generator.choice([BusinessDayConvention.following, BusinessDayConvention.modified_following]))
+
+    def assert_schedules_match(self, result):
+        offsets, unadjusted, adjusted = result
+        for k in range(len(self.starts)):
+            schedule = Schedule(get_calendar(self.names[k]), self.starts[k], self.ends[k], self.counts[k], self.units[k],
+                                self.conventions[k], self.conventions[k])
+            expected = [(u, a) for u, a in schedule]
+            actual = [(u.astype(object), a.astype(object)) for u, a in zip(unadjusted[offsets[k]:offsets[k + 1]], adjusted[offsets[k]:offsets[k + 1]])]
+            self.assertEqual(expected, actual, "Trade {0} should match its schedule.".format(k))
+
+    def test_in_process(self):
+        result = generate_schedules(
+            np.array(self.starts, dtype='datetime64[D]'), np.array(self.ends, dtype='datetime64[D]'),
+            self.counts, self.units, self.names, self.conventions, max_workers = 1, chunk_size = 25)
+        self.assert_schedules_match(result)
+
+    def test_array_columns(self):
+        result = generate_schedules(
+            np.array(self.starts, dtype='datetime64[D]'), np.array(self.ends, dtype='datetime64[D]'),
+            np.array(self.counts), np.array(self.units, dtype=object), self.names, np.array(self.conventions, dtype=object),
+            max_workers = 1)
+        self.assert_schedules_match(result)
+
+    def test_process_pool(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "holidays.bin")
+            compile_holiday_table(path, [get_calendar(name) for name in ("UK", "TARGET", "US-NYSE")], 2005, 2025)
+            result = generate_schedules(
+                np.array(self.starts, dtype='datetime64[D]'), np.array(self.ends, dtype='datetime64[D]'),
+                self.counts, self.units, self.names, self.conventions, holiday_table = path, max_workers = 2, chunk_size = 16)
+            self.assert_schedules_match(result)
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == "__main__":
+    unittest.main()
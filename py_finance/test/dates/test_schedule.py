@@ -0,0 +1,61 @@
+import unittest
+from datetime import date, timedelta
+import numpy as np
+from py_finance.dates.schedule import Schedule
+from py_finance.dates.simple_calendar import SimpleCalendar
+from py_finance.dates.business_day_convention import BusinessDayConvention
+from py_finance.dates.date_generation import DateGeneration
+from py_finance.dates.time_unit import TimeUnit
+
+HOLIDAYS = (date(2015, 1, 1), date(2015, 4, 3), date(2015, 4, 6), date(2015, 5, 1), date(2015, 8, 31), date(2015, 12, 25), date(2015, 12, 28), date(2016, 1, 1))
+
+class TestSchedule(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = SimpleCalendar(HOLIDAYS)
+
+    def test_backward(self):
+        schedule = Schedule(self.calendar, date(2015, 1, 15), date(2016, 3, 15), 6, TimeUnit.months)
+        self.assertEqual([
+            (date(2015, 1, 15), date(2015, 1, 15)),
+            (date(2015, 3, 15), date(2015, 3, 16)),
+            (date(2015, 9, 15), date(2015, 9, 15)),
+            (date(2016, 3, 15), date(2016, 3, 15))], list(schedule), "The stub should be at the start.")
+
+    def test_forward(self):
+        schedule = Schedule(self.calendar, date(2015, 1, 15), date(2016, 3, 15), 6, TimeUnit.months, rule = DateGeneration.forward)
+        self.assertEqual([
+            (date(2015, 1, 15), date(2015, 1, 15)),
+            (date(2015, 7, 15), date(2015, 7, 15)),
+            (date(2016, 1, 15), date(2016, 1, 15)),
+            (date(2016, 3, 15), date(2016, 3, 15))], list(schedule), "The stub should be at the end.")
+
+    def test_end_of_month(self):
+        schedule = Schedule(self.calendar, date(2015, 2, 28), date(2015, 8, 31), 2, TimeUnit.months, BusinessDayConvention.modified_following, BusinessDayConvention.modified_following, True, DateGeneration.forward)
+        self.assertEqual([date(2015, 2, 28), date(2015, 4, 30), date(2015, 6, 30), date(2015, 8, 31)], [unadjusted for unadjusted, _ in schedule])
+        self.assertEqual([date(2015, 2, 27), date(2015, 4, 30), date(2015, 6, 30), date(2015, 8, 28)], [adjusted for _, adjusted in schedule])
+
+    def test_daily(self):
+        # Saturday 2 and Sunday 3 January 2016 adjust to the termination date.
+        schedule = Schedule(self.calendar, date(2015, 12, 23), date(2016, 1, 4), 1, TimeUnit.days, rule = DateGeneration.forward)
+        adjusted = [adjusted for _, adjusted in schedule]
+        self.assertEqual([date(2015, 12, 23), date(2015, 12, 24), date(2015, 12, 29), date(2015, 12, 30), date(2015, 12, 31), date(2016, 1, 4)], adjusted)
+        self.assertEqual((date(2016, 1, 4), date(2016, 1, 4)), list(schedule)[-1], "The termination date should be kept.")
+
+    def test_generate_many(self):
+        effective = [date(2014, 11, 30) + timedelta(offset) for offset in range(0, 200, 3)]
+        termination = [value + timedelta(days) for value, days in zip(effective, range(5, 2000, 29))]
+        for unit, count in ((TimeUnit.days, 1), (TimeUnit.weeks, 2), (TimeUnit.months, 3), (TimeUnit.years, 1)):
+            for rule in DateGeneration:
+                offsets, unadjusted, adjusted = Schedule.generate_many(
+                    self.calendar,
+                    np.array(effective, dtype='datetime64[D]'),
+                    np.array(termination, dtype='datetime64[D]'),
+                    count, unit, BusinessDayConvention.modified_following, BusinessDayConvention.following, True, rule)
+                for k in range(len(effective)):
+                    expected = list(Schedule(self.calendar, effective[k], termination[k], count, unit, BusinessDayConvention.modified_following, BusinessDayConvention.following, True, rule))
+                    actual = list(zip(unadjusted[offsets[k]:offsets[k + 1]].tolist(), adjusted[offsets[k]:offsets[k + 1]].tolist()))
+                    self.assertEqual(expected, actual)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from datetime import date, datetime, time, timedelta
+from py_finance.dates.calendars.united_states import UnitedStatesNyseSessions
+from py_finance.dates.simple_calendar import SimpleCalendar
+from py_finance.dates.trading_session_calendar import TradingSessionCalendar
+
+class TestTradingSessionCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.sessions = UnitedStatesNyseSessions()
+
+    def test_is_open(self):
+        self.assertTrue(self.sessions.is_open(datetime(2018, 11, 21, 9, 30)))
+        self.assertTrue(self.sessions.is_open(datetime(2018, 11, 21, 15, 59, 59, 999999)))
+        self.assertFalse(self.sessions.is_open(datetime(2018, 11, 21, 9, 29, 59)))
+        self.assertFalse(self.sessions.is_open(datetime(2018, 11, 21, 16)))
+        self.assertFalse(self.sessions.is_open(datetime(2018, 11, 22, 12)), "Thanksgiving is a holiday.")
+        self.assertFalse(self.sessions.is_open(datetime(2018, 11, 24, 12)), "A Saturday.")
+
+    def test_early_closes(self):
+        self.assertTrue(self.sessions.is_early_close(date(2018, 11, 23)))
+        self.assertTrue(self.sessions.is_open(datetime(2018, 11, 23, 12, 59)))
+        self.assertFalse(self.sessions.is_open(datetime(2018, 11, 23, 13)))
+        self.assertTrue(self.sessions.is_early_close(date(2018, 12, 24)))
+        self.assertTrue(self.sessions.is_early_close(date(2019, 7, 3)))
+        self.assertFalse(self.sessions.is_early_close(date(2015, 7, 3)), "Independence Day is observed on the Friday.")
+        self.assertFalse(self.sessions.is_early_close(date(2018, 11, 26)))
+
+    def test_next_open_and_close(self):
+        self.assertEqual(datetime(2019, 1, 2, 9, 30), self.sessions.next_open(datetime(2018, 12, 31, 17)))
+        self.assertEqual(datetime(2018, 11, 26, 9, 30), self.sessions.next_open(datetime(2018, 11, 23, 9, 30)))
+        self.assertEqual(datetime(2018, 12, 24, 13), self.sessions.next_close(datetime(2018, 12, 24, 9)))
+        self.assertEqual(30.0, self.sessions.seconds_to_close(datetime(2018, 12, 31, 15, 59, 30)))
+        self.assertIsNone(self.sessions.seconds_to_close(datetime(2018, 12, 31, 16)))
+
+    def test_trading_seconds_between(self):
+        self.assertEqual(3.5 * 3600 + 2 * 6.5 * 3600, self.sessions.trading_seconds_between(datetime(2018, 12, 24), datetime(2018, 12, 28)))
+        self.assertEqual(3599.5 + 1800, self.sessions.trading_seconds_between(datetime(2018, 12, 31, 15, 0, 0, 500000), datetime(2019, 1, 2, 10)))
+        self.assertEqual(-1800, self.sessions.trading_seconds_between(datetime(2019, 1, 2, 10), datetime(2019, 1, 2, 9)))
+        self.assertEqual(0, self.sessions.trading_seconds_between(datetime(2019, 1, 2, 16), datetime(2019, 1, 3, 9, 30)))
+
+    def test_against_half_hours(self):
+        calendar = SimpleCalendar((date(2015, 1, 1), date(2015, 1, 6)))
+        sessions = TradingSessionCalendar(calendar, time(8), time(17))
+        start = datetime(2014, 12, 31, 12, 30)
+        open_half_hours = 0
+        for i in range(1, 8 * 48):
+            if sessions.is_open(start + timedelta(minutes = 30 * (i - 1))):
+                open_half_hours += 1
+            self.assertEqual(open_half_hours * 1800, sessions.trading_seconds_between(start, start + timedelta(minutes = 30 * i)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,62 @@
+import threading
+import time
 import unittest
+from datetime import date
+from py_finance.dates.yearly_calendar import YearlyCalendar
+
+class CountingCalendar(YearlyCalendar):
+
+    def __init__(self, max_years = None):
+        YearlyCalendar.__init__(self, "Counting", max_years)
+        self.fetched = []
+
+    def fetch_holidays(self, year):
+        self.fetched.append(year)
+        time.sleep(0.01)
+        # New Year's Day observed on the last day of the previous year.
+        return [date(year - 1, 12, 31), date(year, 7, 4)]
 
 class TestYearlyCalendar(unittest.TestCase):
 
     def testName(self):
         pass
 
+    def test_neighbouring_years(self):
+        calendar = CountingCalendar()
+        self.assertTrue(calendar.is_holiday(date(2015, 12, 31)), "Observed in the year before it is fetched for.")
+        self.assertTrue(calendar.is_holiday(date(2015, 7, 4)))
+        self.assertFalse(calendar.is_holiday(date(2015, 7, 5)))
+
+    def test_single_flight(self):
+        calendar = CountingCalendar()
+        threads = [threading.Thread(target=calendar.is_holiday, args=(date(2015, 7, 4),)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([2014, 2015, 2016], sorted(calendar.fetched), "The year should be generated once.")
+        statistics = calendar.cache_statistics()
+        self.assertEqual(1, statistics.misses)
+        self.assertEqual(7, statistics.hits)
+
+    def test_fetched_once(self):
+        calendar = CountingCalendar()
+        calendar.prefetch(2010, 2019)
+        self.assertEqual(list(range(2009, 2021)), calendar.fetched, "Each year should be fetched once.")
+        self.assertTrue(calendar.is_holiday(date(2019, 12, 31)))
+
+    def test_bounded(self):
+        calendar = CountingCalendar(max_years = 2)
+        calendar.prefetch(2013, 2014)
+        calendar.is_holiday(date(2013, 1, 1))
+        calendar.is_holiday(date(2015, 1, 1))
+        self.assertEqual([2013, 2015], calendar.cache_statistics().cached_years, "The least recently used year should be discarded.")
+        self.assertEqual(3, calendar.cache_statistics().misses)
+
+    def test_holiday_bits(self):
+        calendar = CountingCalendar()
+        self.assertEqual((1 << 184) | (1 << 364), calendar.holiday_bits(2015))
 
 if __name__ == "__main__":
     #import sys;sys.argv = ['', 'Test.testName']
-    unittest.main()
\ No newline at end of file
+    unittest.main()